@@ -23,8 +23,9 @@ You must generate a JSON object with 2 lists:
 
 ### TONE GUIDELINES
 - Use the 'Tone' specified in the Brief.
-- Be punchy, use active verbs (Get, Buy, Discover).
+- Be punchy, use active verbs (Get, Shop, Discover).
 - NO fluff. Every character costs money.
+- **NO CLICKBAIT:** Never write "click here", "buy now" or "best " (Google Ads policy; such assets are rejected).
 - **LANGUAGE:** Write ALL headlines and descriptions in **ENGLISH**, even if the website or brief contains foreign text.
 
 ### OUTPUT FORMAT
@@ -35,13 +36,14 @@ Return strict JSON:
 }
 """
 
-def get_copywriter_agent(model_name="gemini-2.5-flash"):
+def get_copywriter_agent(model_name="gemini-2.5-flash", model=None):
     """
     Initializes and returns the Copywriter Agent.
     Uses Gemini 2.5 Flash for optimal speed and creative adherence.
+    `model` overrides model_name with a prebuilt BaseLlm (e.g. an offline stub).
     """
     return LlmAgent(
         name="copywriter_agent",
-        model=Gemini(model=model_name),
+        model=model or Gemini(model=model_name),
         instruction=COPYWRITER_INSTRUCTION,
     )
@@ -7,11 +7,13 @@ from ad_genius_capstone.tools.scraper_tool import scrape_website
 # Persona: Marketing Analyst (The Brain).
 # Goal: Scrape data and formulate a strategic brief.
 
-STRATEGIST_INSTRUCTION = """
+STRATEGIST_PERSONA = """
 You are 'The Strategist', a world-class Marketing Analyst for Google Ads.
 Your goal is to extract key marketing insights from a client's website to build a high-performing ad campaign.
 
-### TOOLS & PROTOCOL
+"""
+
+STRATEGIST_TOOL_PROTOCOL = """### TOOLS & PROTOCOL
 1.  **First Step:** ALWAYS call `scrape_website(url)` with the user's URL.
 2.  **Fallback Protocol (CRITICAL):** 
     - If `scrape_website` returns a string starting with "ERROR_NEED_HUMAN_HELP", you MUST STOP thinking and immediately output the following message EXACTLY:
@@ -19,7 +21,9 @@ Your goal is to extract key marketing insights from a client's website to build
     - Do NOT attempt to hallucinate or guess the content.
 3.  **PDF Handling:** If the user provides input starting with "PDF_CONTENT_FROM_USER:", treat this text as the valid website source.
 
-### ANALYSIS GOALS
+"""
+
+STRATEGIST_ANALYSIS = """### ANALYSIS GOALS
 Once you have the content (from scraper or PDF), analyze it to generate a structured BRIEF:
 1.  **Unique Selling Proposition (USP):** What makes this product/service special? (Max 2 sentences)
 2.  **Target Audience:** Who are we talking to?
@@ -40,13 +44,38 @@ Return the result as a strictly formatted JSON object:
 }
 """
 
-def get_strategist_agent(model_name="gemini-2.5-flash"):
+STRATEGIST_INSTRUCTION = STRATEGIST_PERSONA + STRATEGIST_TOOL_PROTOCOL + STRATEGIST_ANALYSIS
+
+# Pre-fetched mode: the orchestrator already scraped the page, so the agent
+# analyzes the supplied text directly (no tool declaration, no extra tool turn).
+STRATEGIST_CONTENT_PROTOCOL = """### INPUT PROTOCOL
+The website has already been fetched for you. The user message starts with
+"WEBSITE_CONTENT_FROM_SCRAPER:" or "PDF_CONTENT_FROM_USER:" followed by the page text.
+Treat this text as the valid website source. Do NOT ask for a URL or attempt to fetch anything.
+
+"""
+
+STRATEGIST_CONTENT_INSTRUCTION = (
+    STRATEGIST_PERSONA + STRATEGIST_CONTENT_PROTOCOL + STRATEGIST_ANALYSIS
+)
+
+def get_strategist_agent(model_name="gemini-2.5-flash", use_scraper_tool=True, model=None):
     """
-    Initializes the Strategist Agent with scraping capabilities.
+    Initializes the Strategist Agent.
+    With use_scraper_tool=True the agent fetches the URL itself via scrape_website;
+    with False it expects pre-fetched page text in the prompt (see STRATEGIST_CONTENT_PROTOCOL).
+    `model` overrides model_name with a prebuilt BaseLlm (e.g. an offline stub).
     """
+    if not use_scraper_tool:
+        return LlmAgent(
+            name="strategist_agent",
+            model=model or Gemini(model=model_name),
+            instruction=STRATEGIST_CONTENT_INSTRUCTION,
+        )
+
     return LlmAgent(
         name="strategist_agent",
-        model=Gemini(model=model_name),
+        model=model or Gemini(model=model_name),
         instruction=STRATEGIST_INSTRUCTION,
         tools=[FunctionTool(scrape_website)],
     )
@@ -16,16 +16,17 @@ You are 'The Compliance Officer'. Your job is to ensure Google Ads assets meet t
 3.  **Analyze the Tool Output:**
     -   If status is **"REJECTED"**: Return a response starting with "FIX_REQUEST:" followed by the specific feedback from the tool.
     -   If status is **"APPROVED"**: Return exactly: "FINAL_SUCCESS".
-4.  Ensure compliance with Google Ads Editorial Policies (No CAPS, no '!', unique assets).
+4.  Ensure compliance with Google Ads Editorial Policies (No CAPS, no '!', unique assets, no clickbait such as "click here", "buy now" or "best ").
 """
 
-def get_validator_agent(model_name="gemini-2.5-flash"):
+def get_validator_agent(model_name="gemini-2.5-flash", model=None):
     """
     Initializes the Validator Agent equipped with the validation tool.
+    `model` overrides model_name with a prebuilt BaseLlm (e.g. an offline stub).
     """
     return LlmAgent(
         name="validator_agent",
-        model=Gemini(model=model_name),
+        model=model or Gemini(model=model_name),
         instruction=VALIDATOR_INSTRUCTION,
         tools=[FunctionTool(validate_ad_assets)],
     )
@@ -0,0 +1,92 @@
+"""
+Micro-benchmark for JSON extraction from LLM responses.
+
+Runs the legacy regex extractor and the brace-anchored decoder
+(core.json_extract) over a corpus of realistic model outputs and reports
+success rate and time per call.
+
+Usage:
+    python -m ad_genius_capstone.benchmarks.bench_json_extract --repeat 2000
+"""
+import re
+import json
+import time
+import argparse
+
+from ad_genius_capstone.core.json_extract import find_json_object, BRIEF_KEYS, DRAFT_KEYS
+
+BRIEF = {
+    "usp": "Handmade leather shoes {built to last} with a lifetime warranty.",
+    "audience": "Professionals aged 30-55",
+    "tone": "Professional",
+    "keywords": ["leather shoes", "handmade shoes", "men's dress shoes"],
+}
+DRAFT = {
+    "headlines": [f"Handmade Shoe Offer {i}" for i in range(15)],
+    "descriptions": [f"Crafted by hand in Portugal. Free returns on every order {i}." for i in range(4)],
+}
+
+
+def build_corpus() -> list:
+    """(label, response_text, expected_keys, expected_object) tuples."""
+    brief = json.dumps(BRIEF, indent=2)
+    draft = json.dumps(DRAFT, indent=2)
+    chatter = "Sure! I analyzed the page carefully. " * 40
+    return [
+        ("bare brief", brief, BRIEF_KEYS, BRIEF),
+        ("fenced brief", f"```json\n{brief}\n```", BRIEF_KEYS, BRIEF),
+        ("fenced no tag", f"Here you go:\n```\n{draft}\n```\nLet me know!", DRAFT_KEYS, DRAFT),
+        ("chatty prefix+suffix", f"{chatter}\n{draft}\nHope this helps {{:}}", DRAFT_KEYS, DRAFT),
+        ("stray brace in prose", f"Use the {{brand}} voice. Also {{ note.\n{brief}", BRIEF_KEYS, BRIEF),
+        ("two objects", f"Brief was {brief}\nDraft:\n{draft}", DRAFT_KEYS, DRAFT),
+        ("example then answer", 'Format: {"headlines": "..."}\n```json\n' + draft + "\n```", DRAFT_KEYS, DRAFT),
+        ("long chatty output", chatter * 10 + draft + chatter * 10, DRAFT_KEYS, DRAFT),
+    ]
+
+
+def legacy_extract(text: str):
+    """The extractor main.py shipped with (regex based)."""
+    try:
+        match = re.search(r"``````", text, re.DOTALL)
+        if match:
+            return json.loads(match.group(1).strip())
+        match_raw = re.search(r"(\{.*\})", text, re.DOTALL)
+        if match_raw:
+            return json.loads(match_raw.group(1))
+        return json.loads(text)
+    except Exception:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args(argv)
+    corpus = build_corpus()
+
+    print(f"{'case':<24} {'legacy':>8} {'new':>8} {'legacy us':>10} {'new us':>10}")
+    totals = {"legacy": 0, "new": 0}
+    for label, text, keys, expected in corpus:
+        extractors = {
+            "legacy": lambda: legacy_extract(text),
+            "new": lambda: find_json_object(text, keys),
+        }
+        row = {}
+        for name, fn in extractors.items():
+            ok = fn() == expected
+            totals[name] += ok
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                fn()
+            per_call = (time.perf_counter() - started) / args.repeat * 1e6
+            row[name] = ("ok" if ok else "FAIL", per_call)
+        print(
+            f"{label:<24} {row['legacy'][0]:>8} {row['new'][0]:>8} "
+            f"{row['legacy'][1]:>10.1f} {row['new'][1]:>10.1f}"
+        )
+
+    print(f"\nParsed correctly: legacy {totals['legacy']}/{len(corpus)}, new {totals['new']}/{len(corpus)}")
+
+
+if __name__ == "__main__":
+    main()
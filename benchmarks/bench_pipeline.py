@@ -0,0 +1,181 @@
+"""
+Offline end-to-end pipeline benchmark.
+
+Runs run_batch against a local fixture server (landing pages, 403s and
+CAPTCHA-sized pages) with StubGemini behind every agent and a
+FakeReasoningEngine as the cloud Strategist. No network or credentials
+are needed. Reports throughput, p50/p99 latency per phase, retries per
+campaign and the cloud -> local failover rate.
+
+Usage:
+    python -m ad_genius_capstone.benchmarks.bench_pipeline --campaigns 200 --concurrency 20
+"""
+import os
+import sys
+import time
+import random
+import asyncio
+import logging
+import argparse
+import tempfile
+import warnings
+
+# Cached responses would hide scraper cost between runs, and every fixture
+# shares one host, so per-domain politeness would serialize the whole batch
+os.environ.setdefault("ADGENIUS_HTTP_CACHE", "0")
+os.environ.setdefault("ADGENIUS_SCRAPE_DOMAIN_INTERVAL", "0")
+os.environ.setdefault("ADGENIUS_CRAWL_DOMAIN_INTERVAL", "0")
+os.environ.setdefault("ADGENIUS_SCRAPE_DOMAIN_CONCURRENCY", "64")
+
+from ad_genius_capstone import main as pipeline
+from ad_genius_capstone.core import telemetry
+from ad_genius_capstone.core.scheduler import ModelLimits
+from ad_genius_capstone.benchmarks.fixture_server import FixtureServer
+from ad_genius_capstone.benchmarks.stub_model import StubGemini, FakeReasoningEngine, StubStats
+
+PHASES = ["scrape", "strategist", "copywriter", "validation"]
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def fixture_urls(server: FixtureServer, count: int, blocked_rate: float, captcha_rate: float, seed: int) -> list:
+    rng = random.Random(seed)
+    urls = []
+    for n in range(count):
+        roll = rng.random()
+        if roll < blocked_rate:
+            urls.append(server.url("blocked", n))
+        elif roll < blocked_rate + captcha_rate:
+            urls.append(server.url("captcha", n))
+        else:
+            urls.append(server.url("site", n))
+    return urls
+
+
+def print_report(results: list, elapsed: float, stats: StubStats):
+    count = len(results)
+    print(f"\n=== Offline Pipeline Benchmark: {count} campaigns ===")
+    print(f"Wall time    {elapsed:8.2f}s   throughput {count / elapsed:8.2f} campaigns/s")
+
+    statuses = {}
+    for r in results:
+        statuses[r["status"]] = statuses.get(r["status"], 0) + 1
+    print("Statuses     " + ", ".join(f"{s}: {n}" for s, n in sorted(statuses.items())))
+
+    print(f"\n{'phase':<12} {'n':>6} {'p50 ms':>10} {'p99 ms':>10}")
+    rows = [(phase, [r["phases"][phase] for r in results if phase in r["phases"]]) for phase in PHASES]
+    rows.append(("end-to-end", [r["duration"] for r in results]))
+    for phase, values in rows:
+        print(
+            f"{phase:<12} {len(values):>6} {percentile(values, 50) * 1000:>10.1f}"
+            f" {percentile(values, 99) * 1000:>10.1f}"
+        )
+
+    validated = [r for r in results if r["attempts"]]
+    retries = [r["attempts"] - 1 for r in validated]
+    if retries:
+        print(
+            f"\nRetries      mean {sum(retries) / len(retries):.2f} per campaign, "
+            f"max {max(retries)} ({sum(1 for n in retries if n)} of {len(retries)} needed a fix)"
+        )
+
+    dispatched = [r for r in results if r.get("strategist_source") in ("cloud", "local")]
+    if dispatched:
+        failovers = sum(1 for r in dispatched if r["strategist_source"] == "local")
+        print(f"Failover     {failovers}/{len(dispatched)} briefs from the Local Strategist ({failovers / len(dispatched):.1%})")
+
+    calls = ", ".join(
+        f"{role}: {n}" + (f" ({stats.failures[role]} failed)" if stats.failures.get(role) else "")
+        for role, n in sorted(stats.calls.items())
+    )
+    print(f"Model calls  {calls}")
+
+
+async def run(args) -> int:
+    stats = StubStats()
+    model = StubGemini(
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        bad_draft_rate=args.bad_draft_rate,
+        seed=args.seed,
+        stats=stats,
+    )
+    pipeline.configure_scheduler({model.model: ModelLimits(rpm=args.rpm, tpm=args.tpm)})
+    pipeline.set_remote_strategist(
+        FakeReasoningEngine(
+            latency=args.cloud_latency,
+            failure_rate=args.cloud_failure_rate,
+            seed=args.seed,
+            stats=stats,
+        )
+    )
+    options = pipeline.CampaignOptions(
+        local_validation=args.local_validation,
+        use_brief_cache=False,
+        hedge_delay=args.hedge_after,
+        stream_copywriter=args.stream_copywriter,
+        targeted_repair=args.targeted_repair,
+        copywriter_fanout=args.fanout,
+        crawl=args.crawl,
+    )
+
+    with tempfile.TemporaryDirectory() as out_dir, FixtureServer() as server:
+        pipeline.configure_results_sink(os.path.join(out_dir, "results.csv"))
+        if args.journal:
+            pipeline.configure_journal(os.path.join(out_dir, "journal.sqlite3"))
+        urls = fixture_urls(server, args.campaigns, args.blocked_rate, args.captcha_rate, args.seed)
+        agents = pipeline.build_agents(model=model)
+
+        telemetry.configure(args.trace_file, args.metrics_file)
+        started = time.monotonic()
+        results = await pipeline.run_batch(urls, args.concurrency, options, agents=agents)
+        elapsed = time.monotonic() - started
+        pipeline.close_results_sink()
+        pipeline.close_journal()
+        telemetry.shutdown()
+
+    print_report(results, elapsed, stats)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--campaigns", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=pipeline.DEFAULT_BATCH_CONCURRENCY)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean stub model latency (s).")
+    parser.add_argument("--cloud-latency", type=float, default=0.2, help="Mean fake Reasoning Engine latency (s).")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Injected model failure probability.")
+    parser.add_argument("--cloud-failure-rate", type=float, default=0.1, help="Injected cloud failure probability.")
+    parser.add_argument("--bad-draft-rate", type=float, default=0.3, help="Probability a draft breaks policy.")
+    parser.add_argument("--blocked-rate", type=float, default=0.05, help="Share of URLs answering 403.")
+    parser.add_argument("--captcha-rate", type=float, default=0.05, help="Share of URLs serving a CAPTCHA page.")
+    parser.add_argument("--rpm", type=float, help="Scheduler requests/minute for the stub model.")
+    parser.add_argument("--tpm", type=float, help="Scheduler tokens/minute for the stub model.")
+    parser.add_argument("--hedge-after", type=float, default=1.0, help="Hedge delay for the Local Strategist (s).")
+    parser.add_argument("--local-validation", action="store_true")
+    parser.add_argument("--stream-copywriter", action="store_true")
+    parser.add_argument("--targeted-repair", action="store_true")
+    parser.add_argument("--fanout", type=int, default=1, help="Concurrent Copywriter drafts per campaign.")
+    parser.add_argument("--crawl", action="store_true", help="Crawl each fixture site's subpages.")
+    parser.add_argument("--journal", action="store_true", help="Checkpoint campaigns to a SQLite journal.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--trace-file", help="Enable telemetry and write JSONL spans here.")
+    parser.add_argument("--metrics-file", help="Enable telemetry and write Prometheus metrics here.")
+    parser.add_argument("--verbose", action="store_true", help="Keep the pipeline's INFO logs.")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.CRITICAL)
+        warnings.simplefilter("ignore")
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
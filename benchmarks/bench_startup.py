@@ -0,0 +1,83 @@
+"""
+CLI startup benchmark based on `python -X importtime`.
+
+Imports the orchestrator in a fresh interpreter, reports the total import time
+and the slowest modules, and fails (exit code 1) when a module that must stay
+lazy is imported eagerly or the time budget is exceeded.
+
+Usage:
+    python -m ad_genius_capstone.benchmarks.bench_startup --budget-ms 500
+"""
+import sys
+import argparse
+import subprocess
+
+# Modules that must only load inside the code paths that need them
+LAZY_MODULES = [
+    "pandas",
+    "google.cloud.aiplatform",
+    "vertexai",
+    "google.adk",
+    "google.genai",
+    "pypdf",
+    "bs4",
+]
+
+
+def measure_imports(target: str) -> dict:
+    """Returns {module: cumulative_microseconds} for one cold import of `target`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", default="ad_genius_capstone.main")
+    parser.add_argument("--budget-ms", type=float, default=500.0)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    runs = [measure_imports(args.target) for _ in range(args.runs)]
+    totals = sorted(run.get(args.target, 0) / 1000 for run in runs)
+    best = totals[0]
+    print(f"Import of {args.target}: best {best:.1f} ms, median {totals[len(totals) // 2]:.1f} ms")
+
+    print("\nSlowest top-level contributors (cumulative, best run):")
+    fastest = min(runs, key=lambda run: run.get(args.target, 0))
+    top = sorted(
+        ((us, name) for name, us in fastest.items() if "." not in name or name.startswith("ad_genius_capstone")),
+        reverse=True,
+    )[:10]
+    for us, name in top:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    eager = sorted(
+        lazy
+        for lazy in LAZY_MODULES
+        if any(name == lazy or name.startswith(lazy + ".") for name in fastest)
+    )
+    failed = False
+    if eager:
+        print(f"\nFAIL: heavy modules imported at startup: {', '.join(eager)}")
+        failed = True
+    if best > args.budget_ms:
+        print(f"\nFAIL: startup {best:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print(f"\nOK: no heavy modules imported, within {args.budget_ms:.0f} ms budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Throughput benchmark for ad asset validation.
+
+Compares the per-asset Python path (check_headline / check_description, as
+used by validate_ad_assets) against the column-wise validate_many engine
+(pandas .str accessors) on a synthetic asset library.
+
+Usage:
+    python -m ad_genius_capstone.benchmarks.bench_validator --assets 200000
+"""
+import time
+import random
+import argparse
+
+from ad_genius_capstone.tools.ad_validator_tool import (
+    check_headline,
+    check_description,
+    validate_many,
+)
+
+WORDS = [
+    "fast", "free", "shipping", "best", "shoes", "buy", "now", "save", "today",
+    "premium", "quality", "official", "store", "click", "here", "deals", "NEW",
+    "trusted", "by", "10k", "customers", "get", "yours", "discover", "more",
+]
+
+
+def synthetic_assets(count: int, max_words: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    assets = []
+    for _ in range(count):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, max_words)))
+        roll = rng.random()
+        if roll < 0.05:
+            text = text.upper()
+        elif roll < 0.10:
+            text += "!!"
+        assets.append(text.capitalize() if roll > 0.5 else text)
+    return assets
+
+
+def timed(label: str, count: int, fn):
+    started = time.perf_counter()
+    violations = fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed:8.3f}s  {count / elapsed:12,.0f} assets/s  {violations:,} violations")
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    headlines = synthetic_assets(args.assets, max_words=6)
+    descriptions = synthetic_assets(args.assets // 4, max_words=18)
+    total = len(headlines) + len(descriptions)
+    print(f"Validating {len(headlines):,} headlines + {len(descriptions):,} descriptions\n")
+
+    def python_path():
+        found = 0
+        for i, h in enumerate(headlines):
+            found += len(check_headline(i, h))
+        for i, d in enumerate(descriptions):
+            found += len(check_description(i, d))
+        return found
+
+    def bulk_path():
+        found = 0
+        for frame in (
+            validate_many(headlines, "headline"),
+            validate_many(descriptions, "description"),
+        ):
+            found += int(frame["violations"].str.len().sum())
+        return found
+
+    validate_many(headlines[:10])  # Warm-up: keep pandas import time out of the measurement
+    baseline = timed("per-asset python (messages)", total, python_path)
+    bulk = timed("validate_many (pandas .str)", total, bulk_path)
+    print(f"\nSpeedup: {baseline / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Local HTTP server with fixture pages for offline pipeline benchmarks.
+
+Routes:
+    /site/<n>     200, a product landing page (unique copy per n)
+    /site/<n>/<page>  200, its pricing/features/about pages (same nav and footer)
+    /members/<n>  200, a members page that /robots.txt disallows
+    /captcha/<n>  200, a tiny challenge page (trips the <500 char CAPTCHA check)
+    /blocked/<n>  403
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LANDING_PAGE = """<!DOCTYPE html>
+<html><head><title>Stride Outfitters {n}</title>
+<meta name="description" content="Lightweight running shoes and trail gear, shipped fast.">
+<script>window.analytics = {{}};</script></head>
+<body>
+<nav><a href="/site/{n}">Home</a> <a href="/site/{n}/pricing">Pricing</a>
+<a href="/site/{n}/features">Features</a> <a href="/site/{n}/about">About us</a>
+<a href="/members/{n}">Members</a> <a href="/site/{n}/login">Log in</a></nav>
+<div class="promo">Free shipping on orders over $50. Sign up for our newsletter.</div>
+<main>
+<h1>Run further with Stride {n}</h1>
+<p>Stride Outfitters designs lightweight running shoes from recycled fabric.
+Every pair is tested on 500 km of trail before it reaches our store.</p>
+<h2>Why runners choose us</h2>
+<ul><li>Free returns for 60 days</li><li>Carbon-neutral delivery in 48 hours</li>
+<li>Personal fit guide with every order</li></ul>
+<p>{filler}</p>
+</main>
+<footer>Copyright Stride Outfitters. All rights reserved.</footer>
+</body></html>
+"""
+
+SUBPAGE = """<!DOCTYPE html>
+<html><head><title>{title} | Stride Outfitters {n}</title></head>
+<body>
+<nav><a href="/site/{n}">Home</a> <a href="/site/{n}/pricing">Pricing</a>
+<a href="/site/{n}/features">Features</a> <a href="/site/{n}/about">About us</a></nav>
+<div class="promo">Free shipping on orders over $50. Sign up for our newsletter.</div>
+<main>
+<h1>{title}</h1>
+<p>{body}</p>
+<p>{filler}</p>
+</main>
+<footer>Copyright Stride Outfitters. All rights reserved.</footer>
+</body></html>
+"""
+
+SUBPAGES = {
+    "pricing": ("Pricing", "Trail shoes from $89. Members save 15% on every second pair."),
+    "features": ("Features", "Recycled mesh upper, carbon-plated sole and a 500 km durability promise."),
+    "about": ("About us", "Founded by ultrarunners in 2015, we repair every shoe we sell."),
+}
+
+ROBOTS_TXT = "User-agent: *\nDisallow: /members\n"
+
+CAPTCHA_PAGE = "<html><body><p>Checking your browser...</p></body></html>"
+
+FILLER = "Our community of 20,000 runners shares routes, reviews and training plans. "
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        kind, n = parts[0], (parts[1] if len(parts) > 1 else "0")
+
+        if kind == "site" and len(parts) > 2 and parts[2] in SUBPAGES:
+            title, body = SUBPAGES[parts[2]]
+            self._send(200, SUBPAGE.format(n=n, title=title, body=body, filler=FILLER * 3))
+        elif kind == "site":
+            self._send(200, LANDING_PAGE.format(n=n, filler=FILLER * (4 + int(n) % 5)))
+        elif kind == "members":
+            self._send(200, SUBPAGE.format(n=n, title="Members", body="Member-only area.", filler=FILLER * 3))
+        elif kind == "robots.txt":
+            self._send(200, ROBOTS_TXT, "text/plain")
+        elif kind == "captcha":
+            self._send(200, CAPTCHA_PAGE)
+        elif kind == "blocked":
+            self._send(403, "<html><body>Forbidden</body></html>")
+        else:
+            self._send(404, "<html><body>Not found</body></html>")
+
+    def _send(self, status: int, body: str, content_type: str = "text/html"):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output readable
+
+
+class FixtureServer:
+    """
+    Serves FixtureHandler on 127.0.0.1 (random free port) in a daemon thread.
+    Use as a context manager; `url(kind, n)` builds fixture URLs.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), FixtureHandler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, kind: str, n: int) -> str:
+        return f"{self.base_url}/{kind}/{n}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
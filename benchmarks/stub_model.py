@@ -0,0 +1,231 @@
+"""
+Deterministic offline stand-ins for Gemini and the Vertex AI Reasoning Engine.
+
+StubGemini is an ADK BaseLlm, so it plugs straight into the agent factories
+(get_strategist_agent(model=...), build_agents(model=...)). It recognizes the
+agent it serves from the system instruction and answers like the real one,
+including the scrape_website / validate_ad_assets tool calls, with
+configurable latency, injected failures and a rate of non-compliant drafts.
+"""
+import re
+import json
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from typing import AsyncGenerator
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from ad_genius_capstone.core.json_extract import find_json_object
+
+KEYWORDS = ["running shoes", "trail gear", "free returns", "eco fabric", "fast delivery", "fit guide"]
+HEADLINE_WORDS = ["Light", "Durable", "Comfy", "Trusted", "Certified", "Modern", "Smart", "Classic"]
+DESCRIPTION_TEMPLATE = "Discover {kw} made for everyday comfort. Order online with free returns."
+
+URL_PATTERN = re.compile(r"Analyze this URL: (\S+)")
+
+
+class StubModelError(RuntimeError):
+    """Injected model failure (stands in for a 429/503 from the API)."""
+
+
+class StubStats:
+    """Thread-safe call counters shared by a stub model and the fake engine."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = {}
+        self.failures = {}
+        self._seen = {}
+
+    def occurrence(self, key) -> int:
+        """How often `key` was seen before; repeated prompts get fresh randomness."""
+        with self._lock:
+            count = self._seen.get(key, 0)
+            self._seen[key] = count + 1
+            return count
+
+    def record(self, role: str, failed: bool = False):
+        with self._lock:
+            self.calls[role] = self.calls.get(role, 0) + 1
+            if failed:
+                self.failures[role] = self.failures.get(role, 0) + 1
+
+
+def _rng(seed: int, *parts) -> random.Random:
+    """Per-request generator, so results do not depend on task scheduling order."""
+    digest = hashlib.sha256(repr((seed,) + parts).encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def stub_brief(source: str) -> dict:
+    digest = int(hashlib.sha256(source.encode("utf-8")).hexdigest(), 16)
+    keywords = [KEYWORDS[(digest + i) % len(KEYWORDS)] for i in range(5)]
+    return {
+        "usp": f"Hand-picked {keywords[0]} with {keywords[1]}.",
+        "audience": "Active adults shopping online",
+        "tone": "Friendly",
+        "keywords": keywords,
+    }
+
+
+def stub_draft(rng: random.Random, bad: bool) -> dict:
+    headlines = [f"{HEADLINE_WORDS[i % len(HEADLINE_WORDS)]} {KEYWORDS[i % len(KEYWORDS)]} {i + 1}" for i in range(15)]
+    descriptions = [DESCRIPTION_TEMPLATE.format(kw=KEYWORDS[i]) for i in range(4)]
+    if bad:
+        # Typical model slips: shouting, exclamation marks, an overlong description
+        headlines[rng.randrange(15)] = "FREE SHIPPING TODAY"
+        headlines[rng.randrange(15)] = "Order now!"
+        descriptions[rng.randrange(4)] = DESCRIPTION_TEMPLATE.format(kw="premium " * 8)
+    return {"headlines": headlines, "descriptions": descriptions}
+
+
+class StubGemini(BaseLlm):
+    """
+    Offline BaseLlm answering as the Strategist, Copywriter or Validator.
+
+    latency: mean seconds per call (+/- `jitter` fraction, uniform).
+    failure_rate: probability a call raises StubModelError.
+    bad_draft_rate: probability a Copywriter draft breaks the ad policies.
+    """
+
+    model: str = "stub-gemini"
+    latency: float = 0.05
+    jitter: float = 0.5
+    failure_rate: float = 0.0
+    bad_draft_rate: float = 0.3
+    seed: int = 7
+    stats: StubStats = None
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    def model_post_init(self, __context):
+        if self.stats is None:
+            self.stats = StubStats()
+
+    @staticmethod
+    def _role(llm_request) -> str:
+        instruction = str(getattr(llm_request.config, "system_instruction", "") or "")
+        if "The Copywriter" in instruction:
+            return "copywriter"
+        if "Compliance Officer" in instruction:
+            return "validator"
+        return "strategist"
+
+    async def generate_content_async(
+        self, llm_request, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        role = self._role(llm_request)
+        last_parts = llm_request.contents[-1].parts if llm_request.contents else []
+        prompt = "".join(part.text or "" for part in last_parts)
+        tool_result = next(
+            (part.function_response for part in last_parts if part.function_response), None
+        )
+        key = (role, prompt, str(tool_result.response) if tool_result else "")
+        rng = _rng(self.seed, *key, self.stats.occurrence(key))
+
+        await asyncio.sleep(max(0.0, self.latency * (1 + self.jitter * (2 * rng.random() - 1))))
+        failed = rng.random() < self.failure_rate
+        self.stats.record(role, failed)
+        if failed:
+            raise StubModelError(f"503 UNAVAILABLE: injected {role} failure")
+
+        call = None
+        if role == "strategist":
+            text, call = self._strategist(llm_request, prompt, tool_result)
+        elif role == "copywriter":
+            text = self._copywriter(rng, prompt)
+        else:
+            text, call = self._validator(prompt, tool_result)
+
+        usage = types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=len(prompt) // 4,
+            candidates_token_count=len(text) // 4,
+            total_token_count=(len(prompt) + len(text)) // 4,
+        )
+        if call is not None:
+            part = types.Part(function_call=types.FunctionCall(name=call[0], args=call[1]))
+            yield LlmResponse(content=types.Content(role="model", parts=[part]), usage_metadata=usage)
+            return
+
+        if stream:
+            for i in range(0, len(text), 64):
+                chunk = types.Part(text=text[i : i + 64])
+                yield LlmResponse(content=types.Content(role="model", parts=[chunk]), partial=True)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            usage_metadata=usage,
+        )
+
+    def _strategist(self, llm_request, prompt: str, tool_result):
+        if tool_result is not None:
+            scraped = str((tool_result.response or {}).get("result", ""))
+            if scraped.startswith("ERROR_NEED_HUMAN_HELP"):
+                return (
+                    "CAPTCHA_DETECTED: The website is blocking automated access. "
+                    "Please upload a PDF of the homepage to continue.",
+                    None,
+                )
+            return json.dumps(stub_brief(scraped)), None
+        match = URL_PATTERN.search(prompt)
+        if match and "scrape_website" in (llm_request.tools_dict or {}):
+            return "", ("scrape_website", {"url": match.group(1)})
+        return json.dumps(stub_brief(prompt)), None
+
+    def _copywriter(self, rng: random.Random, prompt: str) -> str:
+        if "Rewrite ONLY the assets" in prompt:
+            repairs = {"headlines": {}, "descriptions": {}}
+            for kind, number in re.findall(r"^(Headline|Description) (\d+):", prompt, re.M):
+                key = kind.lower() + "s"
+                fixed = (
+                    f"Fresh pick {number}" if kind == "Headline"
+                    else DESCRIPTION_TEMPLATE.format(kw=KEYWORDS[int(number) % len(KEYWORDS)])
+                )
+                repairs[key][number] = fixed
+            return json.dumps(repairs)
+        draft = stub_draft(rng, rng.random() < self.bad_draft_rate)
+        return f"```json\n{json.dumps(draft, indent=2)}\n```"
+
+    def _validator(self, prompt: str, tool_result):
+        if tool_result is not None:
+            verdict = tool_result.response or {}
+            if verdict.get("status") == "APPROVED":
+                return "FINAL_SUCCESS", None
+            return f"FIX_REQUEST: {verdict.get('feedback', '')}", None
+        draft = find_json_object(prompt, ("headlines",)) or {}
+        args = {
+            "headlines": draft.get("headlines") or [],
+            "descriptions": draft.get("descriptions") or [],
+        }
+        return "", ("validate_ad_assets", args)
+
+
+class FakeReasoningEngine:
+    """
+    Stand-in for vertexai ReasoningEngine: query(input=...) blocks for
+    `latency` seconds and returns a brief, or fails at `failure_rate`.
+    Inputs carrying a scraper error get an error reply, as the deployed agent
+    cannot analyze a page it never received.
+    """
+
+    def __init__(self, latency: float = 0.2, jitter: float = 0.5, failure_rate: float = 0.0, seed: int = 7, stats: StubStats = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.seed = seed
+        self.stats = stats or StubStats()
+
+    def query(self, input: str):
+        rng = _rng(self.seed, "cloud", input, self.stats.occurrence(("cloud", input)))
+        time.sleep(max(0.0, self.latency * (1 + self.jitter * (2 * rng.random() - 1))))
+        failed = rng.random() < self.failure_rate
+        self.stats.record("cloud", failed)
+        if failed:
+            raise StubModelError("503 UNAVAILABLE: injected cloud failure")
+        if "ERROR_NEED_HUMAN_HELP" in input:
+            return {"output": "Error: no website content to analyze."}
+        return {"output": json.dumps(stub_brief(input))}
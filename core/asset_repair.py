@@ -0,0 +1,149 @@
+import re
+import json
+
+from ad_genius_capstone.tools.ad_validator_tool import (
+    HEADLINE_COUNT,
+    DESCRIPTION_COUNT,
+    check_headline,
+    check_description,
+    check_counts,
+    format_violation,
+)
+
+# Feedback lines reference assets as "Headline #3" / "Description #1" (1-based)
+ASSET_REF_PATTERN = re.compile(r"\b(Headline|Description) #(\d+)")
+
+
+def duplicate_headline_indices(headlines: list) -> set:
+    """0-based indices of headlines repeating an earlier one (the first copy stays)."""
+    seen = set()
+    duplicates = set()
+    for i, h in enumerate(headlines):
+        if h in seen:
+            duplicates.add(i)
+        seen.add(h)
+    return duplicates
+
+
+def failing_asset_indices(draft: dict, feedback: str):
+    """
+    Maps validator feedback back onto the draft.
+    Returns (headline_indices, description_indices) as 0-based sets; the
+    index-less "Duplicate headlines" message is resolved against the draft.
+    Indices past the end of a short draft name missing slots to fill.
+    """
+    headlines = draft.get("headlines") or []
+    descriptions = draft.get("descriptions") or []
+    failing = {"Headline": set(), "Description": set()}
+
+    for kind, number in ASSET_REF_PATTERN.findall(feedback or ""):
+        failing[kind].add(int(number) - 1)
+
+    if "Duplicate headlines" in (feedback or "") or "duplicates an earlier" in (feedback or ""):
+        failing["Headline"] |= duplicate_headline_indices(headlines)
+
+    return (
+        {i for i in failing["Headline"] if 0 <= i < max(len(headlines), HEADLINE_COUNT)},
+        {i for i in failing["Description"] if 0 <= i < max(len(descriptions), DESCRIPTION_COUNT)},
+    )
+
+
+def build_repair_prompt(brief: dict, draft: dict, headline_idx: set, description_idx: set) -> str:
+    """
+    Asks the Copywriter to rewrite only the failing assets (and to write the
+    missing ones of a short draft). Valid headlines are listed so the
+    rewrites stay unique against them.
+    """
+    headlines = draft.get("headlines") or []
+    descriptions = draft.get("descriptions") or []
+    keep = [h for i, h in enumerate(headlines) if i not in headline_idx]
+
+    lines = [
+        f"Here is the brief: {json.dumps(brief)}",
+        "",
+        "Most of the ad draft is already approved. Rewrite ONLY the assets listed below.",
+        "Rules: headlines MAX 30 characters, no '!', no ALL CAPS; "
+        "descriptions MAX 90 characters, no repeated punctuation, no ALL CAPS; "
+        "no clickbait phrases such as 'click here', 'buy now' or 'best'.",
+        f"New headlines must not repeat any of these approved headlines: {json.dumps(keep)}",
+        "",
+    ]
+    for i in sorted(headline_idx):
+        current = json.dumps(headlines[i]) if i < len(headlines) else "(missing, write a new one)"
+        lines.append(f"Headline {i+1}: {current}")
+    for i in sorted(description_idx):
+        current = json.dumps(descriptions[i]) if i < len(descriptions) else "(missing, write a new one)"
+        lines.append(f"Description {i+1}: {current}")
+    lines += [
+        "",
+        "Return strict JSON keyed by the asset numbers above, e.g.:",
+        '{"headlines": {"3": "New headline"}, "descriptions": {"1": "New description"}}',
+    ]
+    return "\n".join(lines)
+
+
+def merge_repairs(draft: dict, repairs: dict, headline_idx: set, description_idx: set):
+    """
+    Applies rewritten assets to a copy of the draft. Only indices that were
+    requested are accepted; a plain list reply is matched to them in order.
+    Assets for slots past the end of the draft are appended in slot order.
+    Returns (merged_draft, changed_headlines, changed_descriptions), where
+    the changed indices are positions in the merged draft.
+    """
+    merged = {
+        **draft,
+        "headlines": list(draft.get("headlines") or []),
+        "descriptions": list(draft.get("descriptions") or []),
+    }
+    changed = {"headlines": set(), "descriptions": set()}
+
+    for key, allowed in (("headlines", headline_idx), ("descriptions", description_idx)):
+        rewrites = (repairs or {}).get(key) or {}
+        if isinstance(rewrites, list):
+            rewrites = {i + 1: text for i, text in zip(sorted(allowed), rewrites)}
+        accepted = {}
+        for number, text in rewrites.items():
+            try:
+                index = int(number) - 1
+            except (TypeError, ValueError):
+                continue
+            if index in allowed and isinstance(text, str) and text.strip():
+                accepted[index] = text.strip()
+
+        assets = merged[key]
+        existing = len(assets)
+        for index in sorted(accepted):
+            if index < existing:
+                assets[index] = accepted[index]
+                changed[key].add(index)
+            else:
+                assets.append(accepted[index])
+                changed[key].add(len(assets) - 1)
+
+    return merged, changed["headlines"], changed["descriptions"]
+
+
+def revalidate_changed(draft: dict, changed_headlines: set, changed_descriptions: set):
+    """
+    Re-checks only the repaired assets plus the cross-asset rules (duplicates,
+    asset counts). Pass the requested indices, so assets the model skipped
+    still fail; skipped missing slots are reported by the count check.
+    Returns a Validator Agent style verdict string.
+    """
+    headlines = draft["headlines"]
+    descriptions = draft["descriptions"]
+    errors = []
+
+    for i in sorted(changed_headlines):
+        if i < len(headlines):
+            errors.extend(check_headline(i, headlines[i]))
+    for i in sorted(changed_descriptions):
+        if i < len(descriptions):
+            errors.extend(check_description(i, descriptions[i]))
+    for i in sorted(duplicate_headline_indices(headlines)):
+        errors.append(format_violation("H_DUPLICATE", i, headlines[i]))
+    errors.extend(check_counts(headlines, descriptions))
+
+    if errors:
+        return "FIX_REQUEST: Policy Violations Detected:\n" + "\n".join(errors)
+    return "FINAL_SUCCESS"
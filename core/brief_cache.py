@@ -0,0 +1,49 @@
+import os
+import time
+import hashlib
+import unicodedata
+
+from ad_genius_capstone.core.json_store import LruJsonStore
+
+# --- CACHE CONFIGURATION ---
+DEFAULT_CACHE_DIR = os.path.join(".adgenius_cache", "briefs")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # Briefs are small; 64 MB holds ~100k entries
+
+
+def normalize_source_text(text: str) -> str:
+    """
+    Canonical form of scraped/PDF text for hashing: NFC, collapsed whitespace.
+    Cosmetic whitespace changes on a page must not invalidate its brief.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def brief_cache_key(source_text: str, instruction: str, model_name: str) -> str:
+    """
+    Content address of a brief. Any change to the source text, the Strategist
+    instruction or the model produces a different key.
+    """
+    digest = hashlib.sha256()
+    for part in (normalize_source_text(source_text), instruction, model_name):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class BriefCache:
+    """
+    Persistent, content-addressed store of Strategist briefs.
+    One JSON file per key; least-recently-used files are evicted once the
+    directory grows past `max_bytes`.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._store = LruJsonStore(directory, max_bytes, name="Brief cache")
+
+    def get(self, key: str):
+        """Returns the cached brief dict for `key`, or None on a miss."""
+        entry = self._store.get(key)
+        return entry.get("brief") if entry else None
+
+    def put(self, key: str, brief: dict, model_name: str = ""):
+        self._store.put(key, {"brief": brief, "model": model_name, "created_at": time.time()})
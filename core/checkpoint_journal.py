@@ -0,0 +1,296 @@
+import os
+import json
+import time
+import uuid
+import queue
+import socket
+import sqlite3
+import hashlib
+import logging
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+
+logger = logging.getLogger("AdGenius_Core")
+
+# --- JOURNAL CONFIGURATION ---
+DEFAULT_JOURNAL_PATH = os.path.join(".adgenius_cache", "journal.sqlite3")
+FLUSH_INTERVAL = 0.5  # Seconds of progress a hard crash can lose
+FLUSH_EVENTS = 200  # Events committed per transaction at most
+LEASE_SECONDS = 60.0  # A campaign whose owner stops renewing this long may be resumed elsewhere
+
+# Event kinds, in pipeline order
+SCRAPED = "scraped"
+BRIEF = "brief"
+DRAFT = "draft"
+VERDICT = "verdict"
+FINISHED = "finished"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS campaigns (
+    campaign_id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    status TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    owner TEXT,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS campaigns_url ON campaigns (url, updated_at);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    campaign_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    attempt INTEGER,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_campaign ON events (campaign_id, id);
+"""
+
+_STOP = object()
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class Checkpoint:
+    """Last completed phase outputs of an unfinished campaign."""
+
+    campaign_id: str
+    url: str
+    phase: str
+    updated_at: float
+    scraped_sha256: str = None
+    brief: dict = None
+    draft: dict = None
+    attempt: int = 0  # Validation attempt `draft` belongs to (1-based)
+    verdict: str = None  # Verdict on `draft`, if it was validated
+
+
+class CheckpointJournal:
+    """
+    SQLite journal of every campaign's phase outputs: scraped text hash,
+    brief, each draft and each validation verdict. A campaign without a
+    `finished` event crashed or was killed, and resume_point() returns what
+    it had completed.
+
+    record() only enqueues: a writer thread commits events in batches
+    (FLUSH_EVENTS or every FLUSH_INTERVAL seconds), so journaling never
+    blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_JOURNAL_PATH,
+        flush_interval: float = FLUSH_INTERVAL,
+        flush_events: int = FLUSH_EVENTS,
+        lease_seconds: float = LEASE_SECONDS,
+    ):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.flush_events = max(1, flush_events)
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._active = set()  # Campaigns this instance runs and has not finished
+        self._claim_lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(campaigns)")}
+            with conn:
+                # Journals created before leases were added
+                if "owner" not in columns:
+                    conn.execute("ALTER TABLE campaigns ADD COLUMN owner TEXT")
+                if "lease_until" not in columns:
+                    conn.execute("ALTER TABLE campaigns ADD COLUMN lease_until REAL")
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="adgenius-journal", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # --- WRITES (non-blocking) ---
+
+    def start(self, campaign_id: str, url: str):
+        with self._claim_lock:
+            self._active.add(campaign_id)
+        self._queue.put(("start", campaign_id, url, time.time()))
+
+    def record(self, campaign_id: str, kind: str, payload: dict, attempt: int = None):
+        self._queue.put(("event", campaign_id, kind, attempt, json.dumps(payload, ensure_ascii=False), time.time()))
+
+    def finish(self, campaign_id: str, status: str, error: str = ""):
+        self._queue.put(("finish", campaign_id, status, json.dumps({"status": status, "error": error}), time.time()))
+
+    def release(self, campaign_id: str):
+        """Gives up an unfinished campaign (e.g. after a crash) so it can be resumed."""
+        self._queue.put(("release", campaign_id, time.time()))
+
+    def flush(self, timeout: float = None):
+        """Blocks until everything queued so far is committed (not for the event loop)."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        """Commits pending events and stops the writer."""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+
+    def _write_loop(self):
+        conn = self._connect()
+        heartbeat = self.lease_seconds / 3
+        next_renewal = time.monotonic() + heartbeat
+        try:
+            while True:
+                try:
+                    batch = [self._queue.get(timeout=max(0.0, next_renewal - time.monotonic()))]
+                except queue.Empty:
+                    batch = []
+                if time.monotonic() >= next_renewal:
+                    self._renew_leases(conn)
+                    next_renewal = time.monotonic() + heartbeat
+                if not batch:
+                    continue
+                deadline = time.monotonic() + self.flush_interval
+                # A flush request or stop marker ends the batch early
+                while len(batch) < self.flush_events and isinstance(batch[-1], tuple):
+                    try:
+                        batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                    except queue.Empty:
+                        break
+                try:
+                    with conn:
+                        for item in batch:
+                            if isinstance(item, tuple):
+                                self._apply(conn, item)
+                except sqlite3.Error as e:
+                    logger.error(f"Journal write failed ({e}); {len(batch)} event(s) lost.")
+                # Only committed finishes/releases make a campaign claimable again
+                done = {item[1] for item in batch if isinstance(item, tuple) and item[0] in ("finish", "release")}
+                if done:
+                    with self._claim_lock:
+                        self._active -= done
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                if batch[-1] is _STOP:
+                    return
+        finally:
+            conn.close()
+
+    def _renew_leases(self, conn: sqlite3.Connection):
+        """Heartbeat: extends the lease of every campaign still running here."""
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE campaigns SET lease_until = ? WHERE owner = ? AND status IS NULL",
+                    (time.time() + self.lease_seconds, self.owner),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Journal lease renewal failed ({e}).")
+
+    def _apply(self, conn: sqlite3.Connection, item: tuple):
+        op, campaign_id = item[0], item[1]
+        if op == "start":
+            _, _, url, now = item
+            conn.execute(
+                "INSERT OR IGNORE INTO campaigns "
+                "(campaign_id, url, phase, status, created_at, updated_at, owner, lease_until) "
+                "VALUES (?, ?, 'started', NULL, ?, ?, ?, ?)",
+                (campaign_id, url, now, now, self.owner, now + self.lease_seconds),
+            )
+        elif op == "event":
+            _, _, kind, attempt, payload, now = item
+            conn.execute(
+                "INSERT INTO events (campaign_id, kind, attempt, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+                (campaign_id, kind, attempt, payload, now),
+            )
+            conn.execute(
+                "UPDATE campaigns SET phase = ?, updated_at = ? WHERE campaign_id = ?",
+                (kind, now, campaign_id),
+            )
+        elif op == "finish":
+            _, _, status, payload, now = item
+            conn.execute(
+                "INSERT INTO events (campaign_id, kind, attempt, payload, created_at) VALUES (?, ?, NULL, ?, ?)",
+                (campaign_id, FINISHED, payload, now),
+            )
+            conn.execute(
+                "UPDATE campaigns SET phase = ?, status = ?, updated_at = ?, owner = NULL "
+                "WHERE campaign_id = ?",
+                (FINISHED, status, now, campaign_id),
+            )
+        elif op == "release":
+            conn.execute(
+                "UPDATE campaigns SET owner = NULL, lease_until = NULL WHERE campaign_id = ? AND owner = ?",
+                (campaign_id, self.owner),
+            )
+
+    # --- READS ---
+
+    def claim(self, url: str):
+        """
+        Takes over the most recent unfinished campaign for `url` that no live
+        run owns (released, lease expired, or left by a crash in this process)
+        and returns it as a Checkpoint, or None. The claim is a single
+        conditional UPDATE, so two processes never resume the same campaign.
+        """
+        with self._claim_lock, closing(self._connect()) as conn:
+            now = time.time()
+            active = sorted(self._active)
+            with conn:
+                row = conn.execute(
+                    "UPDATE campaigns SET owner = ?, lease_until = ? WHERE campaign_id = ("
+                    "SELECT campaign_id FROM campaigns WHERE url = ? AND status IS NULL "
+                    "AND (owner IS NULL OR owner = ? OR lease_until < ?) "
+                    f"AND campaign_id NOT IN ({', '.join('?' * len(active))}) "
+                    "ORDER BY updated_at DESC LIMIT 1) "
+                    "RETURNING campaign_id, url, phase, updated_at",
+                    (self.owner, now + self.lease_seconds, url, self.owner, now, *active),
+                ).fetchone()
+            if row is None:
+                return None
+            checkpoint = Checkpoint(*row)
+            self._active.add(checkpoint.campaign_id)
+            events = conn.execute(
+                "SELECT kind, attempt, payload FROM events WHERE campaign_id = ? ORDER BY id",
+                (checkpoint.campaign_id,),
+            ).fetchall()
+
+        for kind, attempt, payload in events:
+            data = json.loads(payload)
+            if kind == SCRAPED:
+                checkpoint.scraped_sha256 = data.get("sha256")
+            elif kind == BRIEF:
+                checkpoint.brief = data.get("brief")
+            elif kind == DRAFT:
+                checkpoint.draft, checkpoint.attempt, checkpoint.verdict = data.get("draft"), attempt, None
+            elif kind == VERDICT and attempt == checkpoint.attempt:
+                checkpoint.verdict = data.get("verdict")
+        return checkpoint
+
+    def incomplete(self, limit: int = None) -> list:
+        """
+        Unfinished campaigns no live run owns, newest first, as
+        (campaign_id, url, phase, updated_at).
+        """
+        sql = (
+            "SELECT campaign_id, url, phase, updated_at FROM campaigns "
+            "WHERE status IS NULL AND (owner IS NULL OR lease_until < ?) ORDER BY updated_at DESC"
+        )
+        with closing(self._connect()) as conn:
+            if limit is not None:
+                return conn.execute(f"{sql} LIMIT ?", (time.time(), limit)).fetchall()
+            return conn.execute(sql, (time.time(),)).fetchall()
@@ -0,0 +1,64 @@
+from ad_genius_capstone.tools.ad_validator_tool import (
+    HEADLINE_COUNT,
+    DESCRIPTION_COUNT,
+    check_headline,
+    check_description,
+)
+
+
+def _asset_key(text: str) -> str:
+    """Assets differing only in case or spacing count as duplicates."""
+    return " ".join(text.split()).casefold()
+
+
+def _pick(drafts: list, key: str, check, count: int):
+    """
+    Collects up to `count` unique assets from `drafts` (in draft order).
+    Returns (valid, spare_invalid); invalid assets are only kept as padding.
+    """
+    seen = set()
+    valid = []
+    invalid = []
+    for draft in drafts:
+        for text in draft.get(key) or []:
+            if not isinstance(text, str) or not text.strip():
+                continue
+            text = text.strip()
+            asset_key = _asset_key(text)
+            if asset_key in seen:
+                continue
+            seen.add(asset_key)
+            # Index 0 is a placeholder: only the pass/fail result matters here
+            (invalid if check(0, text) else valid).append(text)
+            if len(valid) == count:
+                return valid, invalid
+    return valid, invalid
+
+
+def assemble_draft(
+    drafts: list,
+    headline_count: int = HEADLINE_COUNT,
+    description_count: int = DESCRIPTION_COUNT,
+):
+    """
+    Builds one draft from the valid, unique assets of several Copywriter drafts.
+
+    When the pool is short, the remaining slots are padded with failing
+    candidates so the repair loop can rewrite exactly those assets; slots
+    nothing can pad are left out, and validation reports them as missing.
+    Returns (draft, shortfall) where shortfall counts the padded/missing
+    slots; draft is None when no usable draft was given.
+    """
+    drafts = [d for d in drafts if isinstance(d, dict)]
+    if not drafts:
+        return None, headline_count + description_count
+
+    headlines, spare_headlines = _pick(drafts, "headlines", check_headline, headline_count)
+    descriptions, spare_descriptions = _pick(
+        drafts, "descriptions", check_description, description_count
+    )
+    shortfall = (headline_count - len(headlines)) + (description_count - len(descriptions))
+
+    headlines += spare_headlines[: headline_count - len(headlines)]
+    descriptions += spare_descriptions[: description_count - len(descriptions)]
+    return {"headlines": headlines, "descriptions": descriptions}, shortfall
@@ -0,0 +1,212 @@
+import time
+import uuid
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+logger = logging.getLogger("AdGenius_Core")
+
+# --- JOB QUEUE CONFIGURATION ---
+DEFAULT_JOB_WORKERS = 5
+DEFAULT_QUEUE_SIZE = 100
+JOB_HISTORY = 1000  # Finished jobs kept for status queries
+PDF_WAIT_TTL = 24 * 60 * 60  # Seconds a job waits for its PDF before it fails
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+WAITING_FOR_PDF = "waiting_for_pdf"
+DONE = "done"
+FAILED = "failed"
+FINISHED_STATES = (DONE, FAILED)
+
+
+class QueueFull(Exception):
+    """Raised when a job cannot be queued because the backlog is at capacity."""
+
+
+class InvalidJobState(Exception):
+    """Raised when an operation does not apply to the job's current state."""
+
+
+@dataclass
+class Job:
+    """One campaign request and, once finished, its run_campaign result."""
+
+    url: str
+    pdf_path: str = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    state: str = QUEUED
+    runs: int = 0
+    result: dict = None
+    error: str = ""
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    def set_state(self, state: str):
+        self.state = state
+        self.updated_at = time.time()
+
+    def to_dict(self, include_result: bool = True) -> dict:
+        data = {
+            "id": self.id,
+            "url": self.url,
+            "state": self.state,
+            "status": self.result["status"] if self.result else None,
+            "runs": self.runs,
+            "has_pdf": self.pdf_path is not None,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobQueue:
+    """
+    Bounded FIFO of campaign jobs served by a fixed pool of worker tasks.
+
+    At most `workers` jobs run at once and submissions beyond `queue_size`
+    waiting jobs are rejected with QueueFull (backpressure) instead of piling
+    up in memory. A job whose site needs a PDF parks in WAITING_FOR_PDF
+    without holding a worker; attach_pdf() queues it again, and after
+    `pdf_wait_ttl` seconds without a PDF it fails.
+    `run_job` is an async callable (job) -> run_campaign result dict;
+    `on_finished` (optional) is called with every job that reaches DONE or
+    FAILED, e.g. to delete its uploaded PDF.
+    """
+
+    def __init__(
+        self,
+        run_job,
+        workers: int = DEFAULT_JOB_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        history: int = JOB_HISTORY,
+        pdf_wait_ttl: float = PDF_WAIT_TTL,
+        on_finished=None,
+    ):
+        self.run_job = run_job
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.history = history
+        self.pdf_wait_ttl = pdf_wait_ttl
+        self.on_finished = on_finished
+        self.jobs = {}  # Insertion ordered: oldest first
+        self._queue = None
+        self._tasks = []
+
+    async def start(self):
+        """Starts the workers on the running event loop."""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"📥 Job queue started: {self.workers} workers, {self.queue_size} queue slots")
+
+    async def stop(self):
+        """Cancels the workers; running jobs are abandoned."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, url: str, pdf_path: str = None) -> Job:
+        """Queues a new job; raises QueueFull when the backlog is at capacity."""
+        job = Job(url=url, pdf_path=pdf_path)
+        self._enqueue(job)
+        self.jobs[job.id] = job
+        self._prune()
+        return job
+
+    def get(self, job_id: str) -> Job:
+        job = self.jobs.get(job_id)
+        if job is not None:
+            self._expire(job)
+        return job
+
+    def is_full(self) -> bool:
+        """True while submit() / attach_pdf() would raise QueueFull."""
+        return self._queue is not None and self._queue.full()
+
+    def attach_pdf(self, job_id: str, pdf_path: str) -> Job:
+        """
+        Resumes a WAITING_FOR_PDF job with the uploaded PDF.
+        Raises KeyError, InvalidJobState or QueueFull.
+        """
+        job = self.jobs[job_id]
+        self._expire(job)
+        if job.state != WAITING_FOR_PDF:
+            raise InvalidJobState(f"Job {job_id} is {job.state}, not {WAITING_FOR_PDF}.")
+        self._enqueue(job)
+        job.pdf_path = pdf_path
+        return job
+
+    def _enqueue(self, job: Job):
+        if self._queue is None:
+            raise RuntimeError("JobQueue.start() has not been called.")
+        if self._queue.full():
+            raise QueueFull(f"{self._queue.qsize()} jobs already queued.")
+        job.set_state(QUEUED)
+        self._queue.put_nowait(job)
+
+    def _expire(self, job: Job):
+        """Fails a job that has waited longer than pdf_wait_ttl for its PDF."""
+        if job.state == WAITING_FOR_PDF and time.time() - job.updated_at >= self.pdf_wait_ttl:
+            job.error = f"No PDF uploaded within {self.pdf_wait_ttl:.0f}s."
+            self._finish(job, FAILED)
+
+    def _finish(self, job: Job, state: str):
+        job.set_state(state)
+        if self.on_finished is not None:
+            try:
+                self.on_finished(job)
+            except Exception as e:
+                logger.error(f"Job {job.id} cleanup failed: {e}")
+
+    def _prune(self):
+        """Expires stale PDF waits and forgets the oldest finished jobs beyond `history`."""
+        for job in list(self.jobs.values()):
+            self._expire(job)
+        excess = len(self.jobs) - self.history
+        if excess <= 0:
+            return
+        for job_id in [j.id for j in self.jobs.values() if j.state in FINISHED_STATES][:excess]:
+            del self.jobs[job_id]
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job):
+        job.runs += 1
+        job.set_state(RUNNING)
+        try:
+            result = await self.run_job(job)
+        except Exception as e:
+            logger.error(f"🔥 Job {job.id} crashed for {job.url}: {e}")
+            job.error = str(e)
+            self._finish(job, FAILED)
+            return
+        job.result = result
+        job.error = result.get("error", "")
+        if result["status"] == "NEEDS_PDF":
+            job.set_state(WAITING_FOR_PDF)
+        else:
+            self._finish(job, DONE)
+        logger.info(f"📤 Job {job.id} {job.state}: {result['status']} ({job.url})")
+
+    def stats(self) -> dict:
+        self._prune()
+        states = {}
+        for job in self.jobs.values():
+            states[job.state] = states.get(job.state, 0) + 1
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "states": states,
+        }
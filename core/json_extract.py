@@ -0,0 +1,71 @@
+import re
+import json
+
+# Fenced Markdown blocks: ```json ... ``` (language tag optional)
+FENCE_PATTERN = re.compile(r"```[ \t]*([A-Za-z0-9_-]*)[ \t]*\n?(.*?)```", re.DOTALL)
+
+BRIEF_KEYS = ("usp",)
+DRAFT_KEYS = ("headlines", "descriptions")
+
+_DECODER = json.JSONDecoder()
+
+
+def iter_json_objects(text: str):
+    """
+    Yields the JSON objects embedded in `text`, in order of appearance.
+    Decoding starts at every '{' outside an object already parsed, so a
+    stray brace or quote in prose only costs its own failed attempt and can
+    never hide a later object; braces inside JSON strings are handled by the
+    decoder.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            parsed, end = _DECODER.raw_decode(text, start)
+        except ValueError:
+            start = text.find("{", start + 1)
+            continue
+        yield parsed
+        start = text.find("{", end)
+
+
+def _walk_objects(obj: dict):
+    """`obj` followed by every object nested inside it (breadth first)."""
+    queue = [obj]
+    for value in queue:
+        if isinstance(value, dict):
+            yield value
+            queue.extend(value.values())
+        elif isinstance(value, list):
+            queue.extend(value)
+
+
+def iter_json_candidates(text: str):
+    """
+    Yields top-level JSON objects in priority order: those inside fenced code
+    blocks first, then those of the full text.
+    """
+    for match in FENCE_PATTERN.finditer(text):
+        yield from iter_json_objects(match.group(2))
+    yield from iter_json_objects(text)
+
+
+def find_json_object(text: str, expected_keys=None):
+    """
+    Returns the first JSON object (or object nested in one) containing all
+    `expected_keys`. When no object has the expected shape, the first parsed
+    object is returned instead; None when nothing parses.
+    """
+    if not text:
+        return None
+
+    first_object = None
+    for candidate in iter_json_candidates(text):
+        if first_object is None:
+            first_object = candidate
+        if not expected_keys:
+            return candidate
+        for obj in _walk_objects(candidate):
+            if all(key in obj for key in expected_keys):
+                return obj
+    return first_object
@@ -0,0 +1,82 @@
+import os
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class LruJsonStore:
+    """
+    Directory of JSON files, one per key, bounded by `max_bytes`.
+
+    Writes are atomic (temp file + os.replace), reads refresh the file's
+    mtime, and the least-recently-used files are evicted once the directory
+    grows past `max_bytes`. Keys must be safe file names (e.g. hex digests).
+    """
+
+    def __init__(self, directory: str, max_bytes: int, name: str = "JSON store"):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.name = name
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._scan())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _scan(self):
+        """Yields (path, size, last_access) for every stored file."""
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            yield path, stat.st_size, stat.st_mtime
+
+    def get(self, key: str):
+        """Returns the stored dict for `key` (or None) and marks it recently used."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # LRU bookkeeping
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return entry
+
+    def put(self, key: str, entry: dict):
+        path = self._path(key)
+        payload = json.dumps(entry).encode("utf-8")
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+
+        with self._lock:
+            try:
+                previous = os.path.getsize(path)
+            except FileNotFoundError:
+                previous = 0
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)  # Atomic swap: readers never see partial files
+            self._size += len(payload) - previous
+
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drops least-recently-used files until the store fits in max_bytes."""
+        files = sorted(self._scan(), key=lambda item: item[2])
+        self._size = sum(size for _, size, _ in files)
+        for path, size, _ in files:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                self._size -= size
+            except FileNotFoundError:
+                pass
+        logger.info(f"{self.name} evicted to {self._size} bytes")
@@ -0,0 +1,292 @@
+import os
+import csv
+import json
+import time
+import logging
+import itertools
+import threading
+
+logger = logging.getLogger("AdGenius_Core")
+
+# --- SINK CONFIGURATION ---
+DEFAULT_RESULTS_PATH = "adgenius_results.csv"
+DEFAULT_FLUSH_ROWS = 500  # Rows buffered before a write (also the Parquet row-group size)
+DEFAULT_FLUSH_INTERVAL = 5.0  # Seconds before buffered rows are written regardless
+
+RESULT_COLUMNS = ["url", "campaign_id", "status", "asset_type", "text", "length"]
+
+SINK_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+
+def campaign_rows(url: str, campaign_id: str, status: str, draft: dict) -> list:
+    """
+    Flattens one draft into result rows (one per headline / description).
+    """
+    rows = []
+    for asset_type, key in (("Headline", "headlines"), ("Description", "descriptions")):
+        for text in draft.get(key) or []:
+            rows.append(
+                {
+                    "url": url,
+                    "campaign_id": campaign_id,
+                    "status": status,
+                    "asset_type": asset_type,
+                    "text": text,
+                    "length": len(text),
+                }
+            )
+    return rows
+
+
+class ResultsSink:
+    """
+    Appends campaign rows to one open output.
+
+    Rows are buffered and written once `flush_rows` accumulate or
+    `flush_interval` seconds have passed since the last write, so a batch of
+    thousands of campaigns produces a single bulk file. The interval is
+    enforced by a background flusher thread, so rows of an idle sink do not
+    wait for the next campaign; formats that set `timed_flush = False` are
+    only written once `flush_rows` accumulate or on close. Subclasses
+    implement `_open`, `_write_rows` and `_close`.
+    """
+
+    timed_flush = True
+
+    def __init__(
+        self,
+        path: str,
+        flush_rows: int = DEFAULT_FLUSH_ROWS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.path = path
+        self.flush_rows = max(1, flush_rows)
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self._buffer = []
+        self._on_flushed = []  # Callbacks of the campaigns in _buffer
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._closed = False
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._open()
+        self._stop = threading.Event()
+        self._flusher = None
+        if self.timed_flush:
+            self._flusher = threading.Thread(target=self._flush_loop, name="adgenius-results-sink", daemon=True)
+            self._flusher.start()
+
+    def write_campaign(
+        self, url: str, campaign_id: str, status: str, draft: dict, on_flushed=None
+    ) -> int:
+        """
+        Buffers every asset of `draft`; returns the number of rows added.
+        `on_flushed` is called without arguments once the rows are written out.
+        """
+        rows = campaign_rows(url, campaign_id, status, draft)
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"Results sink {self.path} is closed")
+            self._buffer.extend(rows)
+            if on_flushed is not None:
+                self._on_flushed.append(on_flushed)
+            if len(self._buffer) >= self.flush_rows:
+                callbacks = self._flush_locked()
+            else:
+                callbacks = []
+        self._notify(callbacks)
+        return len(rows)
+
+    def has_campaign(self, campaign_id: str) -> bool:
+        """Whether rows of `campaign_id` are buffered or already in the output (reads the file)."""
+        with self._lock:
+            if any(row["campaign_id"] == campaign_id for row in self._buffer):
+                return True
+        return self._stored_campaign(campaign_id)
+
+    def flush(self):
+        with self._lock:
+            callbacks = self._flush_locked()
+        self._notify(callbacks)
+
+    def close(self):
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if self._closed:
+                return
+            callbacks = self._flush_locked()
+            self._close()
+            self._closed = True
+        self._notify(callbacks)
+        logger.info(f"Results sink closed: {self.rows_written} rows in {self.path}")
+
+    def _flush_loop(self):
+        """Writes out buffered rows once they are flush_interval seconds old."""
+        while not self._stop.wait(self.flush_interval / 2):
+            with self._lock:
+                due = time.monotonic() - self._last_flush >= self.flush_interval
+                callbacks = self._flush_locked() if due and not self._closed else []
+            self._notify(callbacks)
+
+    def _flush_locked(self) -> list:
+        """Writes the buffer; returns the on_flushed callbacks now due."""
+        self._last_flush = time.monotonic()
+        callbacks, self._on_flushed = self._on_flushed, []
+        if self._buffer:
+            rows, self._buffer = self._buffer, []
+            self._write_rows(rows)
+            self.rows_written += len(rows)
+        return callbacks
+
+    @staticmethod
+    def _notify(callbacks: list):
+        # Outside the lock: a slow callback must not hold up writers
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Results sink callback failed: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _write_rows(self, rows: list):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+    def _stored_campaign(self, campaign_id: str) -> bool:
+        return False
+
+
+class CsvSink(ResultsSink):
+    """
+    CSV output. Appends to an existing file; the header is written only once.
+    """
+
+    def _open(self):
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._file = open(self.path, "a", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=RESULT_COLUMNS)
+        if new_file:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def _write_rows(self, rows: list):
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+    def _stored_campaign(self, campaign_id: str) -> bool:
+        with open(self.path, newline="", encoding="utf-8") as f:
+            return any(row.get("campaign_id") == campaign_id for row in csv.DictReader(f))
+
+
+class JsonlSink(ResultsSink):
+    """
+    JSON Lines output (one row object per line), appended.
+    """
+
+    def _open(self):
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _write_rows(self, rows: list):
+        self._file.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+    def _stored_campaign(self, campaign_id: str) -> bool:
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if campaign_id in line:
+                    try:
+                        if json.loads(line).get("campaign_id") == campaign_id:
+                            return True
+                    except json.JSONDecodeError:
+                        continue  # Torn last line of a crashed run
+        return False
+
+
+class ParquetSink(ResultsSink):
+    """
+    Parquet output via pyarrow; every flush becomes one row group, so rows
+    are written in `flush_rows` batches and on close, never on the timer.
+    Parquet files cannot be appended to, so when the file already exists the
+    rows go to a new part file next to it (and rows of earlier runs never
+    count as stored).
+    """
+
+    timed_flush = False
+
+    def _open(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("url", pa.string()),
+                ("campaign_id", pa.string()),
+                ("status", pa.string()),
+                ("asset_type", pa.string()),
+                ("text", pa.string()),
+                ("length", pa.int32()),
+            ]
+        )
+        if os.path.exists(self.path):
+            root, ext = os.path.splitext(self.path)
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            part_path = f"{root}.part-{stamp}{ext}"
+            suffix = itertools.count(2)
+            while os.path.exists(part_path):
+                part_path = f"{root}.part-{stamp}-{next(suffix)}{ext}"
+            logger.warning(f"{self.path} already exists; writing results to {part_path}")
+            self.path = part_path
+        self._writer = pq.ParquetWriter(self.path, self._schema)
+
+    def _write_rows(self, rows: list):
+        table = self._pa.Table.from_pylist(rows, schema=self._schema)
+        self._writer.write_table(table, row_group_size=len(rows))
+
+    def _close(self):
+        self._writer.close()
+
+
+SINK_CLASSES = {"csv": CsvSink, "jsonl": JsonlSink, "parquet": ParquetSink}
+
+
+def open_results_sink(path: str = DEFAULT_RESULTS_PATH, fmt: str = None, **kwargs) -> ResultsSink:
+    """
+    Opens a sink for `path`. The format is taken from `fmt` or the file
+    extension (.csv, .jsonl/.ndjson, .parquet) and defaults to CSV.
+    Parquet requires pyarrow; without it the output falls back to CSV
+    next to the requested path.
+    """
+    fmt = fmt or SINK_FORMATS.get(os.path.splitext(path)[1].lower(), "csv")
+    if fmt not in SINK_CLASSES:
+        raise ValueError(f"Unsupported results format '{fmt}' (choose from {', '.join(SINK_CLASSES)})")
+
+    if fmt == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            path = os.path.splitext(path)[0] + ".csv"
+            fmt = "csv"
+            logger.warning(f"pyarrow is not installed; writing results as CSV to {path}")
+
+    return SINK_CLASSES[fmt](path, **kwargs)
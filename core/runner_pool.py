@@ -0,0 +1,69 @@
+import uuid
+import logging
+from contextlib import asynccontextmanager
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+
+logger = logging.getLogger("AdGenius_Core")
+
+APP_NAME = "agents"
+USER_ID = "local_operator"
+
+
+class RunnerPool:
+    """
+    Long-lived registry holding one ADK Runner per agent definition.
+
+    Runners and their InMemorySessionService are built once; each request only
+    gets a cheap throwaway session, which is deleted as soon as the request
+    finishes so memory stays flat over long batch runs.
+    """
+
+    def __init__(self, app_name: str = APP_NAME, user_id: str = USER_ID):
+        self.app_name = app_name
+        self.user_id = user_id
+        self.session_service = InMemorySessionService()
+        # id(agent) -> (agent, runner); the agent reference keeps the id stable
+        self._runners = {}
+        self.live_sessions = 0
+        self.sessions_created = 0
+
+    def get_runner(self, agent_def) -> Runner:
+        entry = self._runners.get(id(agent_def))
+        if entry is None:
+            runner = Runner(
+                agent=agent_def,
+                app_name=self.app_name,
+                session_service=self.session_service,
+            )
+            entry = (agent_def, runner)
+            self._runners[id(agent_def)] = entry
+            logger.debug(f"Runner created for {getattr(agent_def, 'name', agent_def)}")
+        return entry[1]
+
+    @asynccontextmanager
+    async def session(self, agent_def):
+        """
+        Leases (runner, session) for one request; the session is deleted on exit.
+        """
+        runner = self.get_runner(agent_def)
+        session = await self.session_service.create_session(
+            app_name=self.app_name, user_id=self.user_id, session_id=str(uuid.uuid4())
+        )
+        self.live_sessions += 1
+        self.sessions_created += 1
+        try:
+            yield runner, session
+        finally:
+            self.live_sessions -= 1
+            await self.session_service.delete_session(
+                app_name=self.app_name, user_id=self.user_id, session_id=session.id
+            )
+
+    def stats(self) -> dict:
+        return {
+            "runners": len(self._runners),
+            "live_sessions": self.live_sessions,
+            "sessions_created": self.sessions_created,
+        }
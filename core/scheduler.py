@@ -0,0 +1,327 @@
+import re
+import time
+import heapq
+import asyncio
+import logging
+import itertools
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from ad_genius_capstone.core import telemetry
+
+logger = logging.getLogger("AdGenius_Core")
+
+# --- SCHEDULER CONFIGURATION ---
+# Lower values are served first: fix-loop retries finish campaigns that
+# already spent tokens before new campaigns start their Strategist.
+PRIORITY_RETRY = 0
+PRIORITY_ACTIVE = 1
+PRIORITY_NEW = 2
+
+DEFAULT_OUTPUT_TOKENS = 1024  # Reserved per call until real usage is known
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 1.0  # Seconds; attempt n waits uniform(0, BACKOFF_BASE * 2**n)
+BACKOFF_MAX = 60.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+RETRYABLE_PATTERN = re.compile(
+    r"\b(429|500|502|503|504)\b|RESOURCE_EXHAUSTED|UNAVAILABLE|DEADLINE_EXCEEDED", re.I
+)
+
+_request_priority = contextvars.ContextVar("adgenius_request_priority", default=PRIORITY_NEW)
+
+
+@dataclass(frozen=True)
+class ModelLimits:
+    """Per-model quota; None means unlimited."""
+
+    rpm: float = None
+    tpm: float = None
+
+
+# Published tier-1 Gemini API quotas; override with --model-limit.
+DEFAULT_MODEL_LIMITS = {
+    "gemini-2.5-flash": ModelLimits(rpm=1000, tpm=1_000_000),
+    "gemini-2.5-pro": ModelLimits(rpm=150, tpm=2_000_000),
+}
+
+
+def error_status(exc: BaseException):
+    """HTTP-style status of an API error (google-genai, api_core, requests), if any."""
+    for attr in ("code", "status_code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Quota (429) and transient server errors (5xx) are retried; the rest fail fast."""
+    status = error_status(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    return bool(RETRYABLE_PATTERN.search(str(exc)))
+
+
+def is_throttle(exc: BaseException) -> bool:
+    """True for quota errors, which slow the whole model down."""
+    status = error_status(exc)
+    if status is not None:
+        return status == 429
+    return bool(re.search(r"\b429\b|RESOURCE_EXHAUSTED", str(exc)))
+
+
+def set_request_priority(priority: int):
+    """Sets the priority of scheduled calls for the rest of the current task."""
+    _request_priority.set(priority)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """Runs the block's scheduled calls at `priority` (inherited by child tasks)."""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class TokenBucket:
+    """
+    Refills `per_minute` units per minute up to one minute of burst.
+    The level may go negative when a call used more than it reserved.
+    """
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.capacity = per_minute
+        self.level = per_minute
+        self.scale = 1.0  # Adaptive share of the nominal rate
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        rate = self.per_minute * self.scale / 60.0
+        self.level = min(self.capacity, self.level + (now - self._updated) * rate)
+        self._updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 when they are)."""
+        self._refill()
+        # A single call larger than the bucket waits for a full bucket
+        missing = min(amount, self.capacity) - self.level
+        if missing <= 0:
+            return 0.0
+        return missing / (self.per_minute * self.scale / 60.0)
+
+    def take(self, amount: float):
+        self._refill()
+        self.level -= amount
+
+    def give_back(self, amount: float):
+        self.level = min(self.capacity, self.level + amount)
+
+
+class ModelGate:
+    """
+    Admission control for one model: request and token buckets plus a
+    priority-ordered waiting line. Only the head of the line may take
+    capacity, so a burst of new campaigns cannot starve pending retries.
+    A 429 pauses the whole gate and shrinks its rate (AIMD); successes
+    grow it back towards the configured quota.
+    """
+
+    RATE_DECREASE = 0.7
+    RATE_INCREASE = 0.02
+    MIN_SCALE = 0.2
+
+    def __init__(self, model: str, limits: ModelLimits):
+        self.model = model
+        self.requests = TokenBucket(limits.rpm) if limits.rpm else None
+        self.tokens = TokenBucket(limits.tpm) if limits.tpm else None
+        self.paused_until = 0.0
+        self.in_flight = 0
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._condition = None
+        self._loop = None
+
+    def _delay(self, tokens: float) -> float:
+        delay = max(0.0, self.paused_until - time.monotonic())
+        if self.requests:
+            delay = max(delay, self.requests.delay(1))
+        if self.tokens:
+            delay = max(delay, self.tokens.delay(tokens))
+        return delay
+
+    async def acquire(self, priority: int, tokens: float) -> float:
+        """Waits for capacity; returns the seconds spent queued."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # asyncio primitives are bound to one event loop
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._waiters = []
+        entry = (priority, next(self._sequence))
+        started = time.monotonic()
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    timeout = None
+                    if self._waiters[0] == entry:
+                        timeout = self._delay(tokens)
+                        if timeout <= 0:
+                            heapq.heappop(self._waiters)
+                            if self.requests:
+                                self.requests.take(1)
+                            if self.tokens:
+                                self.tokens.take(tokens)
+                            self.in_flight += 1
+                            self._condition.notify_all()
+                            return time.monotonic() - started
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    self._condition.notify_all()
+                raise
+
+    def release(self, reserved_tokens: float, used_tokens: float = None):
+        """Ends a call; settles the token reservation against real usage."""
+        self.in_flight -= 1
+        if self.tokens and used_tokens is not None:
+            self.tokens.give_back(reserved_tokens - used_tokens)
+
+    def record_success(self):
+        for bucket in (self.requests, self.tokens):
+            if bucket:
+                bucket.scale = min(1.0, bucket.scale + self.RATE_INCREASE)
+
+    def record_throttle(self, pause: float):
+        self.paused_until = max(self.paused_until, time.monotonic() + pause)
+        for bucket in (self.requests, self.tokens):
+            if bucket:
+                bucket.scale = max(self.MIN_SCALE, bucket.scale * self.RATE_DECREASE)
+
+
+class Slot:
+    """Capacity granted to one call; report real token usage via `used_tokens`."""
+
+    def __init__(self, gate: ModelGate, reserved_tokens: float):
+        self.gate = gate
+        self.reserved_tokens = reserved_tokens
+        self.used_tokens = None
+
+    def add_usage(self, tokens: int):
+        self.used_tokens = (self.used_tokens or 0) + (tokens or 0)
+
+
+class Scheduler:
+    """
+    Central gateway for every model and cloud call.
+
+    call() waits for the model's rate limits in priority order, runs the call
+    and retries 429/5xx failures with jittered exponential backoff. A 429 also
+    throttles the model's gate for all other callers.
+    """
+
+    def __init__(
+        self,
+        limits: dict = None,
+        default_limits: ModelLimits = ModelLimits(),
+        max_attempts: int = MAX_ATTEMPTS,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+    ):
+        self.limits = {**DEFAULT_MODEL_LIMITS, **(limits or {})}
+        self.default_limits = default_limits
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._gates = {}
+
+    def gate(self, model: str) -> ModelGate:
+        gate = self._gates.get(model)
+        if gate is None:
+            gate = self._gates[model] = ModelGate(model, self.limits.get(model, self.default_limits))
+        return gate
+
+    async def acquire(self, model: str, est_tokens: float = 0, priority: int = None) -> Slot:
+        """Low-level admission for calls that cannot be retried (streams). Pair with release()."""
+        gate = self.gate(model)
+        priority = _request_priority.get() if priority is None else priority
+        queued = await gate.acquire(priority, est_tokens)
+        if queued > 0.05:
+            telemetry.annotate(queued_seconds=round(queued, 3))
+        return Slot(gate, est_tokens)
+
+    def release(self, slot: Slot, error: BaseException = None):
+        slot.gate.release(slot.reserved_tokens, slot.used_tokens)
+        if error is None:
+            slot.gate.record_success()
+        elif is_throttle(error):
+            slot.gate.record_throttle(self.backoff_base)
+
+    async def call(self, model: str, fn, est_tokens: float = 0, priority: int = None):
+        """
+        Runs `await fn(slot)` under the model's limits, retrying retryable errors.
+        Each attempt queues again, so backoff never holds capacity.
+        """
+        def log_retry(state):
+            error = state.outcome.exception()
+            telemetry.count("retries_scheduled_total", model=model)
+            logger.warning(
+                f"⏳ {model} call failed ({str(error)[:80]}). "
+                f"Retry {state.attempt_number}/{self.max_attempts - 1} "
+                f"in {state.next_action.sleep:.1f}s..."
+            )
+
+        retrying = AsyncRetrying(
+            retry=retry_if_exception(is_retryable),
+            wait=wait_random_exponential(multiplier=self.backoff_base, max=self.backoff_max),
+            stop=stop_after_attempt(self.max_attempts),
+            before_sleep=log_retry,
+            reraise=True,
+        )
+        async for attempt in retrying:
+            with attempt:
+                slot = await self.acquire(model, est_tokens, priority)
+                try:
+                    result = await fn(slot)
+                except BaseException as e:
+                    self.release(slot, e)
+                    raise
+                self.release(slot)
+                return result
+
+    def stats(self) -> dict:
+        return {
+            model: {
+                "in_flight": gate.in_flight,
+                "queued": len(gate._waiters),
+                "rate_scale": round(gate.requests.scale if gate.requests else 1.0, 2),
+            }
+            for model, gate in self._gates.items()
+        }
+
+
+def parse_model_limit(spec: str):
+    """'gemini-2.5-flash=1000,1000000' -> ("gemini-2.5-flash", ModelLimits(1000, 1000000))."""
+    model, _, values = spec.partition("=")
+    rpm, _, tpm = values.partition(",")
+    if not model or not rpm:
+        raise ValueError(f"Expected MODEL=RPM[,TPM], got '{spec}'")
+    return model.strip(), ModelLimits(rpm=float(rpm), tpm=float(tpm) if tpm else None)
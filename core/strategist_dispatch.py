@@ -0,0 +1,178 @@
+import time
+import asyncio
+import logging
+
+from ad_genius_capstone.core import telemetry
+
+logger = logging.getLogger("AdGenius_Core")
+
+# --- DISPATCH CONFIGURATION ---
+DEFAULT_HEDGE_DELAY = 20.0  # Seconds before the Local Strategist races the cloud
+DEFAULT_FAILURE_THRESHOLD = 3  # Consecutive cloud failures before the breaker opens
+DEFAULT_COOLDOWN = 300.0  # Seconds the cloud is skipped once the breaker is open
+
+
+def cloud_response_ok(text) -> bool:
+    """Cloud responses are unusable when empty or carrying an error message."""
+    return bool(text) and "Error" not in str(text)
+
+
+def local_response_final(text) -> bool:
+    """A CAPTCHA signal from the local path should not beat a pending cloud answer."""
+    return "CAPTCHA_DETECTED" not in (text or "")
+
+
+class CircuitBreaker:
+    """
+    Stops calling a flaky dependency after `failure_threshold` consecutive failures.
+
+    While open, calls are short-circuited for `cooldown` seconds. After that a
+    single trial call is let through (half-open); its outcome closes the
+    breaker again or re-opens it for another cooldown.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        # A failed half-open trial re-opens immediately
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning(
+                    f"🔌 Cloud circuit opened after {self.failures} failures "
+                    f"(cooldown {self.cooldown:.0f}s)."
+                )
+            self.opened_at = time.monotonic()
+
+
+class StrategistDispatcher:
+    """
+    Hedged cloud/local Strategist execution.
+
+    `cloud_query` is a coroutine function taking the prompt. If it has not
+    answered within `hedge_delay` seconds the local Strategist is started as
+    well and the first usable result wins, so tail latency is bounded by the
+    faster path instead of the sum of both. A shared CircuitBreaker skips the
+    cloud entirely after repeated failures.
+    """
+
+    def __init__(
+        self,
+        cloud_query,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        breaker: CircuitBreaker = None,
+    ):
+        self.cloud_query = cloud_query
+        self.hedge_delay = hedge_delay
+        self.breaker = breaker or CircuitBreaker()
+
+    def _record_cloud_outcome(self, task: asyncio.Future):
+        if task.cancelled() or task.exception() is not None:
+            self.breaker.record_failure()
+        elif cloud_response_ok(task.result()):
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    @staticmethod
+    def _cloud_text(task: asyncio.Future):
+        if task.cancelled() or task.exception() is not None:
+            return None
+        text = task.result()
+        return str(text) if cloud_response_ok(text) else None
+
+    async def run(
+        self, cloud_prompt: str, run_local, use_cloud: bool = True, hedge_delay=None
+    ):
+        """
+        Produces a brief response. `run_local` is a zero-argument coroutine
+        function running the local Strategist. `hedge_delay` overrides the
+        dispatcher default; a negative value disables hedging (the cloud is
+        awaited before failing over, as in sequential mode).
+        Returns (source, text) where source is "cloud" or "local".
+        """
+        if hedge_delay is None:
+            hedge_delay = self.hedge_delay
+
+        if not use_cloud:
+            telemetry.record_failover("cloud_disabled")
+            return "local", await run_local()
+        if not self.breaker.allow():
+            logger.warning("🔌 Cloud circuit open. Routing straight to Local Strategist.")
+            telemetry.record_failover("circuit_open")
+            return "local", await run_local()
+
+        cloud_task = asyncio.ensure_future(self.cloud_query(cloud_prompt))
+        cloud_task.add_done_callback(self._record_cloud_outcome)
+
+        await asyncio.wait(
+            {cloud_task}, timeout=hedge_delay if hedge_delay >= 0 else None
+        )
+        if cloud_task.done():
+            text = self._cloud_text(cloud_task)
+            if text:
+                return "cloud", text
+            logger.warning(
+                "⚠️ Cloud Engine Unreachable/Failed. Triggering Failover Protocol..."
+            )
+            telemetry.record_failover("cloud_failed")
+            return "local", await run_local()
+
+        logger.info(
+            f"⏱️ Cloud Strategist slower than {hedge_delay:.0f}s. Hedging with Local Strategist..."
+        )
+        telemetry.annotate(hedged=True)
+        local_task = asyncio.ensure_future(run_local())
+        try:
+            pending = {cloud_task, local_task}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if cloud_task in done:
+                    text = self._cloud_text(cloud_task)
+                    if text:
+                        return "cloud", text
+                if local_task in done and local_task.exception() is None:
+                    if local_response_final(local_task.result()):
+                        # The cloud query finishes in the background; its
+                        # outcome still feeds the circuit breaker.
+                        telemetry.record_failover("hedge_won")
+                        return "local", local_task.result()
+            telemetry.record_failover("cloud_failed")
+            return "local", local_task.result()
+        finally:
+            if not local_task.done():
+                local_task.cancel()
@@ -0,0 +1,85 @@
+import json
+
+# Draft arrays whose items are emitted as soon as they are complete
+ASSET_KEYS = ("headlines", "descriptions")
+
+
+class IncrementalAssetParser:
+    """
+    Push parser for streamed Copywriter output.
+
+    Text chunks are fed in as they arrive; every string item of the
+    "headlines" / "descriptions" arrays is emitted the moment its closing quote
+    is seen, long before the JSON object is complete. Anything before the first
+    '{' (chatter, Markdown fences) is ignored.
+    """
+
+    def __init__(self, keys=ASSET_KEYS):
+        self.keys = keys
+        self.started = False
+        self.in_string = False
+        self.escape = False
+        self.buffer = []
+        # Each frame: [container, array_key, item_count]
+        self.stack = []
+        self.last_string = None
+        self.counts = {key: 0 for key in keys}
+
+    def feed(self, chunk: str) -> list:
+        """
+        Consumes a chunk and returns newly completed assets as
+        (key, index, text) tuples, index being 0-based within its array.
+        """
+        completed = []
+        for char in chunk:
+            if not self.started:
+                if char != "{":
+                    continue
+                self.started = True
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                    self.buffer.append(char)
+                elif char == "\\":
+                    self.escape = True
+                    self.buffer.append(char)
+                elif char == '"':
+                    self.in_string = False
+                    self._close_string(completed)
+                else:
+                    self.buffer.append(char)
+                continue
+
+            if char == '"':
+                self.in_string = True
+                self.buffer = []
+            elif char == "{":
+                self.stack.append(["{", None, 0])
+                self.last_string = None
+            elif char == "[":
+                parent = self.stack[-1] if self.stack else None
+                key = self.last_string if parent and parent[0] == "{" else None
+                self.stack.append(["[", key if key in self.keys else None, 0])
+                self.last_string = None
+            elif char in "]}":
+                if self.stack:
+                    self.stack.pop()
+                self.last_string = None
+        return completed
+
+    def _close_string(self, completed: list):
+        raw = "".join(self.buffer)
+        try:
+            text = json.loads(f'"{raw}"')
+        except json.JSONDecodeError:
+            text = raw
+
+        frame = self.stack[-1] if self.stack else None
+        if frame and frame[0] == "[" and frame[1]:
+            completed.append((frame[1], frame[2], text))
+            frame[2] += 1
+            self.counts[frame[1]] += 1
+        elif frame and frame[0] == "{":
+            # Object-level string: remember it in case it is the key of an array
+            self.last_string = text
@@ -0,0 +1,370 @@
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+import contextvars
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger("AdGenius_Core")
+
+# --- TELEMETRY CONFIGURATION ---
+# Disabled unless configure() is called: span() then returns a shared no-op
+# object and the counters return immediately, so instrumented code pays one
+# global lookup per call site.
+METRIC_PREFIX = "adgenius"
+DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+TRACE_FLUSH_LINES = 200  # Buffered span lines written per batch
+METRICS_WRITE_INTERVAL = 10.0  # Seconds between metrics file rewrites
+DEFAULT_METRICS_HOST = "127.0.0.1"  # The endpoint is unauthenticated: local scrapers only by default
+
+_telemetry = None
+_current_span = contextvars.ContextVar("adgenius_current_span", default=None)
+
+
+class _NoopSpan:
+    """Stand-in returned by span() while telemetry is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+    def add(self, key: str, amount):
+        pass
+
+    def fail(self, reason: str):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """
+    One timed operation. Nested spans share the trace id of the outermost one
+    (a campaign), and asyncio tasks / worker threads inherit the parent via
+    contextvars.
+    """
+
+    __slots__ = (
+        "telemetry", "name", "attrs", "status", "trace_id", "span_id",
+        "parent_id", "started_at", "duration", "_start", "_token",
+    )
+
+    def __init__(self, telemetry, name: str, attrs: dict):
+        self.telemetry = telemetry
+        self.name = name
+        self.attrs = attrs
+        self.status = "ok"
+        self.span_id = uuid.uuid4().hex[:16]
+        self.duration = 0.0
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def add(self, key: str, amount):
+        self.attrs[key] = self.attrs.get(key, 0) + amount
+
+    def fail(self, reason: str):
+        self.status = "error"
+        self.attrs["error"] = str(reason)[:300]
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent else None
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self._token = _current_span.set(self)
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self._start
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # Exited from another context (e.g. an async generator closed elsewhere)
+            pass
+        if exc_type is not None and not issubclass(exc_type, GeneratorExit):
+            self.fail(f"{exc_type.__name__}: {exc}")
+        self.telemetry.finish(self)
+        return False
+
+    def to_record(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.started_at, 6),
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "attrs": self.attrs,
+        }
+
+
+class Metrics:
+    """
+    In-process counters and histograms rendered in the Prometheus text format.
+    """
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    @staticmethod
+    def _key(name: str, labels: dict):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name: str, amount=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> str:
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: list(series) for key, series in self._histograms.items()}
+
+        lines = []
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} counter")
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{METRIC_PREFIX}_{name}{_labels(labels)} {value}")
+        for name in sorted({name for name, _ in histograms}):
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} histogram")
+            for (metric, labels), series in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(self.buckets, series):
+                    bucket_labels = labels + (("le", f"{bound:g}"),)
+                    lines.append(f"{METRIC_PREFIX}_{name}_bucket{_labels(bucket_labels)} {count}")
+                inf_labels = labels + (("le", "+Inf"),)
+                lines.append(f"{METRIC_PREFIX}_{name}_bucket{_labels(inf_labels)} {series[-1]}")
+                lines.append(f"{METRIC_PREFIX}_{name}_sum{_labels(labels)} {series[-2]:.6f}")
+                lines.append(f"{METRIC_PREFIX}_{name}_count{_labels(labels)} {series[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+class Telemetry:
+    """
+    Collects finished spans: appends them to a JSONL trace file, feeds span
+    durations into the metrics and exposes those as a Prometheus file and/or
+    HTTP endpoint (/metrics).
+    """
+
+    def __init__(
+        self,
+        trace_path: str = None,
+        metrics_path: str = None,
+        metrics_port: int = None,
+        metrics_host: str = DEFAULT_METRICS_HOST,
+    ):
+        self.trace_path = trace_path
+        self.metrics_path = metrics_path
+        self.metrics = Metrics()
+        self._lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._pending = []
+        self._last_metrics_write = time.monotonic()
+        self._trace_file = None
+        self._server = None
+
+        if trace_path:
+            directory = os.path.dirname(trace_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._trace_file = open(trace_path, "a", encoding="utf-8")
+        if metrics_port is not None:
+            self._server = _start_metrics_server(self.metrics, metrics_port, metrics_host)
+
+    def finish(self, span: Span):
+        self.metrics.observe("span_duration_seconds", span.duration, span=span.name, status=span.status)
+        if self._trace_file is not None:
+            line = json.dumps(span.to_record(), default=str, ensure_ascii=False)
+            with self._lock:
+                if self._trace_file is not None:
+                    self._pending.append(line)
+                    if len(self._pending) >= TRACE_FLUSH_LINES:
+                        self._flush_traces_locked()
+        if self.metrics_path and self._metrics_due():
+            self.write_metrics()
+
+    def _metrics_due(self) -> bool:
+        """True for exactly one caller once METRICS_WRITE_INTERVAL has passed."""
+        with self._metrics_lock:
+            now = time.monotonic()
+            if now - self._last_metrics_write < METRICS_WRITE_INTERVAL:
+                return False
+            self._last_metrics_write = now
+            return True
+
+    def _flush_traces_locked(self):
+        if self._pending:
+            self._trace_file.write("\n".join(self._pending) + "\n")
+            self._trace_file.flush()
+            self._pending = []
+
+    def write_metrics(self):
+        """
+        Atomically rewrites the Prometheus metrics file. Never raises: a
+        failed write is logged and retried at the next interval.
+        """
+        if not self.metrics_path:
+            return
+        # Unique per writer, so concurrent rewrites never replace each other's file
+        tmp_path = f"{self.metrics_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._metrics_lock:
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(self.metrics.render())
+                os.replace(tmp_path, self.metrics_path)
+            except OSError as e:
+                logger.warning(f"Metrics file write failed: {e}")
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def close(self):
+        if self._trace_file is not None:
+            with self._lock:
+                self._flush_traces_locked()
+                self._trace_file.close()
+                self._trace_file = None
+        self.write_metrics()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _start_metrics_server(metrics: Metrics, port: int, host: str = DEFAULT_METRICS_HOST):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            payload = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(f"📈 Prometheus metrics on http://{host}:{server.server_address[1]}/metrics")
+    return server
+
+
+# --- MODULE API ---
+
+
+def configure(
+    trace_path: str = None,
+    metrics_path: str = None,
+    metrics_port: int = None,
+    metrics_host: str = DEFAULT_METRICS_HOST,
+):
+    """
+    Enables telemetry when any output is requested; returns the Telemetry or None.
+    """
+    global _telemetry
+    shutdown()
+    if trace_path or metrics_path or metrics_port is not None:
+        _telemetry = Telemetry(trace_path, metrics_path, metrics_port, metrics_host)
+    return _telemetry
+
+
+def shutdown():
+    """Flushes traces, writes the final metrics file and stops the endpoint."""
+    global _telemetry
+    if _telemetry is not None:
+        _telemetry.close()
+        _telemetry = None
+
+
+def enabled() -> bool:
+    return _telemetry is not None
+
+
+def span(name: str, **attrs):
+    """Context manager timing a block; a shared no-op while disabled."""
+    if _telemetry is None:
+        return NOOP_SPAN
+    return Span(_telemetry, name, attrs)
+
+
+def count(metric: str, amount=1, **labels):
+    """Increments a Prometheus counter (adgenius_<metric>)."""
+    if _telemetry is not None:
+        _telemetry.metrics.inc(metric, amount, **labels)
+
+
+def annotate(**attrs):
+    """Adds attributes to the innermost active span."""
+    if _telemetry is not None:
+        current = _current_span.get()
+        if current is not None:
+            current.set(**attrs)
+
+
+def record_token_usage(active_span, agent: str, usage) -> None:
+    """
+    Adds an ADK event's usage_metadata to `active_span` and the token counters.
+    """
+    if _telemetry is None or usage is None:
+        return
+    for kind, value in (
+        ("prompt", usage.prompt_token_count),
+        ("response", usage.candidates_token_count),
+        ("thoughts", getattr(usage, "thoughts_token_count", None)),
+    ):
+        if value:
+            active_span.add(f"{kind}_tokens", value)
+            _telemetry.metrics.inc("tokens_total", value, agent=agent, kind=kind)
+
+
+def record_failover(reason: str) -> None:
+    """Notes why the Local Strategist produced the brief instead of the cloud."""
+    if _telemetry is not None:
+        annotate(failover_reason=reason)
+        _telemetry.metrics.inc("failovers_total", reason=reason)
@@ -0,0 +1,108 @@
+import hashlib
+
+# --- NEAR-DUPLICATE DETECTION ---
+# 64-bit SimHash over word shingles. Two blocks within HAMMING_THRESHOLD bits
+# are treated as the same text (a nav bar with one changed label, a footer
+# with a different year). Candidates are found through BANDS exact-match
+# bands: with threshold 3 and 4 bands, any near-duplicate pair shares at
+# least one band (pigeonhole), so no pairwise scan is needed.
+SHINGLE_WORDS = 3
+HASH_BITS = 64
+HAMMING_THRESHOLD = 3
+BANDS = 4
+BAND_BITS = HASH_BITS // BANDS
+# Fewer pages cannot tell chrome from a selling point the site repeats
+MIN_BOILERPLATE_PAGES = 3
+
+
+def shingles(text: str, size: int = SHINGLE_WORDS) -> list:
+    """Overlapping word n-grams of the case-folded text (the whole text if shorter)."""
+    words = text.casefold().split()
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+
+
+def _hash64(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash fingerprint; similar texts differ in few bits."""
+    weights = [0] * HASH_BITS
+    for shingle in shingles(text):
+        value = _hash64(shingle)
+        for bit in range(HASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateIndex:
+    """
+    Groups texts into near-duplicate clusters. add() returns the cluster id
+    of the first indexed text within HAMMING_THRESHOLD bits, or a new id.
+    """
+
+    def __init__(self, threshold: int = HAMMING_THRESHOLD):
+        self.threshold = threshold
+        self._bands = {}
+        self._fingerprints = []  # cluster id -> representative fingerprint
+
+    @staticmethod
+    def _band_keys(fingerprint: int):
+        mask = (1 << BAND_BITS) - 1
+        return [(band, fingerprint >> (band * BAND_BITS) & mask) for band in range(BANDS)]
+
+    def add(self, text: str) -> int:
+        fingerprint = simhash(text)
+        keys = self._band_keys(fingerprint)
+        for key in keys:
+            for cluster in self._bands.get(key, ()):
+                if hamming(fingerprint, self._fingerprints[cluster]) <= self.threshold:
+                    return cluster
+        cluster = len(self._fingerprints)
+        self._fingerprints.append(fingerprint)
+        for key in keys:
+            self._bands.setdefault(key, []).append(cluster)
+        return cluster
+
+
+def remove_repeated_blocks(pages: list, min_share: float = 0.5) -> tuple:
+    """
+    Drops boilerplate from a site's pages, each given as a list of text blocks.
+
+    A block whose near-duplicates appear on more than `min_share` of the
+    pages (and on MIN_BOILERPLATE_PAGES or more) is site chrome such as
+    navigation or a footer and is removed everywhere. Other repeats are kept
+    once, on the first page listing them. Returns (pages, dropped_block_count).
+    """
+    index = NearDuplicateIndex()
+    clusters = [[index.add(block) for block in blocks] for blocks in pages]
+
+    page_counts = {}
+    for page_clusters in clusters:
+        for cluster in set(page_clusters):
+            page_counts[cluster] = page_counts.get(cluster, 0) + 1
+    boilerplate = {
+        cluster
+        for cluster, count in page_counts.items()
+        if count >= MIN_BOILERPLATE_PAGES and count > min_share * len(pages)
+    }
+
+    seen = set()
+    cleaned = []
+    dropped = 0
+    for blocks, page_clusters in zip(pages, clusters):
+        kept = []
+        for block, cluster in zip(blocks, page_clusters):
+            if cluster in boilerplate or cluster in seen:
+                dropped += 1
+                continue
+            seen.add(cluster)
+            kept.append(block)
+        cleaned.append(kept)
+    return cleaned, dropped
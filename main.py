@@ -1,40 +1,82 @@
 import os
+import sys
 import json
-import re
-import uuid
+import time
 import logging
 import asyncio
+import argparse
+import functools
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from contextlib import aclosing, contextmanager
 from datetime import datetime
-import pandas as pd
 from dotenv import load_dotenv
 
-# --- GOOGLE ADK IMPORTS ---
-from google.adk.models import Gemini
-from google.genai import types
-from google.adk.agents import LlmAgent
-from google.adk.tools import FunctionTool
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-
-# --- CLOUD IMPORTS ---
-from google.cloud import aiplatform
-
-try:
-    import vertexai.preview.reasoning_engines as reasoning_engines
-except ImportError:
-    # Graceful fallback for environments with older SDKs
-    try:
-        from google.cloud.aiplatform import reasoning_engines
-    except ImportError:
-        logging.warning("Reasoning Engine SDK not found. Cloud capabilities disabled.")
-        reasoning_engines = None
+# --- HEAVY IMPORTS ---
+# pandas, the ADK stack and the Vertex AI SDK each take seconds to import, so
+# they are loaded inside the code paths that use them (see build_agents,
+# run_agent_execution and get_remote_strategist).
+# benchmarks/bench_startup.py guards against regressions.
 
 # --- LOCAL MODULE IMPORTS ---
 from ad_genius_capstone.tools.scraper_tool import scrape_website, read_pdf_content
-from ad_genius_capstone.tools.ad_validator_tool import validate_ad_assets
-from ad_genius_capstone.agents.strategist import get_strategist_agent
-from ad_genius_capstone.agents.copywriter import get_copywriter_agent
-from ad_genius_capstone.agents.validator import get_validator_agent
+from ad_genius_capstone.tools.site_crawler import (
+    crawl_website,
+    CRAWL_MAX_PAGES,
+    CRAWL_MAX_DEPTH,
+)
+from ad_genius_capstone.tools.ad_validator_tool import (
+    validate_ad_assets,
+    check_headline,
+    check_description,
+    check_counts,
+    format_violation,
+)
+from ad_genius_capstone.core.asset_repair import (
+    failing_asset_indices,
+    build_repair_prompt,
+    merge_repairs,
+    revalidate_changed,
+)
+from ad_genius_capstone.core.stream_parser import IncrementalAssetParser
+from ad_genius_capstone.core.draft_pool import assemble_draft
+from ad_genius_capstone.core.json_extract import find_json_object, BRIEF_KEYS, DRAFT_KEYS
+from ad_genius_capstone.core.strategist_dispatch import (
+    StrategistDispatcher,
+    DEFAULT_HEDGE_DELAY,
+)
+from ad_genius_capstone.core.brief_cache import (
+    BriefCache,
+    brief_cache_key,
+    DEFAULT_CACHE_DIR as BRIEF_CACHE_DIR,
+)
+from ad_genius_capstone.core import telemetry
+from ad_genius_capstone.core.scheduler import (
+    Scheduler,
+    DEFAULT_OUTPUT_TOKENS,
+    PRIORITY_ACTIVE,
+    PRIORITY_NEW,
+    PRIORITY_RETRY,
+    request_priority,
+    set_request_priority,
+    parse_model_limit,
+)
+from ad_genius_capstone.core.checkpoint_journal import (
+    CheckpointJournal,
+    DEFAULT_JOURNAL_PATH,
+    SCRAPED,
+    BRIEF,
+    DRAFT,
+    VERDICT,
+    text_sha256,
+)
+from ad_genius_capstone.core.results_sink import (
+    open_results_sink,
+    DEFAULT_RESULTS_PATH,
+    SINK_CLASSES,
+)
 
 # --- CONFIGURATION ---
 load_dotenv()
@@ -44,98 +86,548 @@ logging.basicConfig(
 logger = logging.getLogger("AdGenius_Core")
 
 # Constants
+CLOUD_MODEL_KEY = "vertex-reasoning-engine"  # Scheduler key for Cloud Strategist queries
 CLOUD_AGENT_ID = (
     "projects/247825145070/locations/europe-west1/reasoningEngines/8342971086261977088"
 )
 PROJECT_ID = "my-capstone-project-479616"
 LOCATION = "europe-west1"
+MAX_RETRIES = 3
+EXPORTED_STATUSES = ("APPROVED", "MAX_RETRIES")  # Outcomes whose draft goes to the results output
+DEFAULT_BATCH_CONCURRENCY = 5
+DEFAULT_STREAM_ABORT_THRESHOLD = 5  # Violations that cut a streamed draft short
+# Scrapes sleep in worker threads for per-domain politeness, so they get their
+# own pool instead of starving asyncio's default executor
+SCRAPE_WORKERS = int(os.getenv("ADGENIUS_SCRAPE_WORKERS", "16"))
+
+_brief_cache = None
+_results_sink = None
+_journal = None
+_runner_pool = None
+_remote_agent = None
+_remote_agent_lock = threading.Lock()
+_strategist_dispatcher = None
+_scheduler = None
+_scrape_executor = None
+
+
+@dataclass
+class CampaignOptions:
+    """
+    Per-run pipeline switches shared by interactive and batch mode.
+    """
+
+    # Validate drafts with validate_ad_assets in-process instead of the Validator Agent
+    local_validation: bool = False
+    # Reuse Strategist briefs for unchanged source text
+    use_brief_cache: bool = True
+    # Seconds before the Local Strategist races a slow cloud call (<0 disables hedging)
+    hedge_delay: float = DEFAULT_HEDGE_DELAY
+    # Stream Copywriter output and validate assets as they complete
+    stream_copywriter: bool = False
+    stream_abort_threshold: int = DEFAULT_STREAM_ABORT_THRESHOLD
+    # Rewrite only failing assets instead of regenerating the whole draft
+    targeted_repair: bool = False
+    # Concurrent Copywriter drafts pooled into one valid draft (1 disables fan-out)
+    copywriter_fanout: int = 1
+    # Also read same-site pages (pricing, features, about) into the brief input
+    crawl: bool = False
+    crawl_pages: int = CRAWL_MAX_PAGES
+    crawl_depth: int = CRAWL_MAX_DEPTH
+    # Continue the URL's last unfinished journaled campaign instead of starting over
+    resume: bool = True
+
 
 # --- HELPER FUNCTIONS ---
 
 
+@contextmanager
+def phase_timer(result: dict, phase: str, **attrs):
+    """
+    Adds the wall time of the block to result["phases"][phase] (seconds)
+    and records it as a "phase.<phase>" telemetry span (yielded).
+    """
+    started = time.monotonic()
+    try:
+        with telemetry.span(f"phase.{phase}", **attrs) as span:
+            yield span
+    finally:
+        phases = result["phases"]
+        phases[phase] = phases.get(phase, 0.0) + time.monotonic() - started
+
+
+def build_agents(model=None):
+    """
+    Builds the pipeline agents, importing the ADK stack on first use.
+    `model` optionally replaces Gemini with a prebuilt BaseLlm for every agent
+    (see benchmarks/stub_model.py). Returns
+    (strategist, content_strategist, copywriter, validator).
+    """
+    from ad_genius_capstone.agents.strategist import get_strategist_agent
+    from ad_genius_capstone.agents.copywriter import get_copywriter_agent
+    from ad_genius_capstone.agents.validator import get_validator_agent
+
+    return (
+        get_strategist_agent(model=model),
+        get_strategist_agent(use_scraper_tool=False, model=model),
+        get_copywriter_agent(model=model),
+        get_validator_agent(model=model),
+    )
+
+
+def get_runner_pool():
+    """
+    Returns the process-wide Runner registry (created on first use).
+    """
+    global _runner_pool
+    if _runner_pool is None:
+        from ad_genius_capstone.core.runner_pool import RunnerPool
+
+        _runner_pool = RunnerPool()
+    return _runner_pool
+
+
+def get_scrape_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide bounded executor for scraping (created on first use).
+    """
+    global _scrape_executor
+    if _scrape_executor is None:
+        _scrape_executor = ThreadPoolExecutor(
+            max_workers=max(1, SCRAPE_WORKERS), thread_name_prefix="adgenius-scrape"
+        )
+    return _scrape_executor
+
+
+async def run_scraper(func, *args):
+    """
+    Runs blocking scraper I/O on the scrape executor. Like asyncio.to_thread,
+    the caller's context (current telemetry span) is carried over.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        get_scrape_executor(), functools.partial(context.run, func, *args)
+    )
+
+
+def get_scheduler() -> Scheduler:
+    """
+    Returns the process-wide call scheduler (created on first use).
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = Scheduler()
+    return _scheduler
+
+
+def configure_scheduler(limits: dict = None) -> Scheduler:
+    """
+    Replaces the scheduler, e.g. with per-model limits from --model-limit.
+    """
+    global _scheduler
+    _scheduler = Scheduler(limits)
+    return _scheduler
+
+
+def agent_model_name(agent_def) -> str:
+    """Model identifier used for rate limiting (Gemini model name or BaseLlm.model)."""
+    model = agent_def.model
+    return model if isinstance(model, str) else getattr(model, "model", type(model).__name__)
+
+
+def estimate_tokens(agent_def, prompt: str) -> int:
+    """Rough reservation: ~4 chars per token for instruction + prompt, plus output."""
+    instruction = agent_def.instruction if isinstance(agent_def.instruction, str) else ""
+    return (len(instruction) + len(prompt)) // 4 + DEFAULT_OUTPUT_TOKENS
+
+
 async def run_agent_execution(agent_def, prompt: str) -> str:
     """
     Executes an ADK agent within an isolated ephemeral session.
+    The Runner is pooled per agent; only the session is created per call.
+    Calls go through the shared scheduler (rate limits, priority, 429/5xx retries).
     """
-    session_id = str(uuid.uuid4())
-    user_id = "local_operator"
-    app_name = "agents"
+    from google.genai import types
+
+    user_msg = types.Content(role="user", parts=[types.Part(text=prompt)])
 
-    session_service = InMemorySessionService()
-    session = await session_service.create_session(
-        app_name=app_name, user_id=user_id, session_id=session_id
+    async def attempt(slot) -> str:
+        full_response = ""
+        with telemetry.span("agent", agent=agent_def.name, prompt_chars=len(prompt)) as span:
+            async with get_runner_pool().session(agent_def) as (runner, session):
+                async for event in runner.run_async(
+                    session_id=session.id, user_id=session.user_id, new_message=user_msg
+                ):
+                    if event.usage_metadata:
+                        slot.add_usage(event.usage_metadata.total_token_count)
+                    telemetry.record_token_usage(span, agent_def.name, event.usage_metadata)
+                    if event.content and event.content.parts:
+                        for part in event.content.parts:
+                            if part.text:
+                                full_response += part.text
+            span.set(response_chars=len(full_response))
+        return full_response
+
+    return await get_scheduler().call(
+        agent_model_name(agent_def), attempt, estimate_tokens(agent_def, prompt)
     )
 
-    runner = Runner(agent=agent_def, app_name=app_name, session_service=session_service)
+
+async def stream_agent_execution(agent_def, prompt: str):
+    """
+    Streaming variant of run_agent_execution: yields text chunks as the model
+    produces them (SSE). Turns the model did not stream are yielded whole.
+    The call is rate limited but not retried, since chunks were already consumed.
+    """
+    from google.genai import types
+    from google.adk.agents.run_config import RunConfig, StreamingMode
+
     user_msg = types.Content(role="user", parts=[types.Part(text=prompt)])
+    run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
+    scheduler = get_scheduler()
+    slot = await scheduler.acquire(agent_model_name(agent_def), estimate_tokens(agent_def, prompt))
+    error = None
+    try:
+        with telemetry.span(
+            "agent", agent=agent_def.name, prompt_chars=len(prompt), streamed=True
+        ) as span:
+            async with get_runner_pool().session(agent_def) as (runner, session):
+                streamed_turn = False
+                async for event in runner.run_async(
+                    session_id=session.id,
+                    user_id=session.user_id,
+                    new_message=user_msg,
+                    run_config=run_config,
+                ):
+                    if not event.partial:
+                        # Partial events repeat usage; count each turn once
+                        telemetry.record_token_usage(span, agent_def.name, event.usage_metadata)
+                        if event.usage_metadata:
+                            slot.add_usage(event.usage_metadata.total_token_count)
+                    if not (event.content and event.content.parts):
+                        continue
+                    text = "".join(part.text for part in event.content.parts if part.text)
+                    if event.partial:
+                        streamed_turn = True
+                        if text:
+                            span.add("response_chars", len(text))
+                            yield text
+                    else:
+                        # The final event of a streamed turn repeats the whole text
+                        if text and not streamed_turn:
+                            span.add("response_chars", len(text))
+                            yield text
+                        streamed_turn = False
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        scheduler.release(slot, error)
+
+
+async def stream_copywriter_draft(copywriter_agent, prompt: str, abort_threshold: int = 0):
+    """
+    Runs the Copywriter in streaming mode and validates every headline and
+    description the moment the incremental parser completes it.
+    Generation is aborted once `abort_threshold` violations pile up (0 never aborts).
+    Returns (draft_text, violations, aborted).
+    """
+    parser = IncrementalAssetParser()
+    chunks = []
+    violations = []
+    seen_headlines = set()
+    aborted = False
 
-    full_response = ""
-    async for event in runner.run_async(
-        session_id=session.id, user_id=user_id, new_message=user_msg
-    ):
-        if event.content and event.content.parts:
-            for part in event.content.parts:
-                if part.text:
-                    full_response += part.text
-    return full_response
+    async with aclosing(stream_agent_execution(copywriter_agent, prompt)) as stream:
+        async for chunk in stream:
+            chunks.append(chunk)
+            for key, index, asset in parser.feed(chunk):
+                if key == "headlines":
+                    violations.extend(check_headline(index, asset))
+                    if asset in seen_headlines:
+                        violations.append(format_violation("H_DUPLICATE", index, asset))
+                    seen_headlines.add(asset)
+                else:
+                    violations.extend(check_description(index, asset))
 
+            if abort_threshold and len(violations) >= abort_threshold:
+                logger.warning(
+                    f"✂️ Aborting Copywriter stream after {len(violations)} violations."
+                )
+                aborted = True
+                break
 
-def extract_json(text: str):
+    return "".join(chunks), violations, aborted
+
+
+def extract_json(text: str, expected_keys=None):
     """
     Robust JSON extractor handling Markdown code blocks and raw text.
+    Tries fenced blocks, then every object in the text, and returns the first
+    object holding `expected_keys` (see core.json_extract).
+    """
+    parsed = find_json_object(text or "", expected_keys)
+    if parsed is None:
+        logger.warning(f"JSON Extraction failed. Raw text sample: {(text or '')[:100]}...")
+    return parsed
+
+
+def new_campaign_id(url: str) -> str:
+    """
+    Readable campaign identifier: domain plus a timestamp.
+    """
+    clean_domain = url.split("//")[-1].split("/")[0].replace("www.", "")
+    return f"{clean_domain}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S-%f')}"
+
+
+def configure_results_sink(path: str = DEFAULT_RESULTS_PATH, fmt: str = None):
+    """
+    Opens the process-wide results sink that every campaign appends to.
+    """
+    global _results_sink
+    close_results_sink()
+    _results_sink = open_results_sink(path, fmt)
+    return _results_sink
+
+
+def get_results_sink():
+    """
+    Returns the process-wide results sink (default CSV path, opened on first use).
+    """
+    if _results_sink is None:
+        return configure_results_sink()
+    return _results_sink
+
+
+def close_results_sink():
+    """
+    Flushes buffered rows and closes the results sink, if one is open.
+    """
+    global _results_sink
+    if _results_sink is not None:
+        _results_sink.close()
+        _results_sink = None
+
+
+def configure_journal(path: str = DEFAULT_JOURNAL_PATH):
+    """
+    Opens the process-wide checkpoint journal (None disables journaling).
+    """
+    global _journal
+    close_journal()
+    if path:
+        _journal = CheckpointJournal(path)
+    return _journal
+
+
+def get_journal():
+    """
+    Returns the checkpoint journal, or None when journaling is not configured.
+    """
+    return _journal
+
+
+def close_journal():
+    """
+    Commits pending journal events and closes the journal, if one is open.
+    """
+    global _journal
+    if _journal is not None:
+        _journal.close()
+        _journal = None
+
+
+def export_results(data: dict, url: str, campaign_id: str, status: str, on_flushed=None):
+    """
+    Appends generated ad assets to the shared results output.
+    `on_flushed` runs once the rows are written to disk.
+    """
+    sink = get_results_sink()
+    rows = sink.write_campaign(url, campaign_id, status, data, on_flushed)
+    logger.info(f"✅ Export queued: {rows} assets for {campaign_id} -> {sink.path}")
+
+
+def get_brief_cache() -> BriefCache:
+    """
+    Returns the process-wide Strategist brief cache (created on first use).
+    """
+    global _brief_cache
+    if _brief_cache is None:
+        _brief_cache = BriefCache(
+            directory=os.getenv("ADGENIUS_BRIEF_CACHE_DIR", BRIEF_CACHE_DIR)
+        )
+    return _brief_cache
+
+
+CLOUD_STRATEGIST = "cloud"  # Brief producer marker for the Vertex AI Strategist
+
+
+def strategist_cache_key(producer, source_text: str):
+    """
+    Content address for a brief: source text + instruction + model of the
+    Strategist that produced it (an agent, or CLOUD_STRATEGIST for the
+    deployed engine). Editing that instruction or switching models
+    invalidates old entries. Returns (key, model_name).
+    """
+    if producer == CLOUD_STRATEGIST:
+        from ad_genius_capstone.agents.cloud_deploy_pkg.agent import root_agent
+
+        instruction = root_agent.instruction
+        model_name = f"{CLOUD_AGENT_ID}:{agent_model_name(root_agent)}"
+    else:
+        instruction = producer.instruction
+        model_name = agent_model_name(producer)
+    key = brief_cache_key(source_text, instruction, model_name)
+    return key, model_name
+
+
+def lookup_cached_brief(brief_cache: BriefCache, producers, source_text: str):
+    """
+    Returns a cached brief for `source_text` from any of the Strategists that
+    could produce it this run, or None on a miss.
+    """
+    for producer in producers:
+        key, _ = strategist_cache_key(producer, source_text)
+        brief = brief_cache.get(key)
+        if brief:
+            logger.info("♻️ Brief cache hit. Skipping Strategist call.")
+            return brief
+    return None
+
+
+def validate_draft_locally(draft) -> str:
+    """
+    Deterministic fast path for Phase 3: calls validate_ad_assets directly and
+    maps its verdict onto the Validator Agent protocol, so the orchestrator can
+    skip the LLM round-trip ("FINAL_SUCCESS" or "FIX_REQUEST: <feedback>").
+    """
+    if not isinstance(draft, dict):
+        return (
+            "FIX_REQUEST: Output was not a valid JSON object. "
+            "Return JSON with 'headlines' and 'descriptions' lists."
+        )
+
+    headlines = [str(h) for h in draft.get("headlines") or []]
+    descriptions = [str(d) for d in draft.get("descriptions") or []]
+    verdict = validate_ad_assets(headlines, descriptions)
+
+    if verdict["status"] == "APPROVED":
+        return "FINAL_SUCCESS"
+    return f"FIX_REQUEST: {verdict['feedback']}"
+
+
+def load_reasoning_engines():
+    """
+    Imports the Vertex AI Reasoning Engine SDK on first cloud use.
+    Returns the module, or None when no compatible SDK is installed.
     """
     try:
-        # 1. Try extracting from Markdown blocks
-        match = re.search(r"``````", text, re.DOTALL)
-        if match:
-            return json.loads(match.group(1).strip())
-
-        # 2. Try finding the first valid JSON object structure
-        match_raw = re.search(r"(\{.*\})", text, re.DOTALL)
-        if match_raw:
-            return json.loads(match_raw.group(1))
-
-        # 3. Attempt direct parse
-        return json.loads(text)
-    except Exception as e:
-        logger.warning(f"JSON Extraction failed: {e}. Raw text sample: {text[:100]}...")
-        return None
+        import vertexai.preview.reasoning_engines as reasoning_engines
+    except ImportError:
+        # Graceful fallback for environments with older SDKs
+        try:
+            from google.cloud.aiplatform import reasoning_engines
+        except ImportError:
+            return None
+    return reasoning_engines
 
 
-def save_results_to_csv(data: dict, url: str):
+def get_remote_strategist(reasoning_engines):
     """
-    Exports generated ad assets to a timestamped CSV file.
+    Returns the shared ReasoningEngine client, initializing the SDK once.
+    A failed initialization is retried on the next call.
     """
-    rows = []
-    for h in data.get("headlines", []):
-        rows.append({"Type": "Headline", "Text": h, "Length": len(h)})
-    for d in data.get("descriptions", []):
-        rows.append({"Type": "Description", "Text": d, "Length": len(d)})
+    global _remote_agent
+    with _remote_agent_lock:
+        if _remote_agent is None:
+            from google.cloud import aiplatform
 
-    # Generate clean filename
-    clean_domain = url.split("//")[-1].split("/")[0].replace("www.", "")
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = f"ads_{clean_domain}_{timestamp}.csv"
+            aiplatform.init(project=PROJECT_ID, location=LOCATION)
+            _remote_agent = reasoning_engines.ReasoningEngine(CLOUD_AGENT_ID)
+        return _remote_agent
 
-    pd.DataFrame(rows).to_csv(filename, index=False)
-    logger.info(f"✅ Export successful: {filename}")
 
+def set_remote_strategist(engine):
+    """
+    Installs a ReasoningEngine-compatible client (anything with query(input=...)),
+    e.g. benchmarks/stub_model.FakeReasoningEngine for offline runs.
+    """
+    global _remote_agent
+    with _remote_agent_lock:
+        _remote_agent = engine
 
-def query_cloud_strategist_engine(text_content: str):
+
+def get_strategist_dispatcher() -> StrategistDispatcher:
+    """
+    Returns the process-wide hedged Strategist dispatcher. Its circuit breaker
+    is shared, so repeated cloud failures in one campaign protect the others.
+    """
+    global _strategist_dispatcher
+    if _strategist_dispatcher is None:
+        _strategist_dispatcher = StrategistDispatcher(query_cloud_strategist_scheduled)
+    return _strategist_dispatcher
+
+
+async def repair_failing_assets(copywriter_agent, brief: dict, draft: dict, feedback: str):
     """
-    Invokes the Vertex AI Agent Engine (Cloud Strategist).
-    Returns raw response text or None if failure occurs.
+    Targeted repair: asks the Copywriter to rewrite only the assets named in the
+    validator feedback, merges them into the draft and re-checks just those
+    assets plus the duplicate rule.
+    Returns (repaired_draft, verdict), or None when the failures cannot be
+    pinned to specific assets (caller falls back to a full rewrite).
     """
-    if reasoning_engines is None:
-        logger.warning("Cloud SDK unavailable. Skipping Cloud Engine.")
+    headline_idx, description_idx = failing_asset_indices(draft, feedback)
+    if not headline_idx and not description_idx:
+        return None
+
+    logger.info(
+        f"🔧 Targeted Repair: {len(headline_idx)} headline(s), "
+        f"{len(description_idx)} description(s)..."
+    )
+    reply = await run_agent_execution(
+        copywriter_agent,
+        build_repair_prompt(brief, draft, headline_idx, description_idx),
+    )
+    repairs = extract_json(reply)
+    if not isinstance(repairs, dict):
         return None
 
+    merged, _, _ = merge_repairs(draft, repairs, headline_idx, description_idx)
+    return merged, revalidate_changed(merged, headline_idx, description_idx)
+
+
+def invoke_cloud_strategist(text_content: str):
+    """
+    One Cloud Strategist query. Returns the response text, or None when no
+    Vertex AI SDK is installed; API errors are raised to the caller.
+    """
+    remote_agent = _remote_agent
+    if remote_agent is None:
+        reasoning_engines = load_reasoning_engines()
+        if reasoning_engines is None:
+            logger.warning("Cloud SDK unavailable. Skipping Cloud Engine.")
+            return None
+
     logger.info(f"☁️ Invoking Cloud Strategist Agent ({CLOUD_AGENT_ID})...")
+    with telemetry.span("cloud_strategist", prompt_chars=len(text_content)) as span:
+        if remote_agent is None:
+            remote_agent = get_remote_strategist(reasoning_engines)
+        response = str(remote_agent.query(input=text_content))
+        span.set(response_chars=len(response))
+        return response
+
+
+async def query_cloud_strategist_scheduled(text_content: str):
+    """
+    Async Cloud Strategist query through the shared scheduler: rate limited
+    and retried on 429/5xx. Returns raw response text or None on failure.
+    """
+    async def attempt(slot):
+        return await asyncio.to_thread(invoke_cloud_strategist, text_content)
+
     try:
-        aiplatform.init(project=PROJECT_ID, location=LOCATION)
-        remote_agent = reasoning_engines.ReasoningEngine(CLOUD_AGENT_ID)
-        response = remote_agent.query(input=text_content)
-        return str(response)
+        return await get_scheduler().call(CLOUD_MODEL_KEY, attempt)
     except Exception as e:
         logger.error(f"🔥 Cloud Engine Error: {e}")
         return None
@@ -144,108 +636,758 @@ def query_cloud_strategist_engine(text_content: str):
 # --- MAIN ORCHESTRATION LOOP ---
 
 
-async def main():
-    logger.info("🚀 AdGenius Orchestrator v1.0 Initialized")
+async def settle_campaign(result: dict, checkpoint=None):
+    """
+    Exports the final draft of an APPROVED / MAX_RETRIES campaign and marks
+    it finished in the journal. The journal entry is written only once the
+    rows are on disk, so a crash before the sink flushes resumes (and
+    re-exports) the campaign; a resumed campaign whose rows were flushed
+    before the crash is not exported twice.
+    """
+    journal = get_journal()
+    campaign_id = result["campaign_id"]
+    finish = None
+    if journal is not None:
+        finish = functools.partial(journal.finish, campaign_id, result["status"], result["error"])
+    export = result["status"] in EXPORTED_STATUSES and isinstance(result["draft"], dict)
+    if export and checkpoint is not None:
+        if await asyncio.to_thread(get_results_sink().has_campaign, campaign_id):
+            logger.info(f"✅ Results for {campaign_id} were exported before the restart.")
+            export = False
+    if export:
+        export_results(result["draft"], result["url"], campaign_id, result["status"], finish)
+    elif finish is not None:
+        finish()
 
-    # Initialize Agents
-    strategist_agent = get_strategist_agent()
-    copywriter_agent = get_copywriter_agent()
-    validator_agent = get_validator_agent()
 
-    url = input("🌐 Target Website URL: ").strip()
+async def run_campaign(
+    url: str,
+    strategist_agent,
+    copywriter_agent,
+    validator_agent,
+    request_pdf_path=None,
+    options: CampaignOptions = None,
+    content_strategist_agent=None,
+    pdf_path: str = None,
+) -> dict:
+    """
+    Runs the full Strategist -> Copywriter -> Validator pipeline for one URL.
+
+    `request_pdf_path` is a callable returning a PDF path when the website blocks
+    the scraper. When it is omitted (batch mode) the campaign is reported as
+    NEEDS_PDF instead of waiting for user input. A `pdf_path` given up front
+    (a PDF uploaded for a NEEDS_PDF job) skips scraping and the cloud entirely.
+    `content_strategist_agent` (get_strategist_agent(use_scraper_tool=False)) lets
+    the local fallback analyze the already-scraped text instead of re-fetching it.
+    With a journal configured (configure_journal) every phase output is
+    checkpointed, and an unfinished campaign for the same URL is resumed
+    after its last completed phase (options.resume).
+    Returns a result dict: url, campaign_id, status, draft, attempts, error,
+    strategist_source (cloud/local/cache/journal), resumed_from (journaled
+    phase or None) and phases (seconds per phase).
+    """
+    options = options or CampaignOptions()
+    journal = get_journal()
+    checkpoint = None
+    if journal is not None and options.resume:
+        # Claims the campaign, so a concurrent run of the same URL starts fresh
+        checkpoint = await asyncio.to_thread(journal.claim, url)
+    campaign_id = checkpoint.campaign_id if checkpoint else new_campaign_id(url)
+    if checkpoint:
+        logger.info(f"⏯️ Resuming {campaign_id} after its last completed phase ({checkpoint.phase}).")
+    elif journal is not None:
+        journal.start(campaign_id, url)
+
+    # Scheduled model calls start at new-campaign priority and are promoted
+    # as the campaign progresses (see set_request_priority in _run_campaign).
+    with telemetry.span("campaign", url=url) as span, request_priority(PRIORITY_NEW):
+        try:
+            result = await _run_campaign(
+                url,
+                campaign_id,
+                checkpoint,
+                strategist_agent,
+                copywriter_agent,
+                validator_agent,
+                request_pdf_path,
+                options,
+                content_strategist_agent,
+                pdf_path,
+            )
+            span.set(
+                campaign_id=campaign_id,
+                status=result["status"],
+                attempts=result["attempts"],
+                strategist_source=result["strategist_source"],
+            )
+            if result["error"]:
+                span.set(error=result["error"][:300])
+            await settle_campaign(result, checkpoint)
+        except BaseException:
+            if journal is not None:
+                journal.release(campaign_id)
+            raise
+    telemetry.count("campaigns_total", status=result["status"])
+    if result["attempts"] > 1:
+        telemetry.count("retries_total", result["attempts"] - 1)
+    return result
+
+
+async def _run_campaign(
+    url: str,
+    campaign_id: str,
+    checkpoint,
+    strategist_agent,
+    copywriter_agent,
+    validator_agent,
+    request_pdf_path,
+    options: CampaignOptions,
+    content_strategist_agent,
+    pdf_path,
+) -> dict:
+    """Pipeline body of run_campaign; `checkpoint` is the claimed journal state, if any."""
+    journal = get_journal()
+
+    def journal_event(kind: str, payload: dict, attempt: int = None):
+        if journal is not None:
+            journal.record(campaign_id, kind, payload, attempt)
+
+    result = {
+        "url": url,
+        "campaign_id": campaign_id,
+        "status": "ERROR",
+        "draft": None,
+        "attempts": 0,
+        "error": "",
+        "strategist_source": None,
+        "resumed_from": checkpoint.phase if checkpoint else None,
+        "phases": {},
+    }
 
     # --- PHASE 1: STRATEGIC ANALYSIS (HYBRID FAILOVER) ---
 
-    USE_CLOUD_ENGINE = True  # Toggle for demonstration
+    use_cloud_engine = True  # Toggle for demonstration
     brief_response_text = ""
+    brief_cache = get_brief_cache() if options.use_brief_cache else None
+    brief_source = None  # Text the brief is derived from (cache key input)
+    brief_json = checkpoint.brief if checkpoint else None
+    brief_producer = None  # Strategist whose instruction/model the brief comes from
+    resumed_brief = brief_json is not None
 
-    # Step 1.1: Local Scraping (Used for both Cloud and Local analysis)
-    logger.info("initiating scraping sequence...")
-    scraped_text = scrape_website(url)
+    if resumed_brief:
+        result["strategist_source"] = "journal"
+    elif pdf_path is None:
+        # Step 1.1: Local Scraping (Used for both Cloud and Local analysis)
+        # Blocking I/O runs on the scrape executor so concurrent campaigns keep progressing.
+        logger.info(f"initiating scraping sequence for {url}...")
+        with phase_timer(result, "scrape"):
+            if options.crawl:
+                scraped_text = await run_scraper(
+                    crawl_website, url, options.crawl_pages, options.crawl_depth
+                )
+            else:
+                scraped_text = await run_scraper(scrape_website, url)
 
-    # Handling Scraper Blocks immediately
-    if "ERROR_NEED_HUMAN_HELP" in scraped_text:
-        logger.warning("Scraping impeded. Automated Cloud analysis may degrade.")
+        journal_event(SCRAPED, {"sha256": text_sha256(scraped_text), "chars": len(scraped_text)})
 
-    # Step 1.2: Cloud Execution
-    if USE_CLOUD_ENGINE:
-        # Truncate for token limits
-        brief_response_text = query_cloud_strategist_engine(
-            f"Analyze this text and generate a brief: {scraped_text[:30000]}"
-        )
+        # Handling Scraper Blocks immediately
+        if "ERROR_NEED_HUMAN_HELP" in scraped_text:
+            logger.warning("Scraping impeded. Automated Cloud analysis may degrade.")
+        else:
+            brief_source = scraped_text
 
-        if not brief_response_text or "Error" in str(brief_response_text):
-            logger.warning(
-                "⚠️ Cloud Engine Unreachable/Failed. Triggering Failover Protocol..."
-            )
-            USE_CLOUD_ENGINE = False
+        # Page already fetched: the content agent skips the tool's second fetch and tool-call turn
+        prefetched = content_strategist_agent is not None and bool(brief_source)
+        local_strategist = content_strategist_agent if prefetched else strategist_agent
 
-    # Step 1.3: Local Fallback Execution
-    if not USE_CLOUD_ENGINE:
-        logger.info("⚙️ Engaging Local Strategist Agent...")
-        brief_response_text = await run_agent_execution(
-            strategist_agent, f"Analyze this URL: {url}"
-        )
+        # Step 1.2: Brief Cache Lookup (unchanged site text -> reuse brief)
+        if brief_cache and brief_source:
+            producers = [CLOUD_STRATEGIST, local_strategist] if use_cloud_engine else [local_strategist]
+            brief_json = lookup_cached_brief(brief_cache, producers, brief_source)
+            if brief_json is not None:
+                result["strategist_source"] = "cache"
+
+        async def run_local_strategist() -> str:
+            if prefetched:
+                logger.info("⚙️ Engaging Local Strategist Agent (pre-fetched content)...")
+                return await run_agent_execution(
+                    content_strategist_agent,
+                    f"WEBSITE_CONTENT_FROM_SCRAPER:\n{scraped_text}",
+                )
+            logger.info("⚙️ Engaging Local Strategist Agent...")
+            return await run_agent_execution(strategist_agent, f"Analyze this URL: {url}")
+
+        # Step 1.3: Hedged Cloud / Local Execution
+        # Local starts on cloud failure, open circuit, or once the hedge delay elapses.
+        if brief_json is None:
+            with phase_timer(result, "strategist"):
+                strategist_source, brief_response_text = await get_strategist_dispatcher().run(
+                    # Truncate for token limits
+                    f"Analyze this text and generate a brief: {scraped_text[:30000]}",
+                    run_local_strategist,
+                    use_cloud=use_cloud_engine,
+                    hedge_delay=options.hedge_delay,
+                )
+            result["strategist_source"] = strategist_source
+            brief_producer = CLOUD_STRATEGIST if strategist_source == "cloud" else local_strategist
+
+            # Step 1.4: PDF Fallback Logic (local path only)
+            if strategist_source == "local" and "CAPTCHA_DETECTED" in brief_response_text:
+                if request_pdf_path is None:
+                    logger.warning(f"CAPTCHA Challenge Active for {url}. PDF required.")
+                    result["status"] = "NEEDS_PDF"
+                    result["error"] = "Website blocks automated access."
+                    return result
+
+                logger.warning("CAPTCHA Challenge Active. Requesting User Intervention.")
+                pdf_path = request_pdf_path()
+    else:
+        # PDF supplied up front (e.g. uploaded to a waiting server job): the site
+        # is known to block the scraper, so analyze the PDF directly
+        result["strategist_source"] = "local"
 
-        # PDF Fallback Logic
-        if "CAPTCHA_DETECTED" in brief_response_text:
-            logger.warning("CAPTCHA Challenge Active. Requesting User Intervention.")
-            pdf_path_raw = input("📄 Please provide path to Homepage PDF: ").strip()
-            # Sanitize path
-            pdf_content = read_pdf_content(pdf_path_raw)
+    # Step 1.5: PDF Analysis
+    if pdf_path is not None and not resumed_brief:
+        pdf_content = await asyncio.to_thread(read_pdf_content, pdf_path)
 
-            if "SYSTEM_ERROR" in pdf_content:
-                logger.error("Critical PDF Failure. Terminating.")
-                return
+        if "SYSTEM_ERROR" in pdf_content:
+            logger.error("Critical PDF Failure. Terminating.")
+            result["error"] = pdf_content
+            return result
 
+        brief_source = pdf_content
+        journal_event(
+            SCRAPED, {"sha256": text_sha256(pdf_content), "chars": len(pdf_content), "source": "pdf"}
+        )
+        brief_producer = content_strategist_agent or strategist_agent
+        if brief_cache:
+            brief_json = lookup_cached_brief(brief_cache, [brief_producer], pdf_content)
+            if brief_json is not None:
+                result["strategist_source"] = "cache"
+        if brief_json is None:
             logger.info("Resuming analysis with PDF payload...")
-            brief_response_text = await run_agent_execution(
-                strategist_agent, pdf_content
-            )
+            with phase_timer(result, "strategist"):
+                brief_response_text = await run_agent_execution(brief_producer, pdf_content)
 
-    # Step 1.4: Brief Extraction
-    brief_json = extract_json(brief_response_text)
-    if not brief_json:
-        logger.error("Failed to extract valid JSON Brief. Aborting.")
-        return
+    # Step 1.6: Brief Extraction
+    if brief_json is None:
+        brief_json = extract_json(brief_response_text, BRIEF_KEYS)
+        if not brief_json:
+            logger.error("Failed to extract valid JSON Brief. Aborting.")
+            result["status"] = "NO_BRIEF"
+            result["error"] = "Failed to extract valid JSON Brief."
+            return result
+
+        if brief_cache and brief_source and brief_producer is not None:
+            key, model_name = strategist_cache_key(brief_producer, brief_source)
+            brief_cache.put(key, brief_json, model_name)
 
     logger.info(
         f"✅ Strategy Brief Generated: USP detected as '{brief_json.get('usp', 'N/A')[:50]}...'"
     )
+    if not resumed_brief:
+        journal_event(BRIEF, {"brief": brief_json, "strategist_source": result["strategist_source"]})
+
+    async def draft_once(prompt: str):
+        """Returns (draft, early_violations); draft is None if the stream was aborted."""
+        if not options.stream_copywriter:
+            draft_text = await run_agent_execution(copywriter_agent, prompt)
+            return extract_json(draft_text, DRAFT_KEYS), []
+
+        draft_text, violations, aborted = await stream_copywriter_draft(
+            copywriter_agent, prompt, options.stream_abort_threshold
+        )
+        if violations:
+            logger.info(f"Early validation flagged {len(violations)} issue(s) while streaming.")
+        return (None if aborted else extract_json(draft_text, DRAFT_KEYS)), violations
+
+    async def generate_draft(prompt: str):
+        with phase_timer(result, "copywriter"):
+            return await draft_once(prompt)
+
+    async def generate_draft_pool(prompt: str, size: int):
+        """
+        Fans the prompt out to `size` concurrent Copywriter calls and assembles
+        a draft from the valid assets as candidates arrive. Outstanding calls
+        are cancelled as soon as the pool is complete.
+        Returns (draft, shortfall); see core.draft_pool.assemble_draft.
+        """
+        drafts = []
+        assembled, shortfall = None, None
+        last_error = None
+        with phase_timer(result, "copywriter", fanout=size) as span:
+            tasks = [asyncio.ensure_future(draft_once(prompt)) for _ in range(size)]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        draft, _ = await next_done
+                    except Exception as e:
+                        logger.warning(f"Copywriter candidate failed: {e}")
+                        last_error = e
+                        continue
+                    if draft:
+                        drafts.append(draft)
+                        assembled, shortfall = assemble_draft(drafts)
+                        if shortfall == 0:
+                            break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            span.set(drafts_used=len(drafts), shortfall=shortfall)
+
+        if not drafts and last_error is not None:
+            raise last_error
+        logger.info(
+            f"🧩 Assembled draft from {len(drafts)}/{size} candidate(s)"
+            + (f", {shortfall} asset(s) still need repair." if shortfall else ".")
+        )
+        return assembled, shortfall
 
     # --- PHASE 2: CREATIVE GENERATION ---
-    logger.info("✍️ Engaging Copywriter Agent...")
-    draft_text = await run_agent_execution(
-        copywriter_agent, f"Here is the brief: {json.dumps(brief_json)}"
-    )
-    current_draft = extract_json(draft_text)
+    # A campaign with a brief has spent tokens already: finish it before starting new ones
+    set_request_priority(PRIORITY_ACTIVE)
+    known_verdict = None  # Set when the current draft was already checked locally
+    first_attempt = 0
+    if checkpoint and checkpoint.draft is not None:
+        # Resumed: pick the loop up at the journaled draft (and its verdict, if any)
+        logger.info(f"✍️ Reusing journaled draft from attempt {checkpoint.attempt}.")
+        current_draft, early_violations = checkpoint.draft, []
+        known_verdict = checkpoint.verdict
+        first_attempt = checkpoint.attempt - 1
+    elif options.copywriter_fanout > 1:
+        logger.info("✍️ Engaging Copywriter Agent...")
+        draft_prompt = f"Here is the brief: {json.dumps(brief_json)}"
+        current_draft, _ = await generate_draft_pool(draft_prompt, options.copywriter_fanout)
+        early_violations = []
+        if current_draft is not None:
+            # Pooled assets were checked while assembling; this also flags padded
+            # slots and names the missing ones of a short pool
+            known_verdict = validate_draft_locally(current_draft)
+    else:
+        logger.info("✍️ Engaging Copywriter Agent...")
+        draft_prompt = f"Here is the brief: {json.dumps(brief_json)}"
+        current_draft, early_violations = await generate_draft(draft_prompt)
 
     # --- PHASE 3: SELF-CORRECTION LOOP (VALIDATION) ---
-    MAX_RETRIES = 3
-    for attempt in range(MAX_RETRIES):
+    # Pool shortfalls are always repaired per asset so the valid pool is kept
+    use_targeted_repair = options.targeted_repair or options.copywriter_fanout > 1
+    for attempt in range(first_attempt, MAX_RETRIES):
         logger.info(f"👮‍♂️ Compliance Check {attempt+1}/{MAX_RETRIES}...")
+        result["attempts"] = attempt + 1
+        if current_draft is not None:
+            journal_event(DRAFT, {"draft": current_draft}, attempt + 1)
 
-        validation_result = await run_agent_execution(
-            validator_agent, f"Validate: {json.dumps(current_draft)}"
-        )
+        if known_verdict is not None:
+            validation_result, known_verdict = known_verdict, None
+        elif current_draft is None and early_violations:
+            # Stream was aborted mid-draft: the early verdict stands in for the validator
+            validation_result = "FIX_REQUEST: Policy Violations Detected:\n" + "\n".join(
+                early_violations
+            )
+        elif options.local_validation:
+            with phase_timer(result, "validation", attempt=attempt + 1, local=True) as span:
+                validation_result = validate_draft_locally(current_draft)
+                span.set(verdict=validation_result.split(":")[0])
+        else:
+            with phase_timer(result, "validation", attempt=attempt + 1) as span:
+                validation_result = await run_agent_execution(
+                    validator_agent, f"Validate: {json.dumps(current_draft)}"
+                )
+                span.set(verdict=validation_result.split(":")[0][:40])
+        if "FINAL_SUCCESS" in validation_result and isinstance(current_draft, dict):
+            # Never approve a short draft, whichever validator judged it
+            missing = check_counts(
+                current_draft.get("headlines") or [], current_draft.get("descriptions") or []
+            )
+            if missing:
+                validation_result = "FIX_REQUEST: Policy Violations Detected:\n" + "\n".join(missing)
+        journal_event(VERDICT, {"verdict": validation_result}, attempt + 1)
 
         if "FINAL_SUCCESS" in validation_result:
             logger.info("🎉 Validation Passed. Assets Approved.")
-            save_results_to_csv(current_draft, url)
+            result["status"] = "APPROVED"
+            result["draft"] = current_draft
             break
 
         elif "FIX_REQUEST" in validation_result:
             logger.warning(f"Compliance Issues Detected. Retrying...")
+            set_request_priority(PRIORITY_RETRY)
+            if use_targeted_repair and isinstance(current_draft, dict):
+                with phase_timer(result, "copywriter"):
+                    repaired = await repair_failing_assets(
+                        copywriter_agent, brief_json, current_draft, validation_result
+                    )
+                if repaired is not None:
+                    current_draft, known_verdict = repaired
+                    continue
+
             fix_prompt = f"Fix these specific errors:\n{validation_result}\n\nOutput the full corrected JSON."
-            draft_text = await run_agent_execution(copywriter_agent, fix_prompt)
-            current_draft = extract_json(draft_text)
+            if current_draft is None and early_violations:
+                # An aborted draft is incomplete, so regenerate from the brief
+                fix_prompt = f"Here is the brief: {json.dumps(brief_json)}\n\n{fix_prompt}"
+            current_draft, early_violations = await generate_draft(fix_prompt)
         else:
             logger.error(f"Unknown Validation Signal: {validation_result}")
+            result["error"] = f"Unknown Validation Signal: {validation_result[:200]}"
             break
     else:
         logger.error("❌ Max retries exceeded. Saving partial draft for review.")
-        if current_draft:
-            save_results_to_csv(current_draft, url + "_FAILED")
+        result["status"] = "MAX_RETRIES"
+        result["draft"] = current_draft
+
+    return result
+
+
+# --- BATCH MODE ---
+
+
+def load_urls(source: str) -> list:
+    """
+    Reads a newline-separated URL list from a file ('-' reads stdin).
+    Blank lines and '#' comments are ignored; duplicates are dropped in order.
+    """
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    stripped = (line.strip() for line in lines)
+    # dict keys keep first-seen order with O(1) membership checks
+    return list(dict.fromkeys(line for line in stripped if line and not line.startswith("#")))
+
+
+async def run_batch(
+    urls: list,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    options: CampaignOptions = None,
+    agents=None,
+) -> list:
+    """
+    Runs each URL's full pipeline as its own asyncio task.
+    A semaphore caps the number of campaigns in flight; a failure in one
+    campaign is captured in its result and never cancels the others.
+    `agents` is a prebuilt build_agents() tuple (built here when omitted).
+    """
+    (
+        strategist_agent,
+        content_strategist_agent,
+        copywriter_agent,
+        validator_agent,
+    ) = agents or build_agents()
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _guarded(url: str) -> dict:
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                result = await run_campaign(
+                    url,
+                    strategist_agent,
+                    copywriter_agent,
+                    validator_agent,
+                    options=options,
+                    content_strategist_agent=content_strategist_agent,
+                )
+            except Exception as e:
+                logger.error(f"🔥 Campaign crashed for {url}: {e}")
+                result = {
+                    "url": url,
+                    "status": "ERROR",
+                    "draft": None,
+                    "attempts": 0,
+                    "error": str(e),
+                    "strategist_source": None,
+                    "resumed_from": None,
+                    "phases": {},
+                }
+            result["duration"] = time.monotonic() - started
+            return result
+
+    logger.info(f"📦 Batch started: {len(urls)} URLs, concurrency={concurrency}")
+    return await asyncio.gather(*(_guarded(url) for url in urls))
+
+
+def print_batch_summary(results: list, elapsed: float):
+    """
+    Prints a per-URL status table followed by aggregate counts.
+    """
+    print("\n=== AdGenius Batch Report ===")
+    for r in results:
+        line = f"{r['status']:<12} {r.get('duration', 0):7.1f}s  {r['url']}"
+        if r.get("error"):
+            line += f"  ({r['error'][:80]})"
+        print(line)
+
+    counts = {}
+    for r in results:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+    summary = ", ".join(f"{status}: {n}" for status, n in sorted(counts.items()))
+    print(f"\nTotal: {len(results)} campaigns in {elapsed:.1f}s | {summary}")
+
+
+def print_incomplete(campaigns: list):
+    """
+    Prints unfinished journaled campaigns with their last completed phase.
+    """
+    print("\n=== Unfinished Campaigns ===")
+    for campaign_id, url, phase, updated_at in campaigns:
+        stamp = datetime.fromtimestamp(updated_at).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"{phase:<10} {stamp}  {campaign_id}  {url}")
+    print(f"\nTotal: {len(campaigns)} unfinished (resume with --replay-incomplete)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AdGenius campaign orchestrator")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Run every URL in FILE (one per line, '-' for stdin) instead of prompting.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help=f"Max campaigns processed at once in batch mode (default: {DEFAULT_BATCH_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--list-incomplete",
+        action="store_true",
+        help="List campaigns the journal recorded as unfinished (crashed or killed) and exit.",
+    )
+    parser.add_argument(
+        "--replay-incomplete",
+        action="store_true",
+        help="Resume every unfinished journaled campaign as a batch.",
+    )
+    add_pipeline_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def add_pipeline_arguments(parser: argparse.ArgumentParser):
+    """
+    Campaign, output, quota and telemetry flags shared by the CLI and the server.
+    """
+    parser.add_argument(
+        "--local-validation",
+        action="store_true",
+        help="Validate drafts in-process with validate_ad_assets instead of the Validator Agent.",
+    )
+    parser.add_argument(
+        "--no-brief-cache",
+        action="store_true",
+        help="Always regenerate the Strategy Brief, ignoring cached briefs.",
+    )
+    parser.add_argument(
+        "--hedge-after",
+        type=float,
+        default=DEFAULT_HEDGE_DELAY,
+        metavar="SECONDS",
+        help=(
+            "Start the Local Strategist if the cloud has not answered after SECONDS "
+            f"(default: {DEFAULT_HEDGE_DELAY:.0f}; negative waits for the cloud first)."
+        ),
+    )
+    parser.add_argument(
+        "--stream-copywriter",
+        action="store_true",
+        help="Stream Copywriter output and validate each asset as soon as it is complete.",
+    )
+    parser.add_argument(
+        "--stream-abort-after",
+        type=int,
+        default=DEFAULT_STREAM_ABORT_THRESHOLD,
+        metavar="N",
+        help=(
+            "Abort a streamed draft once N violations are found "
+            f"(default: {DEFAULT_STREAM_ABORT_THRESHOLD}; 0 never aborts)."
+        ),
+    )
+    parser.add_argument(
+        "--targeted-repair",
+        action="store_true",
+        help="On validation failure, rewrite only the failing assets instead of the whole draft.",
+    )
+    parser.add_argument(
+        "--fanout",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Generate N Copywriter drafts concurrently and assemble one valid draft "
+            "from their assets (default: 1, no fan-out)."
+        ),
+    )
+    parser.add_argument(
+        "--crawl",
+        action="store_true",
+        help=(
+            "Also read same-site pages linked from the URL (pricing, features, about), "
+            "dropping navigation and footer text repeated across them."
+        ),
+    )
+    parser.add_argument(
+        "--crawl-pages",
+        type=int,
+        default=CRAWL_MAX_PAGES,
+        metavar="N",
+        help=f"Max pages read per site in crawl mode, the URL included (default: {CRAWL_MAX_PAGES}).",
+    )
+    parser.add_argument(
+        "--crawl-depth",
+        type=int,
+        default=CRAWL_MAX_DEPTH,
+        metavar="N",
+        help=f"Max clicks away from the URL in crawl mode (default: {CRAWL_MAX_DEPTH}).",
+    )
+    parser.add_argument(
+        "--journal",
+        default=DEFAULT_JOURNAL_PATH,
+        metavar="PATH",
+        help=f"SQLite checkpoint journal of every campaign's phase outputs (default: {DEFAULT_JOURNAL_PATH}).",
+    )
+    parser.add_argument(
+        "--no-journal",
+        action="store_true",
+        help="Do not checkpoint campaigns (nothing can be resumed).",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Start every campaign from scratch even if the journal has an unfinished run of its URL.",
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_RESULTS_PATH,
+        metavar="PATH",
+        help=f"Results file all campaigns append to (default: {DEFAULT_RESULTS_PATH}).",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=sorted(SINK_CLASSES),
+        help="Results format; inferred from the --output extension when omitted.",
+    )
+    parser.add_argument(
+        "--model-limit",
+        action="append",
+        default=[],
+        type=parse_model_limit,
+        metavar="MODEL=RPM[,TPM]",
+        help=(
+            "Per-model quota for the shared scheduler, e.g. gemini-2.5-flash=1000,1000000 "
+            "(repeatable; defaults to the tier-1 Gemini quotas)."
+        ),
+    )
+    parser.add_argument(
+        "--trace-file",
+        metavar="PATH",
+        help="Append per-phase spans (durations, sizes, tokens, retries) to PATH as JSONL.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        help="Write Prometheus-format metrics to PATH (rewritten periodically and at exit).",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="Serve Prometheus metrics on http://HOST:PORT/metrics while running.",
+    )
+    parser.add_argument(
+        "--metrics-host",
+        default=telemetry.DEFAULT_METRICS_HOST,
+        metavar="HOST",
+        help=f"Bind address of the metrics endpoint (default: {telemetry.DEFAULT_METRICS_HOST}; 0.0.0.0 for remote scrapers).",
+    )
+
+
+def campaign_options(args) -> CampaignOptions:
+    """CampaignOptions from the add_pipeline_arguments() flags."""
+    return CampaignOptions(
+        local_validation=args.local_validation,
+        use_brief_cache=not args.no_brief_cache,
+        hedge_delay=args.hedge_after,
+        stream_copywriter=args.stream_copywriter,
+        stream_abort_threshold=args.stream_abort_after,
+        targeted_repair=args.targeted_repair,
+        copywriter_fanout=max(1, args.fanout),
+        crawl=args.crawl,
+        crawl_pages=args.crawl_pages,
+        crawl_depth=args.crawl_depth,
+        resume=not args.no_resume,
+    )
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+    logger.info("🚀 AdGenius Orchestrator v1.0 Initialized")
+    options = campaign_options(args)
+    configure_results_sink(args.output, args.output_format)
+    configure_scheduler(dict(args.model_limit))
+    configure_journal(None if args.no_journal else args.journal)
+    telemetry.configure(args.trace_file, args.metrics_file, args.metrics_port, args.metrics_host)
+    try:
+        await run_cli(args, options)
+    finally:
+        close_results_sink()
+        close_journal()
+        telemetry.shutdown()
+
+
+async def run_cli(args, options: CampaignOptions):
+    """
+    Journal listing, batch/replay or interactive run, depending on the flags.
+    """
+    if args.list_incomplete or args.replay_incomplete:
+        journal = get_journal()
+        if journal is None:
+            logger.error("The journal is disabled (--no-journal). Nothing to list or replay.")
+            return
+        incomplete = await asyncio.to_thread(journal.incomplete)
+        if args.list_incomplete:
+            print_incomplete(incomplete)
+            return
+
+    if args.batch or args.replay_incomplete:
+        if args.replay_incomplete:
+            # Resuming is per URL, so one run per URL picks up its latest checkpoint
+            urls = list(dict.fromkeys(url for _, url, _, _ in incomplete))
+        else:
+            urls = load_urls(args.batch)
+        if not urls:
+            logger.error("No URLs found in batch input. Nothing to do.")
+            return
+        started = time.monotonic()
+        results = await run_batch(urls, args.concurrency, options)
+        logger.info(f"Runner pool: {get_runner_pool().stats()}")
+        logger.info(f"Scheduler: {get_scheduler().stats()}")
+        print_batch_summary(results, time.monotonic() - started)
+        return
+
+    # Initialize Agents
+    (
+        strategist_agent,
+        content_strategist_agent,
+        copywriter_agent,
+        validator_agent,
+    ) = build_agents()
+
+    url = input("🌐 Target Website URL: ").strip()
+
+    await run_campaign(
+        url,
+        strategist_agent,
+        copywriter_agent,
+        validator_agent,
+        request_pdf_path=lambda: input(
+            "📄 Please provide path to Homepage PDF: "
+        ).strip(),
+        options=options,
+        content_strategist_agent=content_strategist_agent,
+    )
 
 
 if __name__ == "__main__":
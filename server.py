@@ -0,0 +1,290 @@
+"""
+AdGenius campaign service.
+
+Long-running HTTP API around the pipeline: the agents, runners and the
+Vertex AI client are built once at startup, and campaigns are submitted as
+jobs to a bounded queue served by a fixed number of workers. A site that
+blocks the scraper parks its job in `waiting_for_pdf` until a PDF of the
+homepage is uploaded.
+
+    POST /jobs              form: url, optional pdf file -> 202 job (429 when the queue is full)
+    GET  /jobs              job summaries, optionally ?state=...
+    GET  /jobs/{id}         job state and run_campaign result
+    POST /jobs/{id}/pdf     form: pdf file; resumes a waiting_for_pdf job
+    GET  /health            queue, scheduler and runner pool stats
+
+Usage:
+    python -m ad_genius_capstone.server --port 8080 --workers 5 --queue-size 100
+"""
+import os
+import uuid
+import shutil
+import asyncio
+import logging
+import argparse
+import tempfile
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+
+from ad_genius_capstone import main as pipeline
+from ad_genius_capstone.core import telemetry
+from ad_genius_capstone.core.job_queue import (
+    JobQueue,
+    QueueFull,
+    InvalidJobState,
+    WAITING_FOR_PDF,
+    DEFAULT_JOB_WORKERS,
+    DEFAULT_QUEUE_SIZE,
+    PDF_WAIT_TTL,
+)
+
+logger = logging.getLogger("AdGenius_Core")
+
+# --- SERVICE CONFIGURATION ---
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+MAX_PDF_BYTES = 20 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+QUEUE_FULL_RETRY_AFTER = 5  # Seconds suggested to clients on a 429
+
+
+def warm_up(agents):
+    """
+    Pays the one-off costs before the first job: ADK runners for every agent
+    and the Vertex AI client. A cloud failure here is not fatal; the
+    dispatcher retries it per campaign and falls back to the local agents.
+    """
+    pool = pipeline.get_runner_pool()
+    for agent in agents:
+        pool.get_runner(agent)
+    reasoning_engines = pipeline.load_reasoning_engines()
+    if reasoning_engines is None:
+        logger.warning("Vertex AI SDK unavailable. Jobs will use the Local Strategist.")
+        return
+    try:
+        pipeline.get_remote_strategist(reasoning_engines)
+    except Exception as e:
+        logger.warning(f"Cloud Strategist not ready ({e}). Will retry per campaign.")
+
+
+async def save_upload(upload: UploadFile, upload_dir: str) -> str:
+    """Streams an uploaded PDF to `upload_dir`; 413 past MAX_PDF_BYTES."""
+    path = os.path.join(upload_dir, f"{uuid.uuid4().hex}.pdf")
+    size = 0
+    try:
+        with open(path, "wb") as f:
+            while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > MAX_PDF_BYTES:
+                    raise HTTPException(413, f"PDF exceeds {MAX_PDF_BYTES // (1024 * 1024)} MB.")
+                f.write(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    if size == 0:
+        os.remove(path)
+        raise HTTPException(400, "Uploaded PDF is empty.")
+    return path
+
+
+def remove_upload(pdf_path: str):
+    if pdf_path:
+        try:
+            os.remove(pdf_path)
+        except FileNotFoundError:
+            pass
+
+
+def delete_upload(job):
+    """Removes a finished job's uploaded PDF; it is not needed any more."""
+    remove_upload(job.pdf_path)
+
+
+def queue_full_response(error) -> JSONResponse:
+    return JSONResponse(
+        {"detail": f"Job queue is full: {error}"},
+        status_code=429,
+        headers={"Retry-After": str(QUEUE_FULL_RETRY_AFTER)},
+    )
+
+
+def create_app(
+    options: pipeline.CampaignOptions = None,
+    workers: int = DEFAULT_JOB_WORKERS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    upload_dir: str = None,
+    agents=None,
+    pdf_wait_ttl: float = PDF_WAIT_TTL,
+) -> FastAPI:
+    """
+    Builds the service. `agents` is a prebuilt build_agents() tuple (built
+    at startup when omitted); uploads go to a temporary directory removed
+    on shutdown unless `upload_dir` is given, and each PDF is deleted once
+    its job is done or failed. Jobs waiting longer than `pdf_wait_ttl`
+    seconds for a PDF fail.
+    """
+    options = options or pipeline.CampaignOptions()
+    runtime = {}
+
+    async def run_job(job):
+        strategist_agent, content_strategist_agent, copywriter_agent, validator_agent = runtime["agents"]
+        return await pipeline.run_campaign(
+            job.url,
+            strategist_agent,
+            copywriter_agent,
+            validator_agent,
+            options=options,
+            content_strategist_agent=content_strategist_agent,
+            pdf_path=job.pdf_path,
+        )
+
+    jobs = JobQueue(
+        run_job,
+        workers=workers,
+        queue_size=queue_size,
+        pdf_wait_ttl=pdf_wait_ttl,
+        on_finished=delete_upload,
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        runtime["agents"] = agents or await asyncio.to_thread(pipeline.build_agents)
+        await asyncio.to_thread(warm_up, runtime["agents"])
+        runtime["upload_dir"] = upload_dir or tempfile.mkdtemp(prefix="adgenius_uploads_")
+        os.makedirs(runtime["upload_dir"], exist_ok=True)
+        await jobs.start()
+        logger.info("🚀 AdGenius service ready")
+        try:
+            yield
+        finally:
+            await jobs.stop()
+            if upload_dir is None:
+                shutil.rmtree(runtime["upload_dir"], ignore_errors=True)
+
+    app = FastAPI(title="AdGenius", lifespan=lifespan)
+    app.state.jobs = jobs
+
+    @app.post("/jobs", status_code=202)
+    async def submit_job(url: str = Form(...), pdf: UploadFile = File(None)):
+        url = url.strip()
+        if not url.startswith(("http://", "https://")):
+            raise HTTPException(422, "url must be an http(s) URL.")
+        # Refuse before streaming a (large) upload that could not be queued
+        if jobs.is_full():
+            return queue_full_response(f"{jobs.queue_size} jobs already queued.")
+        pdf_path = await save_upload(pdf, runtime["upload_dir"]) if pdf is not None else None
+        try:
+            job = jobs.submit(url, pdf_path)
+        except QueueFull as e:
+            remove_upload(pdf_path)
+            return queue_full_response(e)
+        return job.to_dict()
+
+    @app.get("/jobs")
+    async def list_jobs(state: str = None):
+        return [
+            job.to_dict(include_result=False)
+            for job in jobs.jobs.values()
+            if state is None or job.state == state
+        ]
+
+    @app.get("/jobs/{job_id}")
+    async def get_job(job_id: str):
+        job = jobs.get(job_id)
+        if job is None:
+            raise HTTPException(404, f"Unknown job {job_id}.")
+        return job.to_dict()
+
+    @app.post("/jobs/{job_id}/pdf", status_code=202)
+    async def upload_pdf(job_id: str, pdf: UploadFile = File(...)):
+        job = jobs.get(job_id)
+        if job is None:
+            raise HTTPException(404, f"Unknown job {job_id}.")
+        if job.state != WAITING_FOR_PDF:
+            raise HTTPException(409, f"Job {job_id} is {job.state}, not {WAITING_FOR_PDF}.")
+        if jobs.is_full():
+            return queue_full_response(f"{jobs.queue_size} jobs already queued.")
+        pdf_path = await save_upload(pdf, runtime["upload_dir"])
+        previous_pdf = job.pdf_path  # e.g. an unreadable PDF that sent the job back here
+        try:
+            job = jobs.attach_pdf(job_id, pdf_path)
+        except QueueFull as e:
+            remove_upload(pdf_path)
+            return queue_full_response(e)
+        except InvalidJobState as e:
+            remove_upload(pdf_path)
+            raise HTTPException(409, str(e))
+        if previous_pdf != pdf_path:
+            remove_upload(previous_pdf)
+        return job.to_dict()
+
+    @app.get("/health")
+    async def health():
+        return {
+            "jobs": jobs.stats(),
+            "scheduler": pipeline.get_scheduler().stats(),
+            "runner_pool": pipeline.get_runner_pool().stats(),
+        }
+
+    return app
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AdGenius campaign service")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST}).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"HTTP port (default: {DEFAULT_PORT}).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_JOB_WORKERS,
+        help=f"Max campaigns processed at once (default: {DEFAULT_JOB_WORKERS}).",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help=f"Max jobs waiting for a worker before submissions get 429 (default: {DEFAULT_QUEUE_SIZE}).",
+    )
+    parser.add_argument(
+        "--upload-dir",
+        metavar="DIR",
+        help="Store uploaded PDFs in DIR until their job finishes (default: a temporary directory).",
+    )
+    parser.add_argument(
+        "--pdf-wait-ttl",
+        type=float,
+        default=PDF_WAIT_TTL,
+        metavar="SECONDS",
+        help=f"Fail jobs still waiting for a PDF after SECONDS (default: {PDF_WAIT_TTL}).",
+    )
+    pipeline.add_pipeline_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    import uvicorn
+
+    args = parse_args(argv)
+    pipeline.configure_results_sink(args.output, args.output_format)
+    pipeline.configure_scheduler(dict(args.model_limit))
+    pipeline.configure_journal(None if args.no_journal else args.journal)
+    telemetry.configure(args.trace_file, args.metrics_file, args.metrics_port, args.metrics_host)
+    app = create_app(
+        pipeline.campaign_options(args),
+        workers=args.workers,
+        queue_size=args.queue_size,
+        upload_dir=args.upload_dir,
+        pdf_wait_ttl=args.pdf_wait_ttl,
+    )
+    try:
+        uvicorn.run(app, host=args.host, port=args.port)
+    finally:
+        pipeline.close_results_sink()
+        pipeline.close_journal()
+        telemetry.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import os
+import sys
+import types
+import importlib.util
+
+# Modules import each other as `ad_genius_capstone.<package>`. When the
+# checkout is not installed under that name, expose it as that package.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if importlib.util.find_spec("ad_genius_capstone") is None:
+    package = types.ModuleType("ad_genius_capstone")
+    package.__path__ = [ROOT]
+    sys.modules["ad_genius_capstone"] = package
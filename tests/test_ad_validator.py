@@ -0,0 +1,38 @@
+import pytest
+
+from ad_genius_capstone.tools.ad_validator_tool import asset_violations, validate_many
+
+pytest.importorskip("pandas")
+
+HEADLINES = [
+    "Shop Handmade Shoes",
+    "FREE SHIPPING TODAY",
+    "NEW",
+    "Save Big Today!",
+    "Click Here For Deals",
+    "The BEST shoes",
+    "Ünïcode Schuhe Kaufen",
+    "A headline that is far too long to fit",
+    "",
+    "Shop Handmade Shoes",
+]
+DESCRIPTIONS = [
+    "Crafted by hand in Portugal. Free returns on every order.",
+    "WE SHIP WORLDWIDE",
+    "Order now... you will love them",
+    "Buy now and save",
+]
+
+
+@pytest.mark.parametrize("asset_type, assets", [("headline", HEADLINES), ("description", DESCRIPTIONS)])
+def test_validate_many_matches_the_per_asset_rules(asset_type, assets):
+    frame = validate_many(assets, asset_type)
+
+    assert list(frame["violations"]) == [tuple(asset_violations(asset_type, text)) for text in assets]
+    assert list(frame["length"]) == [len(text) for text in assets]
+
+
+def test_duplicate_headlines_are_flagged_per_campaign():
+    frame = validate_many(["Shop Shoes", "Shop Shoes", "Shop Shoes"], groups=["a", "a", "b"])
+
+    assert list(frame["H_DUPLICATE"]) == [False, True, False]
@@ -0,0 +1,98 @@
+from ad_genius_capstone.core.draft_pool import assemble_draft
+from ad_genius_capstone.core.asset_repair import (
+    build_repair_prompt,
+    failing_asset_indices,
+    merge_repairs,
+    revalidate_changed,
+)
+from ad_genius_capstone.tools.ad_validator_tool import (
+    HEADLINE_COUNT,
+    DESCRIPTION_COUNT,
+    validate_ad_assets,
+)
+
+BRIEF = {"usp": "Trail shoes", "audience": "Runners", "tone": "Upbeat", "keywords": ["shoes"]}
+
+
+def short_pool():
+    """Two candidates with only valid, partly overlapping assets: 12 headlines, 3 descriptions."""
+    return [
+        {
+            "headlines": [f"Trail Shoe Deal {i}" for i in range(8)],
+            "descriptions": ["Grip that holds on wet rock.", "Free returns for 60 days."],
+        },
+        {
+            "headlines": [f"Trail Shoe Deal {i}" for i in range(4, 12)],
+            "descriptions": ["Free returns for 60 days.", "Light, cushioned and tough."],
+        },
+    ]
+
+
+def test_short_pool_is_not_approved():
+    draft, shortfall = assemble_draft(short_pool())
+
+    assert len(draft["headlines"]) == 12
+    assert len(draft["descriptions"]) == 3
+    assert shortfall == 4
+
+    verdict = validate_ad_assets(draft["headlines"], draft["descriptions"])
+    assert verdict["status"] == "REJECTED"
+    assert "Headline #13 is missing" in verdict["feedback"]
+    assert "Headline #15 is missing" in verdict["feedback"]
+    assert "Description #4 is missing" in verdict["feedback"]
+
+
+def test_missing_slots_are_repaired_by_appending():
+    draft, _ = assemble_draft(short_pool())
+    feedback = "FIX_REQUEST: " + validate_ad_assets(draft["headlines"], draft["descriptions"])["feedback"]
+
+    headline_idx, description_idx = failing_asset_indices(draft, feedback)
+    assert headline_idx == {12, 13, 14}
+    assert description_idx == {3}
+
+    prompt = build_repair_prompt(BRIEF, draft, headline_idx, description_idx)
+    assert "Headline 13: (missing, write a new one)" in prompt
+    assert "Description 4: (missing, write a new one)" in prompt
+
+    repairs = {
+        "headlines": {"13": "Run Further Today", "14": "Made For Mud", "15": "Grip On Every Trail"},
+        "descriptions": {"4": "Tested on 500 km of mountain trails."},
+    }
+    merged, changed_headlines, changed_descriptions = merge_repairs(
+        draft, repairs, headline_idx, description_idx
+    )
+    assert len(merged["headlines"]) == HEADLINE_COUNT
+    assert len(merged["descriptions"]) == DESCRIPTION_COUNT
+    assert changed_headlines == {12, 13, 14}
+    assert changed_descriptions == {3}
+    assert revalidate_changed(merged, headline_idx, description_idx) == "FINAL_SUCCESS"
+
+
+def test_partial_repair_of_missing_slots_still_fails():
+    draft, _ = assemble_draft(short_pool())
+    feedback = validate_ad_assets(draft["headlines"], draft["descriptions"])["feedback"]
+    headline_idx, description_idx = failing_asset_indices(draft, feedback)
+
+    # The model skipped headline 13 and the description
+    merged, _, _ = merge_repairs(
+        draft, {"headlines": {"14": "Made For Mud", "15": "Grip On Every Trail"}}, headline_idx, description_idx
+    )
+    assert len(merged["headlines"]) == 14
+
+    verdict = revalidate_changed(merged, headline_idx, description_idx)
+    assert verdict.startswith("FIX_REQUEST")
+    assert "Headline #15 is missing" in verdict
+    assert "Description #4 is missing" in verdict
+
+
+def test_full_pool_needs_no_repair():
+    pool = [
+        {
+            "headlines": [f"Trail Shoe Deal {i}" for i in range(HEADLINE_COUNT)],
+            "descriptions": [f"Grip that holds on wet rock, model {i}." for i in range(DESCRIPTION_COUNT)],
+        }
+    ]
+    draft, shortfall = assemble_draft(pool)
+
+    assert shortfall == 0
+    assert validate_ad_assets(draft["headlines"], draft["descriptions"])["status"] == "APPROVED"
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from ad_genius_capstone.core.job_queue import (
+    DONE,
+    FAILED,
+    WAITING_FOR_PDF,
+    InvalidJobState,
+    JobQueue,
+    QueueFull,
+)
+
+
+async def wait_for(job, *states):
+    for _ in range(200):
+        if job.state in states:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job stuck in {job.state}")
+
+
+def test_is_full_before_submit_raises():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def run_job(job):
+            await release.wait()
+            return {"status": "APPROVED"}
+
+        jobs = JobQueue(run_job, workers=1, queue_size=1)
+        await jobs.start()
+        jobs.submit("https://a.example")
+        await asyncio.sleep(0.01)  # The worker takes the first job
+        jobs.submit("https://b.example")
+        assert jobs.is_full()
+        with pytest.raises(QueueFull):
+            jobs.submit("https://c.example")
+        release.set()
+        await asyncio.sleep(0.05)
+        assert not jobs.is_full()
+        await jobs.stop()
+
+    asyncio.run(scenario())
+
+
+def test_finished_jobs_are_handed_to_on_finished():
+    async def scenario():
+        finished = []
+
+        async def run_job(job):
+            return {"status": "APPROVED", "error": ""}
+
+        jobs = JobQueue(run_job, on_finished=finished.append)
+        await jobs.start()
+        job = jobs.submit("https://a.example", pdf_path="/uploads/a.pdf")
+        await wait_for(job, DONE)
+        assert finished == [job]
+        await jobs.stop()
+
+    asyncio.run(scenario())
+
+
+def test_pdf_wait_expires():
+    async def scenario():
+        finished = []
+
+        async def run_job(job):
+            return {"status": "NEEDS_PDF", "error": "Website blocks automated access."}
+
+        jobs = JobQueue(run_job, pdf_wait_ttl=0.05, on_finished=finished.append)
+        await jobs.start()
+        job = jobs.submit("https://blocked.example")
+        await wait_for(job, WAITING_FOR_PDF)
+        await asyncio.sleep(0.1)
+
+        assert jobs.get(job.id).state == FAILED
+        assert "No PDF uploaded" in job.error
+        assert finished == [job]
+        with pytest.raises(InvalidJobState):
+            jobs.attach_pdf(job.id, "/uploads/late.pdf")
+        await jobs.stop()
+
+    asyncio.run(scenario())
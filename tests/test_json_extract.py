@@ -0,0 +1,24 @@
+from ad_genius_capstone.core.json_extract import BRIEF_KEYS, DRAFT_KEYS, find_json_object
+
+
+def test_stray_brace_and_quote_in_prose_do_not_hide_the_object():
+    text = 'Use {brand voice. He is 5\'10" tall.\n{"usp": "x", "audience": "y"}'
+
+    assert find_json_object(text, BRIEF_KEYS) == {"usp": "x", "audience": "y"}
+
+
+def test_fenced_object_wins_over_the_format_example():
+    text = 'Format: {"headlines": "..."}\n```json\n{"headlines": ["A"], "descriptions": ["B"]}\n```'
+
+    assert find_json_object(text, DRAFT_KEYS) == {"headlines": ["A"], "descriptions": ["B"]}
+
+
+def test_expected_keys_are_found_in_a_wrapper_object():
+    text = 'Result: {"brief": {"usp": "Lifetime warranty {on every pair}"}} done.'
+
+    assert find_json_object(text, BRIEF_KEYS) == {"usp": "Lifetime warranty {on every pair}"}
+
+
+def test_first_object_is_returned_when_none_has_the_keys():
+    assert find_json_object('{"tone": "calm"} and {"tone": "bold"}', BRIEF_KEYS) == {"tone": "calm"}
+    assert find_json_object("no json here", BRIEF_KEYS) is None
@@ -0,0 +1,8 @@
+from ad_genius_capstone.main import load_urls
+
+
+def test_load_urls_skips_comments_and_keeps_first_occurrence(tmp_path):
+    path = tmp_path / "urls.txt"
+    path.write_text("# batch\n https://b.example \n\nhttps://a.example\nhttps://b.example\n", encoding="utf-8")
+
+    assert load_urls(str(path)) == ["https://b.example", "https://a.example"]
@@ -0,0 +1,39 @@
+import os
+import time
+
+import pytest
+
+from ad_genius_capstone.core.results_sink import open_results_sink
+
+DRAFT = {"headlines": ["Shop Handmade Shoes"] * 15, "descriptions": ["Free returns on every order."] * 4}
+
+
+def test_csv_rows_of_an_idle_sink_are_flushed_on_the_timer(tmp_path):
+    flushed = []
+    sink = open_results_sink(str(tmp_path / "results.csv"), flush_interval=0.1)
+    sink.write_campaign("https://a.example", "c1", "APPROVED", DRAFT, on_flushed=lambda: flushed.append("c1"))
+    time.sleep(0.4)
+
+    assert flushed == ["c1"]
+    assert sink.has_campaign("c1")
+    sink.close()
+
+
+def test_parquet_keeps_existing_output_and_skips_timer_flushes(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "results.parquet"
+    with open_results_sink(str(path)) as sink:
+        sink.write_campaign("https://a.example", "c1", "APPROVED", DRAFT)
+
+    flushed = []
+    sink = open_results_sink(str(path), flush_rows=100, flush_interval=0.1)
+    sink.write_campaign("https://b.example", "c2", "APPROVED", DRAFT, on_flushed=lambda: flushed.append("c2"))
+    time.sleep(0.4)
+    assert flushed == []
+    sink.close()
+
+    assert flushed == ["c2"]
+    assert sink.path != str(path)
+    assert pq.read_table(path).num_rows == 19
+    assert pq.ParquetFile(sink.path).metadata.num_row_groups == 1
+    assert sorted(os.listdir(tmp_path))[0] == "results.parquet"
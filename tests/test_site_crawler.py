@@ -0,0 +1,47 @@
+import time
+
+from ad_genius_capstone.core.text_fingerprint import remove_repeated_blocks
+from ad_genius_capstone.tools import scraper_tool, site_crawler
+
+FILLER = "Our team ships reliable software for busy people every single day. " * 10
+
+
+def page(body: str, links=()) -> str:
+    anchors = "".join(f'<a href="{link}">{link}</a>' for link in links)
+    return f"<html><body><main><p>{body}</p><p>{FILLER}</p>{anchors}</main></body></html>"
+
+
+def test_crawl_stops_once_max_pages_are_fetched(monkeypatch):
+    landing = page("Welcome to Example.", [f"/feature-{i}" for i in range(30)])
+
+    def fake_fetch_page(url, timeout=15, min_interval=None):
+        if url.endswith("/robots.txt"):
+            return 404, "", False
+        if url == "https://example.com/":
+            return 200, landing, False
+        return 200, page(f"Details of {url}."), False
+
+    monkeypatch.setattr(scraper_tool, "fetch_page", fake_fetch_page)
+    monkeypatch.setattr(site_crawler, "fetch_page", fake_fetch_page)
+
+    started = time.monotonic()
+    text = site_crawler.crawl_website("https://example.com/", max_pages=4, time_budget=5)
+
+    assert time.monotonic() - started < 2
+    assert text.count("--- PAGE:") == 3
+
+
+def test_line_shared_by_two_of_three_pages_is_kept_once():
+    usp = "Cut your cloud bill in half with automatic rightsizing"
+    pages = [
+        ["Home Pricing About", usp, "Welcome to Example"],
+        ["Home Pricing About", usp, "Plans start at 9 dollars a month"],
+        ["Home Pricing About", "Founded in 2019 by two engineers"],
+    ]
+
+    cleaned, dropped = remove_repeated_blocks(pages)
+
+    assert cleaned[0] == [usp, "Welcome to Example"]
+    assert usp not in cleaned[1]
+    assert all("Home Pricing About" not in blocks for blocks in cleaned)
+    assert dropped == 4
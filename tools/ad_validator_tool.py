@@ -1,6 +1,170 @@
 from typing import List, Dict, Any
 import re
 
+# --- RULE ENGINE ---
+# Every rule is declared once and evaluated by two backends: a pure-Python path
+# for single campaigns (check_headline / check_description) and a column-wise
+# pandas path for bulk re-validation of asset libraries (validate_many). The
+# bulk path uses the .str accessors, which run as Arrow compute kernels when
+# pyarrow is installed and as pandas' own string loop otherwise.
+
+HEADLINE_MAX_CHARS = 30
+DESCRIPTION_MAX_CHARS = 90
+# Google Ads RSA asset counts requested from the Copywriter
+HEADLINE_COUNT = 15
+DESCRIPTION_COUNT = 4
+
+# Basic simplified patterns to flag potential policy issues
+# Note: In a real production system, this would be more extensive.
+CLICKBAIT_PATTERNS = [r"click here", r"buy now", r"best\s"]
+
+# Precompiled into one alternation so each asset is scanned once
+CLICKBAIT_REGEX = re.compile("|".join(CLICKBAIT_PATTERNS), re.IGNORECASE)
+REPEATED_PUNCTUATION_REGEX = re.compile(r"[!?.]{2,}")
+
+# (code, check, argument). Checks: "max_len", "upper" (ALL CAPS longer than
+# argument chars), "contains" (literal), "regex" (compiled pattern; the bulk
+# path honours re.IGNORECASE and no other flag).
+HEADLINE_RULES = [
+    ("H_TOO_LONG", "max_len", HEADLINE_MAX_CHARS),
+    # Allow acronyms <= 4 chars
+    ("H_ALL_CAPS", "upper", 4),
+    ("H_EXCLAMATION", "contains", "!"),
+    ("H_CLICKBAIT", "regex", CLICKBAIT_REGEX),
+]
+DESCRIPTION_RULES = [
+    ("D_TOO_LONG", "max_len", DESCRIPTION_MAX_CHARS),
+    ("D_REPEATED_PUNCTUATION", "regex", REPEATED_PUNCTUATION_REGEX),
+    ("D_ALL_CAPS", "upper", 0),
+    ("D_CLICKBAIT", "regex", CLICKBAIT_REGEX),
+]
+RULES = {"headline": HEADLINE_RULES, "description": DESCRIPTION_RULES}
+
+VIOLATION_MESSAGES = {
+    "H_TOO_LONG": "Headline #{n} '{text}' exceeds limit ({length}/30 chars).",
+    "H_ALL_CAPS": "Headline #{n} '{text}' has excessive capitalization (Policy Violation).",
+    "H_EXCLAMATION": "Headline #{n} '{text}' contains '!'. Exclamation marks are not allowed in headlines.",
+    "H_CLICKBAIT": "Headline #{n} '{text}' uses clickbait phrasing (Policy Violation).",
+    "H_DUPLICATE": "Headline #{n} '{text}' duplicates an earlier headline.",
+    "H_MISSING": "Headline #{n} is missing (15 headlines are required).",
+    "D_TOO_LONG": "Description #{n} '{text}' exceeds limit ({length}/90 chars).",
+    "D_REPEATED_PUNCTUATION": "Description #{n} '{text}' contains excessive punctuation.",
+    "D_ALL_CAPS": "Description #{n} uses excessive capitalization. Please use sentence case.",
+    "D_CLICKBAIT": "Description #{n} '{text}' uses clickbait phrasing (Policy Violation).",
+    "D_MISSING": "Description #{n} is missing (4 descriptions are required).",
+}
+
+
+def _rule_fails(check: str, arg, text: str) -> bool:
+    if check == "max_len":
+        return len(text) > arg
+    if check == "upper":
+        return text.isupper() and len(text) > arg
+    if check == "contains":
+        return arg in text
+    return arg.search(text) is not None
+
+
+def _rule_fails_column(check: str, arg, texts, lengths):
+    """Evaluates one rule over a pandas string Series with the .str accessors."""
+    if check == "max_len":
+        return lengths > arg
+    if check == "upper":
+        return texts.str.isupper().to_numpy(dtype=bool) & (lengths > arg)
+    if check == "contains":
+        fails = texts.str.contains(arg, regex=False)
+    else:
+        ignore_case = bool(arg.flags & re.IGNORECASE)
+        fails = texts.str.contains(arg.pattern, case=not ignore_case, regex=True)
+    return fails.to_numpy(dtype=bool)
+
+
+def asset_violations(asset_type: str, text: str) -> List[str]:
+    """
+    Violation codes for one asset ("headline" or "description").
+    """
+    return [code for code, check, arg in RULES[asset_type] if _rule_fails(check, arg, text)]
+
+
+def format_violation(code: str, index: int, text: str) -> str:
+    """Human-readable feedback line for a violation code (0-based index)."""
+    return VIOLATION_MESSAGES[code].format(n=index + 1, text=text, length=len(text))
+
+
+def check_headline(index: int, h: str) -> List[str]:
+    """
+    Per-asset headline rules (0-based index). Used by validate_ad_assets and
+    by the streaming pipeline to judge each headline as soon as it is complete.
+    """
+    return [format_violation(code, index, h) for code in asset_violations("headline", h)]
+
+
+def check_description(index: int, d: str) -> List[str]:
+    """
+    Per-asset description rules (0-based index).
+    """
+    return [format_violation(code, index, d) for code in asset_violations("description", d)]
+
+
+def check_counts(headlines: list, descriptions: list) -> List[str]:
+    """
+    One violation per empty slot below HEADLINE_COUNT / DESCRIPTION_COUNT,
+    numbered like the assets, so repairs can target the missing slots.
+    """
+    errors = [format_violation("H_MISSING", i, "") for i in range(len(headlines), HEADLINE_COUNT)]
+    errors += [
+        format_violation("D_MISSING", i, "") for i in range(len(descriptions), DESCRIPTION_COUNT)
+    ]
+    return errors
+
+
+def validate_many(assets, asset_type: str = "headline", groups=None):
+    """
+    Column-wise bulk validation for large asset libraries.
+
+    `assets` is any sequence or pandas Series of strings; `groups` optionally
+    assigns each asset to a campaign so duplicate headlines are flagged per
+    campaign (H_DUPLICATE). Returns a DataFrame aligned with the input holding
+    `text`, `length`, one boolean column per violation code, `valid` and
+    `violations` (tuple of codes per asset).
+    """
+    import numpy as np
+    import pandas as pd
+
+    texts = pd.Series(assets, dtype="object").fillna("").astype(str)
+
+    # Asset libraries repeat heavily: evaluate each distinct text once, then broadcast
+    positions, uniques = pd.factorize(texts)
+    unique_texts = pd.Series(uniques, dtype="string")
+    unique_lengths = unique_texts.str.len().to_numpy(dtype=np.int64)
+
+    codes = [code for code, _, _ in RULES[asset_type]]
+    unique_flags = np.column_stack(
+        [
+            _rule_fails_column(check, arg, unique_texts, unique_lengths)
+            for _, check, arg in RULES[asset_type]
+        ]
+    )
+    flags = unique_flags[positions]
+
+    if asset_type == "headline" and groups is not None:
+        keyed = pd.DataFrame({"group": list(groups), "position": positions})
+        codes.append("H_DUPLICATE")
+        flags = np.column_stack([flags, keyed.duplicated().to_numpy()])
+
+    frame = pd.DataFrame(flags, columns=codes, index=texts.index)
+    frame.insert(0, "text", texts)
+    frame.insert(1, "length", unique_lengths[positions])
+    frame["valid"] = ~flags.any(axis=1)
+
+    # Encode each row's flags as a bitmask and look up a shared tuple per combination
+    masks = flags.astype(np.int64) @ (1 << np.arange(len(codes), dtype=np.int64))
+    combos = np.empty(1 << len(codes), dtype=object)
+    for mask in np.unique(masks):
+        combos[mask] = tuple(code for bit, code in enumerate(codes) if mask >> bit & 1)
+    frame["violations"] = combos[masks]
+    return frame
+
 
 def validate_ad_assets(headlines: List[str], descriptions: List[str]) -> Dict[str, Any]:
     """
@@ -10,55 +174,21 @@ def validate_ad_assets(headlines: List[str], descriptions: List[str]) -> Dict[st
     - Length constraints (Headlines: 30, Descriptions: 90)
     - Excessive Capitalization (e.g., ALL CAPS)
     - Editorial Standards (No exclamation marks in headlines, no repetitive punctuation)
+    - Clickbait phrasing (e.g., "click here", "buy now")
     - Duplicate assets
+    - Asset counts (15 headlines, 4 descriptions)
     """
     errors = []
 
-    # Basic simplified patterns to flag potential policy issues
-    # Note: In a real production system, this would be more extensive.
-    clickbait_patterns = [r"click here", r"buy now", r"best\s"]
-
     # --- 1. HEADLINES VALIDATION ---
     if headlines:
         for i, h in enumerate(headlines):
-            # Length Check
-            if len(h) > 30:
-                errors.append(
-                    f"Headline #{i+1} '{h}' exceeds limit ({len(h)}/30 chars)."
-                )
-
-            # Capitalization Check (Allow acronyms <= 4 chars)
-            if h.isupper() and len(h) > 4:
-                errors.append(
-                    f"Headline #{i+1} '{h}' has excessive capitalization (Policy Violation)."
-                )
-
-            # Punctuation Check
-            if "!" in h:
-                errors.append(
-                    f"Headline #{i+1} '{h}' contains '!'. Exclamation marks are not allowed in headlines."
-                )
+            errors.extend(check_headline(i, h))
 
     # --- 2. DESCRIPTIONS VALIDATION ---
     if descriptions:
         for i, d in enumerate(descriptions):
-            # Length Check
-            if len(d) > 90:
-                errors.append(
-                    f"Description #{i+1} '{d}' exceeds limit ({len(d)}/90 chars)."
-                )
-
-            # Repetitive Punctuation Check (e.g., !!!, ???)
-            if re.search(r"[!?.]{2,}", d):
-                errors.append(
-                    f"Description #{i+1} '{d}' contains excessive punctuation."
-                )
-
-            # Capitalization Check
-            if d.isupper():
-                errors.append(
-                    f"Description #{i+1} uses excessive capitalization. Please use sentence case."
-                )
+            errors.extend(check_description(i, d))
 
     # --- 3. DUPLICATE CHECK ---
     # Google Ads requires unique assets for variety and performance optimization.
@@ -67,6 +197,10 @@ def validate_ad_assets(headlines: List[str], descriptions: List[str]) -> Dict[st
             "Duplicate headlines detected. Assets must be unique to maximize ad strength."
         )
 
+    # --- 4. COUNT CHECK ---
+    # A short draft must never be approved: the missing slots are reported like assets.
+    errors.extend(check_counts(headlines or [], descriptions or []))
+
     # --- VERDICT GENERATION ---
     if errors:
         return {
@@ -0,0 +1,77 @@
+import os
+import time
+import hashlib
+
+from ad_genius_capstone.core.json_store import LruJsonStore
+
+# --- CACHE CONFIGURATION ---
+DEFAULT_CACHE_DIR = os.path.join(".adgenius_cache", "http")
+DEFAULT_TTL_SECONDS = 6 * 60 * 60  # Serve without revalidation for 6 hours
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB on disk
+
+
+class ResponseCache:
+    """
+    Persistent URL -> response cache with conditional-GET revalidation.
+
+    Entries younger than `ttl` seconds are served straight from disk. Older
+    entries are revalidated with If-None-Match / If-Modified-Since, so an
+    unchanged page costs a 304 instead of a full download. Total size on disk
+    is bounded by `max_bytes` using least-recently-used eviction.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.ttl = ttl
+        self._store = LruJsonStore(directory, max_bytes, name="HTTP cache")
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str):
+        """Returns the cached entry for `url` (or None) and marks it recently used."""
+        entry = self._store.get(self._key(url))
+        return entry if entry and entry.get("url") == url else None
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict:
+        """Builds revalidation headers from a stored entry's validators."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url: str, text: str, response_headers) -> dict:
+        """Stores a 200 response body along with its ETag / Last-Modified."""
+        entry = {
+            "url": url,
+            "fetched_at": time.time(),
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "text": text,
+        }
+        self._write(url, entry)
+        return entry
+
+    def refresh(self, url: str, entry: dict, response_headers) -> dict:
+        """Renews a revalidated (304) entry without touching its body."""
+        entry["fetched_at"] = time.time()
+        entry["etag"] = response_headers.get("ETag") or entry.get("etag")
+        entry["last_modified"] = (
+            response_headers.get("Last-Modified") or entry.get("last_modified")
+        )
+        self._write(url, entry)
+        return entry
+
+    def _write(self, url: str, entry: dict):
+        self._store.put(self._key(url), entry)
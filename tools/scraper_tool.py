@@ -1,6 +1,16 @@
+import os
+import re
+import time
+import threading
 import requests
 import logging
-from pypdf import PdfReader
+from collections import deque
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from concurrent.futures import ProcessPoolExecutor
+from requests.adapters import HTTPAdapter
+from ad_genius_capstone.tools.http_cache import ResponseCache, DEFAULT_CACHE_DIR
+from ad_genius_capstone.core import telemetry
 
 # Configure logging for visibility
 logging.basicConfig(
@@ -8,6 +18,201 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Character budget for text handed to the Strategist (applies to clean text, not markup)
+MAX_CONTENT_CHARS = 15000
+
+# Elements that never carry marketing copy
+BOILERPLATE_TAGS = ["script", "style", "noscript", "template", "svg", "iframe", "nav", "footer"]
+BOILERPLATE_ROLES = ["navigation", "contentinfo", "banner"]
+
+# Emulate a standard browser environment to ensure compatibility with modern web servers
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+}
+
+# --- SHARED HTTP STATE ---
+# One pooled session per process so keep-alive connections are actually reused,
+# plus an on-disk response cache (disable with ADGENIUS_HTTP_CACHE=0).
+HTTP_POOL_SIZE = 32
+_session = None
+_response_cache = None
+_http_state_lock = threading.Lock()
+
+
+# --- PER-DOMAIN POLITENESS ---
+# Concurrent campaigns must not hammer one site: requests to the same host are
+# spaced by SCRAPE_DOMAIN_INTERVAL seconds with at most SCRAPE_DOMAIN_CONCURRENCY
+# in flight. Cache hits never wait.
+SCRAPE_DOMAIN_INTERVAL = float(os.getenv("ADGENIUS_SCRAPE_DOMAIN_INTERVAL", "1.0"))
+SCRAPE_DOMAIN_CONCURRENCY = int(os.getenv("ADGENIUS_SCRAPE_DOMAIN_CONCURRENCY", "2"))
+MAX_RETRY_AFTER = 60.0
+
+
+class DomainPoliteness:
+    """
+    Thread-safe per-host request pacing. A 429/503 answer pushes the host's
+    next request back by its Retry-After (capped at MAX_RETRY_AFTER).
+    """
+
+    def __init__(self, min_interval: float, max_concurrent: int):
+        self.min_interval = min_interval
+        self.max_concurrent = max(1, max_concurrent)
+        self._condition = threading.Condition()
+        self._next_start = {}
+        self._active = {}
+
+    @contextmanager
+    def slot(self, host: str, min_interval: float = None):
+        """Holds one of the host's request slots; `min_interval` overrides the spacing."""
+        interval = self.min_interval if min_interval is None else min_interval
+        with self._condition:
+            while True:
+                wait = self._next_start.get(host, 0.0) - time.monotonic()
+                if wait <= 0 and self._active.get(host, 0) < self.max_concurrent:
+                    break
+                self._condition.wait(timeout=wait if wait > 0 else None)
+            self._active[host] = self._active.get(host, 0) + 1
+            self._next_start[host] = time.monotonic() + interval
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active[host] -= 1
+                if not self._active[host]:
+                    del self._active[host]
+                self._condition.notify_all()
+
+    def back_off(self, host: str, seconds: float):
+        with self._condition:
+            until = time.monotonic() + min(seconds, MAX_RETRY_AFTER)
+            self._next_start[host] = max(self._next_start.get(host, 0.0), until)
+
+
+def retry_after_seconds(value, default: float = 5.0) -> float:
+    """Parses a Retry-After header given in seconds (HTTP dates fall back to `default`)."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+_politeness = DomainPoliteness(SCRAPE_DOMAIN_INTERVAL, SCRAPE_DOMAIN_CONCURRENCY)
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the process-wide pooled requests.Session (created on first use).
+    """
+    global _session
+    with _http_state_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(BROWSER_HEADERS)
+            _session = session
+        return _session
+
+
+def get_response_cache():
+    """
+    Returns the process-wide ResponseCache, or None when caching is disabled.
+    """
+    global _response_cache
+    if os.getenv("ADGENIUS_HTTP_CACHE", "1") == "0":
+        return None
+    with _http_state_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                directory=os.getenv("ADGENIUS_HTTP_CACHE_DIR", DEFAULT_CACHE_DIR)
+            )
+        return _response_cache
+
+
+def fetch_page(url: str, timeout: float = 15, min_interval: float = None):
+    """
+    GETs `url` through the pooled session and the response cache.
+    Fresh cache entries are served without a request; stale ones are
+    revalidated with a conditional GET. `min_interval` overrides the
+    per-domain request spacing. Returns (status_code, text, from_cache).
+    """
+    cache = get_response_cache()
+    entry = cache.get(url) if cache else None
+
+    if entry and cache.is_fresh(entry):
+        logger.info(f"HTTP cache hit: {url}")
+        return 200, entry["text"], True
+
+    request_headers = cache.conditional_headers(entry) if entry else {}
+    host = urlparse(url).hostname or ""
+    with _politeness.slot(host, min_interval):
+        response = get_http_session().get(url, headers=request_headers, timeout=timeout)
+
+    if response.status_code in (429, 503):
+        _politeness.back_off(host, retry_after_seconds(response.headers.get("Retry-After")))
+
+    if response.status_code == 304 and entry:
+        logger.info(f"HTTP cache revalidated (304): {url}")
+        cache.refresh(url, entry, response.headers)
+        return 200, entry["text"], True
+
+    if response.status_code == 200 and cache:
+        cache.put(url, response.text, response.headers)
+
+    return response.status_code, response.text, False
+
+
+def extract_main_content(html: str, max_chars: int = MAX_CONTENT_CHARS) -> str:
+    """
+    Converts raw HTML into compact marketing text for the Strategist.
+    Keeps the page title, meta description, headings and body copy;
+    drops scripts, styles, navigation and footer boilerplate.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+
+    title = soup.title.get_text(" ", strip=True) if soup.title else ""
+    meta = soup.find("meta", attrs={"name": re.compile(r"^description$", re.I)})
+    if meta is None:
+        meta = soup.find("meta", attrs={"property": "og:description"})
+    meta_description = meta.get("content", "").strip() if meta else ""
+
+    for tag in soup(BOILERPLATE_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(attrs={"role": BOILERPLATE_ROLES}):
+        tag.decompose()
+
+    # Prefer the semantic main region when it holds real copy
+    root = soup.find("main") or soup.find("article")
+    if root is None or len(root.get_text(strip=True)) < 200:
+        root = soup.body or soup
+
+    # Mark headings so the Strategist can still see the page hierarchy
+    for level in range(1, 7):
+        for heading in root.find_all(f"h{level}"):
+            heading.string = "#" * level + " " + heading.get_text(" ", strip=True)
+
+    lines = []
+    for line in root.get_text("\n").splitlines():
+        line = " ".join(line.split())
+        if line and (not lines or lines[-1] != line):
+            lines.append(line)
+
+    parts = []
+    if title:
+        parts.append(f"TITLE: {title}")
+    if meta_description:
+        parts.append(f"META DESCRIPTION: {meta_description}")
+    parts.append("\n".join(lines))
+    return "\n".join(parts)[:max_chars]
+
 
 def scrape_website(url: str) -> str:
     """
@@ -15,38 +220,134 @@ def scrape_website(url: str) -> str:
     Implements a 'Soft Fail' mechanism: if blocked (403, CAPTCHA),
     it returns a specific error signal to trigger the PDF Fallback workflow.
     """
-    # Emulate a standard browser environment to ensure compatibility with modern web servers
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Connection": "keep-alive",
-    }
+    with telemetry.span("scrape", url=url) as span:
+        _, text, outcome = scrape_page(url, span)
+        span.set(outcome=outcome, text_chars=len(text))
+        telemetry.count("scrapes_total", outcome=outcome)
+        return text
+
 
+def scrape_page(url: str, span, min_interval: float = None):
+    """
+    Fetches and cleans one landing page with the soft-fail checks
+    (`min_interval` as in fetch_page). Returns (html, text, outcome); html
+    is None and text is the ERROR_NEED_HUMAN_HELP signal unless outcome is "ok".
+    """
     try:
         logger.info(f"Attempting to scrape: {url}")
-        response = requests.get(url, headers=headers, timeout=15)
+        status_code, content, from_cache = fetch_page(url, timeout=15, min_interval=min_interval)
+        span.set(http_status=status_code, from_cache=from_cache, html_chars=len(content))
 
         # Check for explicit blocking signals
-        if response.status_code in [403, 401, 500]:
-            logger.warning(f"Access blocked with status {response.status_code}")
-            return f"ERROR_NEED_HUMAN_HELP: Website blocked (Status {response.status_code}). Please upload PDF."
-
-        content = response.text
+        if status_code in [403, 401, 500]:
+            logger.warning(f"Access blocked with status {status_code}")
+            return None, f"ERROR_NEED_HUMAN_HELP: Website blocked (Status {status_code}). Please upload PDF.", "blocked"
 
         # Heuristic check for CAPTCHA or empty pages (soft block)
         if len(content) < 500:
             logger.warning(
                 "Content length insufficient (<500 chars). Likely CAPTCHA challenge."
             )
-            return "ERROR_NEED_HUMAN_HELP: Content too short. Possibly CAPTCHA. Please upload PDF."
+            return None, "ERROR_NEED_HUMAN_HELP: Content too short. Possibly CAPTCHA. Please upload PDF.", "captcha"
+
+        # Budget applies to clean text so markup doesn't eat the context window
+        text = extract_main_content(content)
+        if not text.strip():
+            logger.warning("No readable text found (likely a script-rendered page).")
+            return None, "ERROR_NEED_HUMAN_HELP: No readable text on page. Please upload PDF.", "empty"
 
-        logger.info(f"Successfully scraped {len(content)} chars")
-        return content[:15000]  # Truncate to preserve context window budget
+        logger.info(f"Successfully scraped {len(content)} chars ({len(text)} chars of text)")
+        return content, text, "ok"
 
     except Exception as e:
         logger.error(f"Scraper exception: {e}")
-        return f"ERROR_NEED_HUMAN_HELP: Request failed ({str(e)}). Please upload PDF."
+        span.fail(e)
+        return None, f"ERROR_NEED_HUMAN_HELP: Request failed ({str(e)}). Please upload PDF.", "error"
+
+
+# --- PDF EXTRACTION ---
+# Pages are read in order and extraction stops once the character budget is full.
+# Large documents can fan page ranges out to a process pool (ADGENIUS_PDF_WORKERS).
+PDF_WORKERS = int(os.getenv("ADGENIUS_PDF_WORKERS", "0"))
+PDF_PAGES_PER_TASK = 8
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> list:
+    """
+    Worker entry point: extracts text for pages [start, stop) of `path`.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def extract_pdf_text(path: str, max_chars: int = MAX_CONTENT_CHARS, workers: int = PDF_WORKERS):
+    """
+    Budget-aware PDF text extraction.
+    The first PDF_PAGES_PER_TASK pages are read in-process. If the budget is
+    still not filled and `workers` > 1, the remaining page ranges are
+    extracted in a process pool, consumed in page order, with at most
+    `workers` ranges in flight so little is read past the budget.
+    Returns (text, pages_read, page_count).
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    page_count = len(reader.pages)
+    chunks = []
+    collected = 0
+    pages_read = 0
+
+    def take(extracted: str) -> bool:
+        """Adds one page's text; returns True once the budget is full."""
+        nonlocal collected, pages_read
+        pages_read += 1
+        if extracted:
+            chunks.append(extracted)
+            collected += len(extracted) + 1
+        return collected >= max_chars
+
+    budget_full = False
+    for i in range(min(PDF_PAGES_PER_TASK, page_count)):
+        budget_full = take(reader.pages[i].extract_text())
+        if budget_full:
+            break
+
+    if not budget_full and pages_read < page_count:
+        if workers > 1:
+            budget_full = _extract_parallel(path, pages_read, page_count, workers, take)
+        else:
+            for i in range(pages_read, page_count):
+                if take(reader.pages[i].extract_text()):
+                    break
+
+    return "\n".join(chunks)[:max_chars], pages_read, page_count
+
+
+def _extract_parallel(path: str, start: int, page_count: int, workers: int, take) -> bool:
+    ranges = [
+        (first, min(first + PDF_PAGES_PER_TASK, page_count))
+        for first in range(start, page_count, PDF_PAGES_PER_TASK)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque(
+            pool.submit(_extract_page_range, path, first, stop)
+            for first, stop in ranges[:workers]
+        )
+        next_range = len(in_flight)
+        while in_flight:
+            pages = in_flight.popleft().result()
+            for extracted in pages:
+                if take(extracted):
+                    for future in in_flight:
+                        future.cancel()
+                    return True
+            if next_range < len(ranges):
+                first, stop = ranges[next_range]
+                in_flight.append(pool.submit(_extract_page_range, path, first, stop))
+                next_range += 1
+    return False
 
 
 def read_pdf_content(file_path: str) -> str:
@@ -58,17 +359,19 @@ def read_pdf_content(file_path: str) -> str:
         # Path Sanitization: Handle terminal drag-and-drop artifacts (quotes)
         clean_path = file_path.strip().strip("'").strip('"')
 
-        reader = PdfReader(clean_path)
-        text = ""
-        for page in reader.pages:
-            extracted = page.extract_text()
-            if extracted:
-                text += extracted + "\n"
+        with telemetry.span("pdf_extract", path=clean_path) as span:
+            text, pages_read, page_count = extract_pdf_text(clean_path)
+            span.set(pages_read=pages_read, page_count=page_count, text_chars=len(text))
 
-        logger.info(f"PDF parsed successfully: {len(text)} chars extracted")
+        logger.info(
+            f"PDF parsed successfully: {len(text)} chars extracted from "
+            f"{pages_read}/{page_count} pages ({page_count - pages_read} skipped, budget reached)"
+            if pages_read < page_count
+            else f"PDF parsed successfully: {len(text)} chars extracted from {page_count} pages"
+        )
 
         # Prefix ensures the Strategist Agent correctly identifies the source
-        return f"PDF_CONTENT_FROM_USER:\n{text[:15000]}"
+        return f"PDF_CONTENT_FROM_USER:\n{text}"
 
     except Exception as e:
         logger.error(f"PDF Read Error: {e}")
@@ -0,0 +1,261 @@
+import os
+import re
+import time
+import heapq
+import logging
+import itertools
+from dataclasses import dataclass
+from urllib.parse import urljoin, urldefrag, urlparse
+from urllib.robotparser import RobotFileParser
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from ad_genius_capstone.tools.scraper_tool import (
+    MAX_CONTENT_CHARS,
+    fetch_page,
+    extract_main_content,
+    scrape_page,
+)
+from ad_genius_capstone.core.text_fingerprint import remove_repeated_blocks
+from ad_genius_capstone.core import telemetry
+
+logger = logging.getLogger(__name__)
+
+# --- CRAWL CONFIGURATION ---
+# Crawl mode reads the pages where the USP is usually spelled out (pricing,
+# features, about) next to the landing page. Pages are fetched concurrently
+# through fetch_page, so the HTTP cache and the per-domain concurrency cap
+# still apply; one crawl is a short burst from a single visitor, so its
+# requests are spaced by CRAWL_DOMAIN_INTERVAL instead of the scraper's interval.
+CRAWL_MAX_PAGES = 8
+CRAWL_MAX_DEPTH = 2
+CRAWL_WORKERS = 8
+# Seconds after which pages still loading are left out
+CRAWL_TIME_BUDGET = float(os.getenv("ADGENIUS_CRAWL_TIME_BUDGET", "20"))
+CRAWL_DOMAIN_INTERVAL = float(os.getenv("ADGENIUS_CRAWL_DOMAIN_INTERVAL", "0.25"))
+ROBOTS_USER_AGENT = "AdGenius"
+MIN_PAGE_CHARS = 200  # Smaller budget shares are not worth a page header
+
+# Link path/anchor hints: likely to state the USP, or never marketing copy
+HIGH_VALUE_HINTS = (
+    "pricing", "price", "plans", "feature", "product", "solution", "service",
+    "about", "why", "benefit", "how-it-works", "compare",
+)
+SKIPPED_HINTS = (
+    "login", "signin", "sign-in", "signup", "sign-up", "register", "account",
+    "cart", "checkout", "privacy", "terms", "legal", "cookie", "careers", "jobs",
+)
+SKIPPED_EXTENSIONS = re.compile(
+    r"\.(pdf|jpe?g|png|gif|svg|webp|ico|css|js|json|xml|txt|zip|gz|mp3|mp4|webm)$", re.I
+)
+
+
+@dataclass
+class CrawledPage:
+    url: str
+    depth: int
+    weight: int  # Share of the character budget relative to ordinary pages
+    text: str
+
+
+def _site_host(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def discover_links(html: str, base_url: str) -> list:
+    """
+    Same-site HTML links of a page as (url, weight); weight 2 marks pages
+    likely to describe the offer (pricing, features, about, ...).
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    site = _site_host(base_url)
+    links = {}
+    for anchor in soup.find_all("a", href=True):
+        url, _ = urldefrag(urljoin(base_url, anchor["href"].strip()))
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or _site_host(url) != site:
+            continue
+        path = parsed.path.lower()
+        if SKIPPED_EXTENSIONS.search(path) or any(hint in path for hint in SKIPPED_HINTS):
+            continue
+        label = f"{path} {anchor.get_text(' ', strip=True).lower()}"
+        weight = 2 if any(hint in label for hint in HIGH_VALUE_HINTS) else 1
+        links[url] = max(weight, links.get(url, 0))
+    return list(links.items())
+
+
+def load_robots(url: str) -> RobotFileParser:
+    """
+    robots.txt rules for the URL's site. A missing file (4xx) allows
+    everything; a server error or timeout disallows the crawl, as the
+    site's wishes are unknown.
+    """
+    parsed = urlparse(url)
+    robots = RobotFileParser(f"{parsed.scheme}://{parsed.netloc}/robots.txt")
+    try:
+        status_code, content, _ = fetch_page(
+            robots.url, timeout=5, min_interval=CRAWL_DOMAIN_INTERVAL
+        )
+    except Exception as e:
+        logger.warning(f"robots.txt unavailable ({e}). Crawling the landing page only.")
+        robots.disallow_all = True
+        return robots
+    if status_code == 200:
+        robots.parse(content.splitlines())
+    elif status_code >= 500:
+        robots.disallow_all = True
+    else:
+        robots.allow_all = True
+    return robots
+
+
+def _fetch_subpage(url: str):
+    """Returns (text, links) of a crawled page, or None if it is not usable."""
+    try:
+        status_code, html, _ = fetch_page(
+            url, timeout=10, min_interval=CRAWL_DOMAIN_INTERVAL
+        )
+        if status_code != 200 or len(html) < 500:
+            return None
+        return extract_main_content(html), discover_links(html, url)
+    except Exception as e:
+        logger.info(f"Crawl skipped {url}: {e}")
+        return None
+
+
+def allocate_budget(sizes: list, weights: list, budget: int) -> list:
+    """
+    Weighted max-min fair split of `budget` characters: pages shorter than
+    their share keep all their text and the rest is divided among the others.
+    """
+    shares = [0] * len(sizes)
+    remaining, remaining_weight = budget, sum(weights)
+    for i in sorted(range(len(sizes)), key=lambda i: sizes[i] / weights[i]):
+        shares[i] = min(sizes[i], remaining * weights[i] // remaining_weight)
+        remaining -= shares[i]
+        remaining_weight -= weights[i]
+    return shares
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cuts at a line boundary where possible."""
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    return text[: cut if cut > 0 else limit]
+
+
+def assemble_site_text(pages: list, max_chars: int = MAX_CONTENT_CHARS) -> tuple:
+    """
+    Merges crawled pages into one Strategist input of at most `max_chars`.
+    Lines repeated across pages (navigation, footers, cookie banners) are
+    dropped, then the budget is shared by page weight; the landing page comes
+    first, unlabeled, as in single-page mode. Returns (text, dropped_lines).
+    """
+    blocks, dropped = remove_repeated_blocks([page.text.split("\n") for page in pages])
+    sections = []
+    for i, (page, page_blocks) in enumerate(zip(pages, blocks)):
+        if not page_blocks:
+            continue
+        header = "" if i == 0 else f"\n\n--- PAGE: {urlparse(page.url).path or '/'} ---\n"
+        sections.append((page, header, "\n".join(page_blocks)))
+
+    shares = allocate_budget(
+        [len(header) + len(body) for _, header, body in sections],
+        [page.weight for page, _, _ in sections],
+        max_chars,
+    )
+    parts = []
+    for (page, header, body), share in zip(sections, shares):
+        if header and share < len(header) + MIN_PAGE_CHARS and share < len(header) + len(body):
+            continue
+        parts.append(header + _truncate(body, share - len(header)))
+    return "".join(parts)[:max_chars], dropped
+
+
+def crawl_website(
+    url: str,
+    max_pages: int = CRAWL_MAX_PAGES,
+    max_depth: int = CRAWL_MAX_DEPTH,
+    max_chars: int = MAX_CONTENT_CHARS,
+    time_budget: float = CRAWL_TIME_BUDGET,
+) -> str:
+    """
+    scrape_website plus up to `max_pages - 1` same-site pages linked from it
+    (at most `max_depth` clicks away), fetched concurrently and allowed by
+    robots.txt. Returns the merged, de-duplicated text, or scrape_website's
+    ERROR_NEED_HUMAN_HELP signal when the landing page itself is blocked.
+    """
+    with telemetry.span("crawl", url=url, max_pages=max_pages) as span:
+        html, text, outcome = scrape_page(url, span, CRAWL_DOMAIN_INTERVAL)
+        telemetry.count("scrapes_total", outcome=outcome)
+        if html is None or max_pages <= 1 or max_depth <= 0:
+            span.set(outcome=outcome, pages=1 if html else 0, text_chars=len(text))
+            return text
+
+        deadline = time.monotonic() + time_budget
+        robots = load_robots(url)
+        pages = [CrawledPage(url, 0, 2, text)]
+        seen = {url}
+        frontier = []  # (-weight, depth, order, url): likely-USP pages first
+        order = itertools.count()
+        disallowed = 0
+
+        def enqueue(links, depth):
+            nonlocal disallowed
+            for link, weight in links:
+                if link in seen:
+                    continue
+                seen.add(link)
+                if not robots.can_fetch(ROBOTS_USER_AGENT, link):
+                    disallowed += 1
+                    continue
+                heapq.heappush(frontier, (-weight, depth, next(order), link))
+
+        enqueue(discover_links(html, url), 1)
+        executor = ThreadPoolExecutor(max_workers=min(CRAWL_WORKERS, max_pages - 1))
+        in_flight = {}
+        started = 1
+        try:
+            while in_flight or (frontier and started < max_pages):
+                while frontier and started < max_pages:
+                    neg_weight, depth, _, link = heapq.heappop(frontier)
+                    in_flight[executor.submit(_fetch_subpage, link)] = (link, depth, -neg_weight)
+                    started += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(f"Crawl time budget spent; {len(in_flight)} page(s) left out.")
+                    break
+                done, _ = wait(in_flight, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    link, depth, weight = in_flight.pop(future)
+                    fetched = future.result()
+                    telemetry.count("crawl_pages_total", outcome="ok" if fetched else "skipped")
+                    if fetched is None:
+                        # Failed fetches free their slot for the next candidate
+                        started -= 1
+                        continue
+                    page_text, links = fetched
+                    pages.append(CrawledPage(link, depth, weight, page_text))
+                    if depth < max_depth:
+                        enqueue(links, depth + 1)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Landing page first, then by value and distance from it
+        pages[1:] = sorted(pages[1:], key=lambda page: (-page.weight, page.depth))
+        merged, dropped = assemble_site_text(pages, max_chars)
+        span.set(
+            outcome=outcome,
+            pages=len(pages),
+            robots_disallowed=disallowed,
+            lines_dropped=dropped,
+            text_chars=len(merged),
+        )
+        logger.info(
+            f"Crawled {len(pages)} page(s) of {_site_host(url)}: {len(merged)} chars "
+            f"after removing {dropped} repeated line(s)"
+        )
+        return merged